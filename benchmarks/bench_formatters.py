@@ -0,0 +1,137 @@
+"""
+Benchmark del MarkdownFormatter frente a la versión anterior basada en md +=
+
+Mide tiempo y pico de memoria (tracemalloc) al generar el reporte de tareas y el
+detalle combinado de issues para 100, 1.000 y 10.000 issues, tanto construyendo el
+texto completo como consumiéndolo por fragmentos (iter_*).
+
+Uso:
+    python benchmarks/bench_formatters.py [--sizes 100,1000,10000] [--repeat 3]
+"""
+import argparse
+import dataclasses
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Iterable, List, Tuple, Union
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.legacy_formatter import LegacyMarkdownFormatter  # noqa: E402
+from src.formatters import MarkdownFormatter  # noqa: E402
+from src.models import Comment, ExtendedIssue, Issue  # noqa: E402
+
+NOW_MS = int(time.time() * 1000)
+STATES = ["Open", "In Progress", "To Verify", "Blocked"]
+
+
+def make_issues(count: int) -> List[Issue]:
+    """Issues sintéticas con celdas de varios comentarios"""
+    return [
+        Issue(
+            id=f"2-{i}",
+            idReadable=f"DEMO-{i}",
+            summary=f"Tarea {i}: revisar el flujo de autenticación y los permisos del módulo",
+            state=STATES[i % len(STATES)],
+            assignee=f"Usuario {i % 12}",
+            estimation="1d 4h",
+            spent="3h 30m",
+            updated=str(NOW_MS - i * 60000),
+            comments=[Comment("Ana", f"comentario {c} sobre la tarea {i} con algo de contexto adicional", NOW_MS - c * 3600000)
+                      for c in range(i % 4)]
+        )
+        for i in range(count)
+    ]
+
+
+def make_extended_issues(count: int) -> List[Tuple[str, ExtendedIssue, None]]:
+    """Resultados de lote sintéticos para format_extended_issues"""
+    results = []
+    for i in range(count):
+        issue = ExtendedIssue(
+            id=f"2-{i}",
+            idReadable=f"DEMO-{i}",
+            summary=f"Tarea {i}",
+            state=STATES[i % len(STATES)],
+            assignee=f"Usuario {i % 12}",
+            updated=str(NOW_MS - i * 60000),
+            created=str(NOW_MS - i * 3600000),
+            comments=[Comment("Ana", f"comentario {c}", NOW_MS - c * 3600000) for c in range(i % 6)],
+            wikifiedDescription=f"<p>Descripción de la tarea {i}</p>" * 5,
+            links=[f"depends on: DEMO-{i + 1} - Siguiente"],
+            subtasks=[f"DEMO-{i}-{s}" for s in range(i % 3)],
+            tags=["backend", "bug"],
+            project_name="Demo",
+            reporter_name="Ana",
+            updater_name="Luis",
+            loaded_sections=ExtendedIssue.ALL_SECTIONS
+        )
+        results.append((issue.idReadable, issue, None))
+    return results
+
+
+def with_rendered_comments(issue: Issue) -> Issue:
+    """Copia de la issue con los comentarios ya formateados, como los guardaban los modelos anteriores"""
+    if not issue.comments:
+        return issue
+    return dataclasses.replace(issue, comments=[MarkdownFormatter.format_comment(comment) for comment in issue.comments])
+
+
+def consume(chunks: Iterable[str]) -> int:
+    """Consume un reporte por fragmentos sin unirlos (como al escribirlos en un stream)"""
+    return sum(len(chunk) for chunk in chunks)
+
+
+def measure(render: Callable[[], Union[str, int]], repeat: int) -> Tuple[float, int, int]:
+    """
+    Ejecuta render varias veces y devuelve el mejor tiempo (s), el pico de memoria (bytes)
+    y la longitud de la salida (render puede devolver el texto o directamente su longitud)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = render()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    output = render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, output if isinstance(output, int) else len(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de MarkdownFormatter")
+    parser.add_argument("--sizes", default="100,1000,10000", help="Número de issues por reporte, separados por comas")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por medida (se toma el mejor tiempo)")
+    args = parser.parse_args()
+
+    print(f"{'reporte':<16}{'issues':>8}{'formatter':>10}{'tiempo (ms)':>14}{'pico (KiB)':>13}{'salida (KiB)':>15}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        issues = make_issues(size)
+        results = make_extended_issues(size)
+        # La versión anterior recibía los comentarios ya formateados por los modelos
+        legacy_issues = [with_rendered_comments(issue) for issue in issues]
+        legacy_results = [(issue_id, with_rendered_comments(issue), error) for issue_id, issue, error in results]
+        cases = [
+            ("tareas", LegacyMarkdownFormatter.format_tasks_report, MarkdownFormatter.format_tasks_report,
+             MarkdownFormatter.iter_tasks_report, issues, legacy_issues),
+            ("issues (lote)", LegacyMarkdownFormatter.format_extended_issues, MarkdownFormatter.format_extended_issues,
+             MarkdownFormatter.iter_extended_issues, results, legacy_results),
+        ]
+        for name, legacy, current, chunks, data, legacy_data in cases:
+            if legacy(legacy_data) != current(data):
+                raise SystemExit(f"La salida de '{name}' difiere entre ambas versiones")
+            renders = (
+                ("anterior", legacy, legacy_data),
+                ("actual", current, data),
+                ("stream", lambda data: consume(chunks(data)), data),
+            )
+            for label, render, render_data in renders:
+                seconds, peak, length = measure(lambda: render(render_data), args.repeat)
+                print(f"{name:<16}{size:>8}{label:>10}{seconds * 1000:>14.1f}{peak / 1024:>13.0f}{length / 1024:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Micro-benchmark de los modelos Issue y ExtendedIssue frente a la versión anterior
+
+Mide el throughput de from_youtrack_data (issues/s) y la memoria retenida por issue
+(tracemalloc) al transformar lotes de payloads sintéticos de YouTrack.
+
+Uso:
+    python benchmarks/bench_models.py [--count 20000] [--repeat 3]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import legacy_models  # noqa: E402
+from src import models  # noqa: E402
+
+NOW_MS = int(time.time() * 1000)
+STATES = ["Open", "In Progress", "To Verify", "Fixed"]
+
+
+def make_payload(i: int) -> Dict[str, Any]:
+    """Payload sintético de una issue tal como lo devuelve la API de YouTrack"""
+    return {
+        "id": f"2-{i}",
+        "idReadable": f"DEMO-{i}",
+        "summary": f"Tarea {i}: revisar el flujo de autenticación",
+        "updated": NOW_MS - i * 60000,
+        "created": NOW_MS - i * 3600000,
+        # Los textos repetidos se crean en cada payload, como al decodificar JSON
+        "customFields": [
+            {"name": "Priority", "value": {"name": "".join(["Maj", "or"])}},
+            {"name": "Type", "value": {"name": "".join(["B", "ug"])}},
+            {"name": "State", "value": {"name": "".join(STATES[i % len(STATES)])}},
+            {"name": "Subsystem", "value": None},
+            {"name": "Assignee", "value": {"name": f"Usuario {i % 12}"}},
+            {"name": "Estimation", "value": {"presentation": "".join(["1d ", "4h"])}},
+            {"name": "Spent time", "value": {"presentation": "".join(["3h ", "30m"])}},
+            {"name": "Story points", "value": i % 8},
+        ],
+        "comments": [
+            {"author": {"name": "Ana"}, "text": f"comentario {c} de la tarea {i}", "created": NOW_MS - c * 1000}
+            for c in range(i % 4)
+        ],
+        "wikifiedDescription": f"<p>Descripción {i}</p>",
+        "links": [{"direction": "OUTWARD", "linkType": {"name": "depends on"},
+                   "issues": [{"idReadable": f"DEMO-{i + 1}", "summary": "Siguiente"}]}],
+        "parent": {"issues": []},
+        "subtasks": {"issues": []},
+        "project": {"id": "0-1", "name": "".join(["De", "mo"])},
+        "reporter": {"name": "".join(["A", "na"])},
+        "updater": {"name": "".join(["Lu", "is"])},
+        "tags": [{"name": "".join(["back", "end"])}],
+        "attachments": [],
+    }
+
+
+def throughput(parse: Callable[[Dict[str, Any]], Any], payloads: List[Dict[str, Any]], repeat: int) -> float:
+    """Issues transformadas por segundo (mejor de repeat ejecuciones)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            parse(payload)
+        best = min(best, time.perf_counter() - start)
+    return len(payloads) / best
+
+
+def retained_bytes(parse: Callable[[Dict[str, Any]], Any], count: int) -> float:
+    """
+    Bytes retenidos por issue tras transformar count payloads
+
+    Cada payload se descarta tras transformarlo (como ocurre con las páginas de la API),
+    de modo que se contabilizan también los textos que la issue mantiene vivos.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    issues = [parse(make_payload(i)) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del issues
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark de los modelos de issues")
+    parser.add_argument("--count", type=int, default=20000, help="Número de payloads a transformar")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por medida (se toma la mejor)")
+    args = parser.parse_args()
+
+    payloads = [make_payload(i) for i in range(args.count)]
+    # Sin custom fields adicionales, para comparar el mismo trabajo que la versión anterior
+    models.Issue.configure_extra_fields([])
+
+    cases: List[Tuple[str, str, Callable[[Dict[str, Any]], Any]]] = [
+        ("Issue", "anterior", lambda data: legacy_models.Issue.from_youtrack_data(data, 1)),
+        ("Issue", "actual", lambda data: models.Issue.from_youtrack_data(data, 1)),
+        ("ExtendedIssue", "anterior", lambda data: legacy_models.ExtendedIssue.from_youtrack_data(data)),
+        ("ExtendedIssue", "actual", lambda data: models.ExtendedIssue.from_youtrack_data(data)),
+    ]
+
+    print(f"{'modelo':<15}{'versión':>10}{'issues/s':>12}{'bytes/issue':>14}")
+    for model, label, parse in cases:
+        rate = throughput(parse, payloads, args.repeat)
+        per_issue = retained_bytes(parse, args.count)
+        print(f"{model:<15}{label:>10}{rate:>12,.0f}{per_issue:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Benchmark del arranque del servidor MCP: tiempo de importación y tiempo hasta la primera respuesta
+
+Mide en subprocesos nuevos (sin cachés del intérprete calientes entre medidas):
+- El tiempo de importación de src.server frente al del SDK de MCP solo (el suelo
+  que no depende de este proyecto), el de `python -m src.main --help` y los módulos
+  más costosos según `python -X importtime`.
+- El tiempo hasta la primera respuesta contra un YouTrack simulado local: arranque e
+  inicialización MCP por stdio, una pausa que representa lo que tarda el cliente en
+  pedir la primera herramienta, y la primera llamada a getTasksInformation (sin
+  comentarios). Se mide sin y con --prewarm.
+
+Uso:
+    python benchmarks/bench_startup.py [--runs 5] [--latency-ms 50] [--think-ms 200]
+    python benchmarks/bench_startup.py --output arranque.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mcp import ClientSession, StdioServerParameters  # noqa: E402
+from mcp.client.stdio import stdio_client  # noqa: E402
+
+from benchmarks.fake_youtrack import FakeYouTrackServer, add_config_arguments, config_from_args  # noqa: E402
+
+IMPORT_SNIPPET = "import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+
+
+def median_ms(values: List[float]) -> float:
+    """Mediana en ms de unas medidas en segundos"""
+    return round(statistics.median(values) * 1000, 1)
+
+
+def import_time(module: str, runs: int) -> float:
+    """Mediana en ms del tiempo de importar un módulo en un intérprete nuevo"""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET.format(module=module)],
+                                cwd=ROOT, capture_output=True, text=True, check=True)
+        samples.append(float(output.stdout.strip()))
+    return median_ms(samples)
+
+
+def help_time(runs: int) -> float:
+    """Mediana en ms de `python -m src.main --help` (arranque del intérprete incluido)"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "src.main", "--help"], cwd=ROOT, capture_output=True, check=True)
+        samples.append(time.perf_counter() - start)
+    return median_ms(samples)
+
+
+def heaviest_imports(module: str, top: int) -> List[Tuple[str, float]]:
+    """Paquetes de primer nivel y módulos del proyecto con más tiempo acumulado de importación (ms)"""
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    entries: Dict[str, float] = {}
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if "." not in name or name.startswith("src."):
+            entries[name] = max(entries.get(name, 0.0), int(cumulative) / 1000)
+    return sorted(entries.items(), key=lambda item: -item[1])[:top]
+
+
+async def first_response(server: FakeYouTrackServer, server_args: List[str], think_ms: float) -> Dict[str, float]:
+    """Arranca el servidor MCP por stdio y mide la inicialización y la primera llamada"""
+    env = dict(os.environ, YOUTRACK_BASE_URL=server.base_url, YOUTRACK_API_TOKEN="benchmark")
+    params = StdioServerParameters(command=sys.executable, args=["-m", "src.main", *server_args], env=env, cwd=ROOT)
+    board = server.data.boards[0]["name"]
+
+    start = time.perf_counter()
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized = time.perf_counter()
+                await asyncio.sleep(think_ms / 1000)
+                call_start = time.perf_counter()
+                result = await session.call_tool("getTasksInformation", {"name": board, "num_comments": 0})
+                answered = time.perf_counter()
+
+    text = "".join(getattr(block, "text", "") for block in result.content)
+    if result.isError or text.startswith("❌"):
+        raise RuntimeError(f"La primera llamada ha fallado: {text[:200]}")
+    return {
+        "initialize": initialized - start,
+        "first_call": answered - call_start,
+        "time_to_first_response": answered - start - think_ms / 1000,
+    }
+
+
+async def run_first_responses(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """Mide la primera respuesta sin y con --prewarm (medianas en ms)"""
+    server = FakeYouTrackServer(config_from_args(args)).start()
+    results = {}
+    try:
+        for label, extra in (("sin --prewarm", []), ("con --prewarm", ["--prewarm"])):
+            samples = [await first_response(server, [*shlex.split(args.server_args), *extra], args.think_ms)
+                       for _ in range(args.runs)]
+            results[label] = {key: median_ms([sample[key] for sample in samples]) for key in samples[0]}
+    finally:
+        server.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de arranque del servidor MCP de YouTrack")
+    parser.add_argument("--runs", type=int, default=5, help="Arranques medidos por configuración (se toma la mediana)")
+    parser.add_argument("--think-ms", type=float, default=200.0,
+                        help="Pausa entre la inicialización y la primera llamada, como la de un cliente MCP real (ms)")
+    parser.add_argument("--top", type=int, default=10, help="Módulos a mostrar en el desglose de importación")
+    parser.add_argument("--server-args", default="", help="Argumentos adicionales para el servidor MCP")
+    parser.add_argument("--output", help="Fichero JSON donde guardar los resultados")
+    add_config_arguments(parser)
+    parser.set_defaults(latency_ms=50.0, issues_per_sprint=100)
+    args = parser.parse_args()
+
+    imports = {
+        "mcp.server.fastmcp": import_time("mcp.server.fastmcp", args.runs),
+        "src.server": import_time("src.server", args.runs),
+        "src.main --help": help_time(args.runs),
+    }
+    print(f"{'importación':<24}{'mediana (ms)':>14}")
+    for name, value in imports.items():
+        print(f"{name:<24}{value:>14.1f}")
+
+    heaviest = heaviest_imports("src.server", args.top)
+    print(f"\n{'módulo (acumulado)':<40}{'ms':>10}")
+    for name, value in heaviest:
+        print(f"{name:<40}{value:>10.1f}")
+
+    first = asyncio.run(run_first_responses(args))
+    print(f"\n{'primera respuesta':<18}{'inicialización (ms)':>22}{'primera llamada (ms)':>22}{'total (ms)':>14}")
+    for label, result in first.items():
+        print(f"{label:<18}{result['initialize']:>22.1f}{result['first_call']:>22.1f}{result['time_to_first_response']:>14.1f}")
+    print(f"(total = arranque + inicialización + primera llamada, sin la pausa de {args.think_ms:.0f} ms; "
+          f"latencia de YouTrack simulada: {args.latency_ms:.0f} ms)")
+
+    if args.output:
+        report: Dict[str, Any] = {"imports_ms": imports, "heaviest_imports_ms": dict(heaviest), "first_response_ms": first}
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+"""
+Servidor HTTP local que imita la API REST de YouTrack para los benchmarks
+
+Sirve tableros, sprints e issues generados de forma determinista con tamaños
+configurables, respeta la proyección de "fields", la paginación $top/$skip y las
+consultas que usa el cliente (tablero/sprint, estados, "updated" e IDs), y permite
+inyectar latencia y errores. Cuenta las peticiones y los bytes enviados.
+
+Uso independiente:
+    python benchmarks/fake_youtrack.py --port 8765 --issues-per-sprint 500
+    YOUTRACK_BASE_URL=http://127.0.0.1:8765/api YOUTRACK_API_TOKEN=x python -m src.main
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+STATES = ["Open", "In Progress", "To Verify", "Fixed", "Verified"]
+PEOPLE = ["Ana García", "Luis Pérez", "Marta Ruiz", "Jorge Sanz", "Elena Gil", "Pablo Díaz"]
+WORDS = ("api login sprint error usuario pantalla informe datos cliente servidor "
+         "permisos rendimiento despliegue consulta tablero exportar").split()
+
+
+@dataclass
+class FakeYouTrackConfig:
+    """Tamaño de los datos generados y comportamiento del servidor"""
+    boards: int = 2
+    issues_per_sprint: int = 200
+    comments_per_issue: int = 3
+    description_length: int = 500
+    finished_ratio: float = 0.4  # Proporción de issues en estados terminados
+    latency_ms: float = 0.0  # Latencia añadida a cada respuesta
+    error_rate: float = 0.0  # Probabilidad de responder 500
+    seed: int = 0
+
+
+def parse_fields(spec: str) -> Dict[str, Any]:
+    """
+    Convierte una proyección de YouTrack ("a,b(c,d(e))") en un árbol de campos
+
+    Returns:
+        Dict[str, Any]: Campo -> subárbol (None si no tiene subcampos)
+    """
+    tree: Dict[str, Any] = {}
+    stack = [tree]
+    name = ""
+    last = None
+    for char in spec:
+        if char == "(":
+            last = stack[-1][name] = {}
+            stack.append(last)
+            name = ""
+        elif char in ",)":
+            if name:
+                stack[-1][name] = None
+            name = ""
+            if char == ")":
+                stack.pop()
+        else:
+            name += char
+    if name:
+        stack[-1][name] = None
+    return tree
+
+
+def project(value: Any, tree: Optional[Dict[str, Any]]) -> Any:
+    """Aplica un árbol de campos a un valor JSON (sin subcampos se devuelve completo)"""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if isinstance(value, dict):
+        projected = {"$type": value["$type"]} if "$type" in value else {}
+        for key, subtree in tree.items():
+            if key in value:
+                projected[key] = project(value[key], subtree)
+        return projected
+    return value
+
+
+class FakeYouTrackData:
+    """Datos generados: tableros con un sprint actual cada uno y sus issues"""
+
+    def __init__(self, config: FakeYouTrackConfig):
+        self.config = config
+        rng = random.Random(config.seed)
+        now = int(time.time() * 1000)
+        self.boards: List[Dict[str, Any]] = []
+        self.sprint_issues: Dict[str, List[Dict[str, Any]]] = {}
+        self.issues: Dict[str, Dict[str, Any]] = {}
+
+        number = 0
+        for b in range(config.boards):
+            board = {
+                "$type": "Agile",
+                "id": f"120-{b}",
+                "name": f"Board {b}",
+                "currentSprint": {"$type": "Sprint", "id": f"121-{b}", "name": f"Sprint {b + 1}"},
+            }
+            self.boards.append(board)
+            issues = []
+            for _ in range(config.issues_per_sprint):
+                number += 1
+                issue = self._make_issue(rng, number, now, board)
+                issues.append(issue)
+                self.issues[issue["id"]] = issue
+                self.issues[issue["idReadable"]] = issue
+            self.sprint_issues[board["currentSprint"]["id"]] = issues
+
+    def _make_issue(self, rng: random.Random, number: int, now: int, board: Dict[str, Any]) -> Dict[str, Any]:
+        """Genera una issue con custom fields, comentarios, descripción y relaciones"""
+        finished = rng.random() < self.config.finished_ratio
+        state = rng.choice(STATES[3:] if finished else STATES[:3])
+        description = " ".join(rng.choice(WORDS) for _ in range(self.config.description_length // 7 + 1))
+        created = now - rng.randint(1, 60) * 86400000
+        comments = [
+            {
+                "$type": "IssueComment",
+                "author": {"$type": "User", "name": rng.choice(PEOPLE)},
+                "text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 40))),
+                "created": created + c * 3600000,
+            }
+            for c in range(self.config.comments_per_issue)
+        ]
+        return {
+            "$type": "Issue",
+            "id": f"2-{number}",
+            "idReadable": f"DEMO-{number}",
+            "summary": f"Tarea {number}: {' '.join(rng.choice(WORDS) for _ in range(6))}",
+            "created": created,
+            "updated": now - rng.randint(1, 7 * 24 * 60) * 60000,
+            "customFields": [
+                {"name": "Priority", "value": {"name": rng.choice(["Critical", "Major", "Normal", "Minor"])}},
+                {"name": "Type", "value": {"name": rng.choice(["Bug", "Task", "Feature"])}},
+                {"name": "State", "value": {"name": state}},
+                {"name": "Assignee", "value": {"name": rng.choice(PEOPLE)} if rng.random() < 0.9 else None},
+                {"name": "Estimation", "value": {"presentation": f"{rng.randint(1, 5)}d"}},
+                {"name": "Spent time", "value": {"presentation": f"{rng.randint(1, 30)}h"} if rng.random() < 0.7 else None},
+                {"name": "Subsystem", "value": None},
+            ],
+            "comments": comments,
+            "wikifiedDescription": f"<p>{description[:self.config.description_length]}</p>",
+            "attachments": [{"name": f"captura-{number}.png"}] if number % 5 == 0 else [],
+            "links": [{
+                "direction": "OUTWARD",
+                "linkType": {"name": "Depend", "sourceToTarget": "depends on", "targetToSource": "is required for"},
+                "issues": [{"id": f"2-{number + 1}", "idReadable": f"DEMO-{number + 1}", "summary": "Siguiente"}],
+            }],
+            # Cada 5 issues: la primera es padre de las 4 siguientes
+            "parent": {"issues": [_issue_ref(number - (number - 1) % 5)] if (number - 1) % 5 else []},
+            "subtasks": {"issues": [_issue_ref(number + n) for n in range(1, 5)] if (number - 1) % 5 == 0 else []},
+            "project": {"id": "0-1", "name": "Demo"},
+            "reporter": {"name": rng.choice(PEOPLE), "email": "reporter@example.com"},
+            "updater": {"name": rng.choice(PEOPLE), "email": "updater@example.com"},
+            "tags": [{"name": rng.choice(["backend", "frontend", "infra"])}],
+        }
+
+    def query(self, query: str) -> List[Dict[str, Any]]:
+        """Resuelve el subconjunto del lenguaje de consultas que usa el cliente"""
+        issues: List[Dict[str, Any]] = [issue for issues in self.sprint_issues.values() for issue in issues]
+
+        board_match = re.search(r"Board (\{[^}]*\}|\S+): (\{[^}]*\}|\S+)", query)
+        if board_match:
+            board_name = board_match.group(1).strip("{}")
+            sprint_name = board_match.group(2).strip("{}")
+            issues = [
+                issue
+                for board in self.boards
+                if board["name"] == board_name and board["currentSprint"]["name"] == sprint_name
+                for issue in self.sprint_issues[board["currentSprint"]["id"]]
+            ]
+
+        excluded = {value.strip("{}") for value in re.findall(r"State: -(\{[^}]*\}|\S+)", query)}
+        if excluded:
+            issues = [issue for issue in issues if _state(issue) not in excluded]
+
+        included = re.search(r"State: ((?:\{[^}]*\}|[^\s,{}-][^\s,]*)(?:, (?:\{[^}]*\}|[^\s,]+))*)", query)
+        if included:
+            names = {value.strip().strip("{}") for value in included.group(1).split(",")}
+            issues = [issue for issue in issues if _state(issue) in names]
+
+        updated_match = re.search(r"updated: (\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d) \.\. \*", query)
+        if updated_match:
+            since = datetime.strptime(updated_match.group(1), "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+            since_ms = since.timestamp() * 1000
+            issues = [issue for issue in issues if issue["updated"] >= since_ms]
+
+        ids_match = re.search(r"issue id: ([\w\-, ]+)", query)
+        if ids_match:
+            wanted = [value.strip() for value in ids_match.group(1).split(",")]
+            issues = [self.issues[value] for value in wanted if value in self.issues]
+
+        # Lo que no es un filtro conocido es búsqueda de texto: cada palabra debe aparecer en la issue
+        text = query
+        for match in (board_match, included, updated_match, ids_match, *re.finditer(r"State: -(\{[^}]*\}|\S+)", query)):
+            if match:
+                text = text.replace(match.group(0), " ")
+        words = text.lower().split()
+        if words:
+            issues = [issue for issue in issues if all(word in _issue_text(issue) for word in words)]
+
+        return issues
+
+
+def _issue_ref(number: int) -> Dict[str, Any]:
+    """Referencia a otra issue, como aparece en relaciones, padre y subtareas"""
+    return {"id": f"2-{number}", "idReadable": f"DEMO-{number}", "summary": f"Tarea {number}"}
+
+
+def _issue_text(issue: Dict[str, Any]) -> str:
+    """Título, descripción y comentarios de una issue generada, en minúsculas"""
+    comments = " ".join(comment["text"] for comment in issue.get("comments", []))
+    return f"{issue['summary']} {issue.get('wikifiedDescription', '')} {comments}".lower()
+
+
+def _state(issue: Dict[str, Any]) -> Optional[str]:
+    """Estado de una issue generada"""
+    for field in issue["customFields"]:
+        if field["name"] == "State" and field["value"]:
+            return field["value"]["name"]
+    return None
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer con una cola de conexiones acorde a clientes muy concurrentes"""
+    # Con la cola por defecto (5) las conexiones simultáneas se pierden y el cliente las reintenta
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class FakeYouTrackServer:
+    """Servidor HTTP en un hilo de fondo con contadores de tráfico"""
+
+    def __init__(self, config: Optional[FakeYouTrackConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or FakeYouTrackConfig()
+        self.data = FakeYouTrackData(self.config)
+        self.stats = {"requests": 0, "bytes_sent": 0, "errors_injected": 0}
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._httpd = _HTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL base de la API, tal como se configura en YOUTRACK_BASE_URL"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "FakeYouTrackServer":
+        """Arranca el servidor en un hilo de fondo"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Detiene el servidor"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copia de los contadores de tráfico"""
+        with self._lock:
+            return dict(self.stats)
+
+    def _record(self, size: int, injected: bool = False) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["bytes_sent"] += size
+            if injected:
+                self.stats["errors_injected"] += 1
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self._rng.random() < self.config.error_rate
+
+    def _route(self, path: str, params: Dict[str, List[str]]) -> Tuple[int, Any]:
+        """Resuelve una petición GET a (estado, cuerpo JSON sin proyectar)"""
+        data = self.data
+        if path == "/users/me":
+            return 200, {"profiles": {"general": {"timezone": {"id": "UTC"}}}}
+        if path == "/agiles":
+            return 200, data.boards
+
+        match = re.fullmatch(r"/agiles/[^/]+/sprints/([^/]+)/issues", path)
+        if match:
+            issues = data.sprint_issues.get(match.group(1))
+            return (200, issues) if issues is not None else (404, {"error": "Sprint no encontrado"})
+
+        if path == "/issues":
+            return 200, data.query(params.get("query", [""])[0])
+
+        match = re.fullmatch(r"/issues/([^/]+)/comments", path)
+        if match:
+            issue = data.issues.get(match.group(1))
+            return (200, issue["comments"]) if issue else (404, {"error": "Issue no encontrada"})
+
+        match = re.fullmatch(r"/issues/([^/]+)", path)
+        if match:
+            issue = data.issues.get(match.group(1))
+            return (200, issue) if issue else (404, {"error": "Issue no encontrada"})
+
+        return 404, {"error": f"Ruta desconocida: {path}"}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Cabeceras y cuerpo van en escrituras separadas: sin esto, Nagle añade ~40 ms
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if server.config.latency_ms:
+                    time.sleep(server.config.latency_ms / 1000)
+
+                if server._should_fail():
+                    self._send(500, {"error": "Error inyectado"}, injected=True)
+                    return
+
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                path = url.path[len("/api"):] if url.path.startswith("/api") else url.path
+                status, body = server._route(path, params)
+
+                if status == 200:
+                    body = self._page(body, params)
+                    fields = params.get("fields", [""])[0]
+                    if fields:
+                        tree = parse_fields(fields)
+                        if "commentsCount" in tree:
+                            body = self._with_comments_count(body)
+                        body = project(body, tree)
+                self._send(status, body)
+
+            @staticmethod
+            def _page(body: Any, params: Dict[str, List[str]]) -> Any:
+                if not isinstance(body, list):
+                    return body
+                skip = int(params.get("$skip", ["0"])[0])
+                top = int(params.get("$top", ["-1"])[0])
+                body = body[skip:]
+                return body if top < 0 else body[:top]
+
+            @staticmethod
+            def _with_comments_count(body: Any) -> Any:
+                if isinstance(body, list):
+                    return [{**issue, "commentsCount": len(issue.get("comments", []))} for issue in body]
+                return {**body, "commentsCount": len(body.get("comments", []))}
+
+            def _send(self, status: int, body: Any, injected: bool = False) -> None:
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                server._record(len(payload), injected)
+
+        return Handler
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Añade a un parser los argumentos de FakeYouTrackConfig"""
+    defaults = FakeYouTrackConfig()
+    parser.add_argument("--boards", type=int, default=defaults.boards, help="Número de tableros")
+    parser.add_argument("--issues-per-sprint", type=int, default=defaults.issues_per_sprint, help="Issues en el sprint actual de cada tablero")
+    parser.add_argument("--comments-per-issue", type=int, default=defaults.comments_per_issue, help="Comentarios por issue")
+    parser.add_argument("--description-length", type=int, default=defaults.description_length, help="Longitud aproximada de la descripción (caracteres)")
+    parser.add_argument("--finished-ratio", type=float, default=defaults.finished_ratio, help="Proporción de issues terminadas")
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="Latencia añadida por respuesta (ms)")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="Probabilidad de responder 500 (0-1)")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Semilla de generación de datos")
+
+
+def config_from_args(args: argparse.Namespace) -> FakeYouTrackConfig:
+    """Construye la configuración a partir de los argumentos de add_config_arguments"""
+    return FakeYouTrackConfig(
+        boards=args.boards,
+        issues_per_sprint=args.issues_per_sprint,
+        comments_per_issue=args.comments_per_issue,
+        description_length=args.description_length,
+        finished_ratio=args.finished_ratio,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local que imita la API de YouTrack")
+    parser.add_argument("--host", default="127.0.0.1", help="Host de escucha")
+    parser.add_argument("--port", type=int, default=8765, help="Puerto de escucha")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeYouTrackServer(config_from_args(args), host=args.host, port=args.port).start()
+    print(f"YOUTRACK_BASE_URL={server.base_url}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Benchmark de extremo a extremo del servidor MCP contra un YouTrack local simulado
+
+Arranca benchmarks/fake_youtrack.py en un hilo, lanza el servidor MCP como subproceso
+por stdio (igual que lo hace un cliente MCP) y ejecuta las herramientas con la
+concurrencia indicada. Por escenario informa latencias p50/p90/p99, throughput,
+peticiones y bytes recibidos de YouTrack y errores; al final, el pico de RSS del
+servidor. El resultado se guarda en JSON para comparar ejecuciones con --compare.
+
+Uso:
+    python benchmarks/run_benchmarks.py --issues-per-sprint 500 --latency-ms 20 \\
+        --iterations 50 --concurrency 4 --output actual.json
+    python benchmarks/run_benchmarks.py --compare anterior.json --output actual.json
+    python benchmarks/run_benchmarks.py --server-args "--issue-cache-size 0"
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import shlex
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mcp import ClientSession, StdioServerParameters  # noqa: E402
+from mcp.client.stdio import stdio_client  # noqa: E402
+
+from benchmarks.fake_youtrack import FakeYouTrackServer, add_config_arguments, config_from_args  # noqa: E402
+
+SCENARIOS = ("getTasksInformation", "getIssueById", "getIssuesByIds")
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Percentil por el método del rango más cercano"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def scenario_calls(name: str, server: FakeYouTrackServer, iterations: int, rng: random.Random) -> List[Tuple[str, Dict[str, Any]]]:
+    """Llamadas (herramienta, argumentos) de un escenario"""
+    boards = [board["name"] for board in server.data.boards]
+    issue_ids = [issue["idReadable"] for issues in server.data.sprint_issues.values() for issue in issues]
+
+    if name == "getTasksInformation":
+        return [(name, {"name": boards[i % len(boards)], "num_comments": 1}) for i in range(iterations)]
+    if name == "getIssueById":
+        return [(name, {"issue_id": rng.choice(issue_ids)}) for _ in range(iterations)]
+    return [(name, {"issue_ids": rng.sample(issue_ids, min(10, len(issue_ids)))}) for _ in range(iterations)]
+
+
+async def run_scenario(session: ClientSession, server: FakeYouTrackServer, calls: List[Tuple[str, Dict[str, Any]]],
+                       concurrency: int) -> Dict[str, Any]:
+    """Ejecuta las llamadas de un escenario con la concurrencia indicada y resume las medidas"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+    response_bytes = 0
+
+    async def call(tool: str, arguments: Dict[str, Any]) -> None:
+        nonlocal errors, response_bytes
+        async with semaphore:
+            start = time.perf_counter()
+            result = await session.call_tool(tool, arguments)
+            latencies.append((time.perf_counter() - start) * 1000)
+        text = "".join(getattr(block, "text", "") for block in result.content)
+        response_bytes += len(text.encode("utf-8"))
+        if result.isError or text.startswith("❌"):
+            errors += 1
+
+    before = server.snapshot()
+    start = time.perf_counter()
+    await asyncio.gather(*(call(tool, arguments) for tool, arguments in calls))
+    elapsed = time.perf_counter() - start
+    after = server.snapshot()
+
+    return {
+        "calls": len(calls),
+        "errors": errors,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50), 2),
+            "p90": round(percentile(latencies, 0.90), 2),
+            "p99": round(percentile(latencies, 0.99), 2),
+            "mean": round(sum(latencies) / len(latencies), 2),
+            "max": round(max(latencies), 2),
+        },
+        "throughput_rps": round(len(calls) / elapsed, 2),
+        "upstream_requests": after["requests"] - before["requests"],
+        "upstream_bytes": after["bytes_sent"] - before["bytes_sent"],
+        "response_bytes": response_bytes,
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Arranca YouTrack simulado y el servidor MCP, y ejecuta los escenarios pedidos"""
+    server = FakeYouTrackServer(config_from_args(args)).start()
+    rng = random.Random(args.seed)
+    env = dict(os.environ, YOUTRACK_BASE_URL=server.base_url, YOUTRACK_API_TOKEN="benchmark")
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "src.main", *shlex.split(args.server_args)],
+        env=env,
+        cwd=ROOT,
+    )
+
+    results: Dict[str, Any] = {}
+    try:
+        with open(os.devnull, "w") as errlog:
+            async with stdio_client(params, errlog=errlog) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    for name in args.scenarios.split(","):
+                        if name not in SCENARIOS:
+                            raise SystemExit(f"Escenario desconocido: {name}. Válidos: {', '.join(SCENARIOS)}")
+                        for tool, arguments in scenario_calls(name, server, args.warmup, rng):
+                            await session.call_tool(tool, arguments)
+                        calls = scenario_calls(name, server, args.iterations, rng)
+                        results[name] = await run_scenario(session, server, calls, args.concurrency)
+    finally:
+        traffic = server.snapshot()
+        server.stop()
+
+    # El servidor MCP es el único subproceso: ru_maxrss de los hijos es su pico de RSS (KiB en Linux)
+    peak_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "server_args": args.server_args,
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "fake_youtrack": vars(server.config),
+        },
+        "scenarios": results,
+        "server_peak_rss_mb": round(peak_rss / 1024, 1),
+        "upstream_totals": traffic,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Commit actual del repositorio, si está disponible"""
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True)
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """Imprime un resumen tabulado, con la variación respecto a baseline si se indica"""
+    def delta(current: float, previous: Optional[float]) -> str:
+        if not previous:
+            return ""
+        return f" ({(current - previous) / previous * 100:+.0f}%)"
+
+    print(f"{'escenario':<22}{'p50 (ms)':>18}{'p90 (ms)':>18}{'p99 (ms)':>18}{'req/s':>16}{'KiB YouTrack':>20}{'errores':>9}")
+    for name, result in report["scenarios"].items():
+        previous = (baseline or {}).get("scenarios", {}).get(name, {})
+        previous_latency = previous.get("latency_ms", {})
+        cells = [
+            f"{result['latency_ms'][key]:.1f}{delta(result['latency_ms'][key], previous_latency.get(key))}"
+            for key in ("p50", "p90", "p99")
+        ]
+        throughput = f"{result['throughput_rps']:.1f}{delta(result['throughput_rps'], previous.get('throughput_rps'))}"
+        upstream = f"{result['upstream_bytes'] / 1024:.0f}{delta(result['upstream_bytes'], previous.get('upstream_bytes'))}"
+        print(f"{name:<22}{cells[0]:>18}{cells[1]:>18}{cells[2]:>18}{throughput:>16}{upstream:>20}{result['errors']:>9}")
+
+    rss = report["server_peak_rss_mb"]
+    previous_rss = (baseline or {}).get("server_peak_rss_mb")
+    print(f"Pico de RSS del servidor: {rss:.1f} MB{delta(rss, previous_rss)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de extremo a extremo del servidor MCP de YouTrack")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Escenarios a ejecutar, separados por comas")
+    parser.add_argument("--iterations", type=int, default=30, help="Llamadas medidas por escenario")
+    parser.add_argument("--warmup", type=int, default=1, help="Llamadas de calentamiento por escenario (no se miden)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Llamadas simultáneas por escenario")
+    parser.add_argument("--server-args", default="", help="Argumentos adicionales para el servidor MCP (ej: \"--issue-cache-size 0\")")
+    parser.add_argument("--output", help="Fichero JSON donde guardar los resultados")
+    parser.add_argument("--compare", help="Fichero JSON de una ejecución anterior con el que comparar")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    report = asyncio.run(run(args))
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
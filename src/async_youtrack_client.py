@@ -0,0 +1,884 @@
+"""
+Cliente asíncrono para la API de YouTrack
+"""
+import asyncio
+import time
+import httpx
+from typing import Any, AsyncIterator, Callable, FrozenSet, List, Set, Tuple, Optional, Dict
+import logging
+
+from .cache import SprintSnapshot
+from .config import YouTrackConfig
+from .metrics import metrics
+from .models import Board, Issue, ExtendedIssue, IssueGraph, IssueNode
+from .resilience import CircuitOpenError, RetryPolicy
+from .singleflight import SingleFlight
+from .base_client import BaseYouTrackClient, YouTrackAPIError
+
+logger = logging.getLogger("Youtrack MCP")
+
+# Comentarios de margen al pedir la cola de comentarios de una issue, por si se han
+# borrado algunos desde que se contaron
+COMMENTS_WINDOW_SLACK = 5
+
+
+class YouTrackUnavailableError(CircuitOpenError, httpx.TransportError):
+    """YouTrack se considera caído (circuito abierto): la petición no se ha enviado"""
+    pass
+
+
+class AsyncYouTrackClient(BaseYouTrackClient):
+    """
+    Cliente asyncio para la API de YouTrack.
+    
+    Todas las peticiones comparten un único httpx.AsyncClient, de modo que las llamadas
+    concurrentes solapan sus esperas de red y reutilizan las conexiones del pool.
+    """
+    
+    def __init__(self, config: YouTrackConfig):
+        super().__init__(config)
+        self._stats = {"requests": 0, "new_connections": 0}
+        self._user_timezone: Optional[str] = None
+        self._user_timezone_resolved = False
+        self._single_flight = SingleFlight()
+        self.http = self._create_http_client()
+    
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """
+        Crea el cliente HTTP asíncrono con los límites del pool configurados
+        
+        Returns:
+            httpx.AsyncClient: Cliente con el pool de conexiones y los headers de la API
+        """
+        limits = httpx.Limits(
+            # Con pool_block se espera a una conexión libre; si no, se abren las que hagan falta
+            max_connections=self.config.pool_maxsize if self.config.pool_block else None,
+            max_keepalive_connections=self.config.pool_maxsize if self.config.keep_alive else 0
+        )
+        return httpx.AsyncClient(
+            headers=self.config.headers,
+            timeout=self.config.timeout,
+            limits=limits
+        )
+    
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """Callback de trazas de httpcore: cuenta las conexiones TCP nuevas"""
+        if event_name == "connection.connect_tcp.complete":
+            self._stats["new_connections"] += 1
+    
+    async def _get(self, url: str) -> httpx.Response:
+        """
+        Realiza un GET reutilizando las conexiones del pool
+        
+        Los errores de red, timeouts y estados 429/5xx se reintentan según config.max_retries,
+        y las peticiones se espacian según config.rate_limit. Con el circuito abierto la
+        petición falla sin enviarse.
+        
+        Args:
+            url: URL completa a consultar
+        
+        Returns:
+            httpx.Response: Respuesta con estado 2xx
+        
+        Raises:
+            httpx.HTTPError: Si la petición falla o el estado no es 2xx
+            YouTrackUnavailableError: Si el circuito está abierto
+        """
+        attempt = 0
+        while True:
+            if not self.circuit_breaker.allow():
+                metrics.incr("upstream_requests_total", status="rejected")
+                raise YouTrackUnavailableError(self._unavailable_message())
+            
+            wait = self._rate_limit_delay()
+            if wait:
+                await asyncio.sleep(wait)
+            
+            try:
+                response = await self._send(url)
+            except httpx.TransportError as e:
+                delay = self._retry_delay(url, attempt, str(e) or type(e).__name__)
+                if delay is None:
+                    raise
+            else:
+                if not self.retry_policy.should_retry_status(response.status_code):
+                    self.circuit_breaker.record_success()
+                    response.raise_for_status()
+                    return response
+                
+                retry_after = RetryPolicy.parse_retry_after(response.headers.get("Retry-After"))
+                delay = self._retry_delay(url, attempt, f"HTTP {response.status_code}", retry_after)
+                if delay is None:
+                    response.raise_for_status()
+            
+            attempt += 1
+            await asyncio.sleep(delay)
+    
+    async def _send(self, url: str) -> httpx.Response:
+        """Envía un único GET y registra su duración, estado y tamaño"""
+        self._stats["requests"] += 1
+        start = time.perf_counter()
+        try:
+            response = await self.http.get(url, extensions={"trace": self._trace})
+        except httpx.HTTPError:
+            metrics.incr("upstream_requests_total", status="error")
+            raise
+        finally:
+            metrics.observe("phase_duration_seconds", time.perf_counter() - start, phase="http")
+        
+        metrics.incr("upstream_requests_total", status=response.status_code)
+        metrics.incr("upstream_bytes_total", len(response.content))
+        logger.debug(f"Estadísticas de conexión: {self.get_connection_stats()}")
+        return response
+    
+    async def _get_json(self, url: str) -> Any:
+        """
+        Realiza un GET y devuelve el JSON de la respuesta (ver _get_json_sized)
+        
+        Raises:
+            httpx.HTTPError: Si la petición falla o el estado no es 2xx
+        """
+        data, _ = await self._get_json_sized(url)
+        return data
+    
+    async def _get_json_sized(self, url: str) -> Tuple[Any, int]:
+        """
+        Realiza un GET y devuelve el JSON de la respuesta junto con su tamaño en bytes
+        
+        Las llamadas simultáneas a la misma URL (que incluye los fields pedidos) comparten
+        una única petición a YouTrack y el mismo JSON ya parseado, que no debe modificarse.
+        
+        Args:
+            url: URL completa a consultar
+        
+        Returns:
+            Tuple[Any, int]: JSON de la respuesta y bytes recibidos
+        
+        Raises:
+            httpx.HTTPError: Si la petición falla o el estado no es 2xx
+        """
+        return await self._single_flight.do(url, self._fetch_json, url)
+    
+    async def _fetch_json(self, url: str) -> Tuple[Any, int]:
+        """Realiza el GET de _get_json_sized y parsea la respuesta"""
+        response = await self._get(url)
+        with metrics.span("phase_duration_seconds", phase="json_decode"):
+            data = response.json()
+        return data, len(response.content)
+    
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        Devuelve estadísticas de reutilización de conexiones del pool
+        
+        Returns:
+            Dict[str, int]: Peticiones realizadas, conexiones abiertas y reutilizadas, y
+                            llamadas agrupadas con otra idéntica en curso
+        """
+        return {
+            "requests": self._stats["requests"],
+            "new_connections": self._stats["new_connections"],
+            "reused_connections": max(self._stats["requests"] - self._stats["new_connections"], 0),
+            "collapsed_requests": self._single_flight.stats["collapsed"]
+        }
+    
+    def get_diagnostics(self) -> Dict[str, Dict[str, int]]:
+        """
+        Reúne las estadísticas de conexiones, filtrado en servidor, cachés y single-flight
+        
+        Returns:
+            Dict[str, Dict[str, int]]: Contadores agrupados por componente
+        """
+        return {
+            "connections": self.get_connection_stats(),
+            "server_side_filter": dict(self.filter_stats),
+            "single_flight": dict(self._single_flight.stats),
+            "resilience": self.get_resilience_stats(),
+            **self.get_cache_stats()
+        }
+    
+    async def aclose(self) -> None:
+        """Cierra el cliente HTTP, las conexiones abiertas del pool y la caché de disco"""
+        await self.http.aclose()
+        if self.disk_cache is not None:
+            await asyncio.to_thread(self.disk_cache.close)
+    
+    async def prewarm(self) -> None:
+        """
+        Adelanta el trabajo de la primera herramienta: abre la conexión con YouTrack (DNS,
+        TCP y TLS) y carga el listado de tableros en el registro
+        
+        Si una herramienta pide el listado mientras tanto, comparte la misma petición.
+        Los errores solo se registran: la primera herramienta volverá a intentarlo.
+        """
+        start = time.perf_counter()
+        with metrics.span("phase_duration_seconds", phase="prewarm"):
+            resolved, error = await self.find_boards_by_names([])
+        
+        if error:
+            logger.warning(f"Precalentamiento fallido: {error}")
+        else:
+            logger.info(f"Precalentamiento completado en {(time.perf_counter() - start) * 1000:.0f} ms: {len(resolved)} tableros")
+    
+    async def get_boards(self) -> Tuple[List[Board], Optional[str]]:
+        """
+        Obtiene todos los tableros disponibles
+        
+        Returns:
+            Tuple[List[Board], Optional[str]]: Lista de tableros y error si existe
+        """
+        try:
+            return self._parse_boards(await self._get_json(self._boards_url())), None
+        
+        except httpx.HTTPError as e:
+            error_msg = f"Error al obtener tableros: {str(e)}"
+            logger.error(error_msg)
+            return [], error_msg
+        except Exception as e:
+            error_msg = f"Error inesperado al obtener tableros: {str(e)}"
+            logger.error(error_msg)
+            return [], error_msg
+    
+    async def _iter_issue_pages(self, page_url: Callable[[int], str], num_comments: int,
+                                error_context: str) -> AsyncIterator[Tuple[List[Issue], int]]:
+        """
+        Recorre un listado paginado de issues ($top/$skip)
+        
+        Cada página se transforma en issues en cuanto llega, de modo que solo hay una
+        página de JSON en memoria a la vez.
+        
+        Args:
+            page_url: Función que construye la URL de la página a partir del $skip
+            num_comments: Número de comentarios a obtener por issue
+            error_context: Descripción del listado para los mensajes de error
+            
+        Yields:
+            Tuple[List[Issue], int]: Issues de cada página y bytes recibidos
+            
+        Raises:
+            YouTrackAPIError: Si falla la petición de alguna página
+        """
+        skip = 0
+        while True:
+            try:
+                issues_data, size = await self._get_json_sized(page_url(skip))
+                
+                if num_comments > 0 and self.config.comments_subquery_threshold > 0:
+                    issues_data = await self._with_latest_comments(issues_data, num_comments)
+                with metrics.span("phase_duration_seconds", phase="parse"):
+                    issues = [Issue.from_youtrack_data(issue_data, num_comments) for issue_data in issues_data]
+                self._index_issues(issues)
+                
+            except httpx.HTTPError as e:
+                # El tablero cacheado puede haber cambiado de sprint o dejado de existir
+                # (con el circuito abierto se conserva para seguir sirviendo lo que hay en caché)
+                if not isinstance(e, CircuitOpenError):
+                    self.board_registry.invalidate()
+                error_msg = f"Error al obtener {error_context}: {str(e)}"
+                logger.error(error_msg)
+                raise YouTrackAPIError(error_msg) from e
+            except Exception as e:
+                error_msg = f"Error inesperado al obtener issues: {str(e)}"
+                logger.error(error_msg)
+                raise YouTrackAPIError(error_msg) from e
+            
+            yield issues, size
+            
+            # Una página incompleta indica que no quedan más issues
+            if len(issues_data) < self.config.page_size:
+                break
+            skip += len(issues_data)
+    
+    async def _fetch_latest_comments(self, issue_data: Dict[str, Any], num_comments: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Obtiene la cola de comentarios de una issue con muchos comentarios
+        
+        El recuento de la página puede haber quedado atrás, así que se piden desde un poco
+        antes de los num_comments últimos hasta el final y el modelo se queda con los últimos.
+        
+        Args:
+            issue_data: Datos de la issue con commentsCount
+            num_comments: Número de comentarios a mostrar
+            
+        Returns:
+            Optional[List[Dict[str, Any]]]: Comentarios en orden cronológico (None si la petición falla)
+        """
+        skip = max(issue_data["commentsCount"] - num_comments - COMMENTS_WINDOW_SLACK, 0)
+        try:
+            comments = await self._get_json(self._comments_url(issue_data["id"], skip))
+            if skip and len(comments) < num_comments:
+                # Se han borrado más comentarios que el margen: se piden todos
+                comments = await self._get_json(self._comments_url(issue_data["id"], 0))
+        except httpx.HTTPError as e:
+            logger.warning(f"No se pudieron obtener los comentarios de la issue {issue_data['id']}: {str(e)}")
+            return None
+        return comments
+    
+    async def _fetch_comments_batch(self, issues_data: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Obtiene en una sola petición los comentarios de varias issues con pocos comentarios
+        
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Comentarios de cada issue por id (vacío si la petición falla)
+        """
+        try:
+            results = await self._get_json(self._comments_batch_url([issue_data["idReadable"] for issue_data in issues_data]))
+        except httpx.HTTPError as e:
+            logger.warning(f"No se pudieron obtener los comentarios de {len(issues_data)} issues: {str(e)}")
+            return {}
+        return {result["id"]: result.get("comments", []) for result in results}
+    
+    async def _with_latest_comments(self, issues_data: List[Dict[str, Any]], num_comments: int) -> List[Dict[str, Any]]:
+        """
+        Completa los comentarios de una página pedida solo con commentsCount
+        
+        Las issues con hasta config.comments_subquery_threshold comentarios los reciben todos
+        en una única petición por página; las que tienen más piden aparte, de forma
+        concurrente, solo la cola de su lista de comentarios.
+        
+        Args:
+            issues_data: Issues de la página (con commentsCount)
+            num_comments: Número de comentarios a mostrar por issue
+            
+        Returns:
+            List[Dict[str, Any]]: Issues de la página con sus comentarios
+        """
+        threshold = self.config.comments_subquery_threshold
+        few = [issue_data for issue_data in issues_data if 0 < (issue_data.get("commentsCount") or 0) <= threshold]
+        many = [issue_data for issue_data in issues_data if (issue_data.get("commentsCount") or 0) > threshold]
+        
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        
+        async def fetch(issue_data: Dict[str, Any]) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+            async with semaphore:
+                return issue_data["id"], await self._fetch_latest_comments(issue_data, num_comments)
+        
+        comments_by_id = await self._fetch_comments_batch(few) if few else {}
+        for issue_id, comments in await asyncio.gather(*(fetch(issue_data) for issue_data in many)):
+            if comments is not None:
+                comments_by_id[issue_id] = comments
+        
+        return [
+            {**issue_data, "comments": comments_by_id[issue_data["id"]]} if issue_data["id"] in comments_by_id else issue_data
+            for issue_data in issues_data
+        ]
+    
+    async def iter_sprint_issues(self, board_id: str, sprint_id: str, num_comments: int = 1) -> AsyncIterator[Issue]:
+        """
+        Recorre las issues de un sprint página a página
+        
+        Args:
+            board_id: ID del tablero
+            sprint_id: ID del sprint
+            num_comments: Número de comentarios a obtener por issue (por defecto 1)
+            
+        Yields:
+            Issue: Issues del sprint en el orden devuelto por YouTrack
+            
+        Raises:
+            YouTrackAPIError: Si falla la petición de alguna página
+        """
+        pages = self._iter_issue_pages(
+            lambda skip: self._sprint_issues_url(board_id, sprint_id, skip, num_comments),
+            num_comments,
+            f"issues del sprint {sprint_id}"
+        )
+        async for issues, _ in pages:
+            for issue in issues:
+                yield issue
+    
+    async def iter_active_issues(self, board: Board, num_comments: int = 1) -> AsyncIterator[Issue]:
+        """
+        Recorre las issues no terminadas del sprint actual de un tablero
+        
+        El filtrado por config.finished_states se delega en YouTrack mediante una consulta,
+        de modo que las issues terminadas no se descargan. Si la consulta falla, se recorre
+        el sprint completo y se filtra localmente.
+        
+        Args:
+            board: Tablero con sprint actual
+            num_comments: Número de comentarios a obtener por issue (por defecto 1)
+            
+        Yields:
+            Issue: Issues del sprint que no están terminadas
+            
+        Raises:
+            YouTrackAPIError: Si falla la petición de alguna página
+        """
+        if self.config.server_side_filter:
+            query = self._unfinished_query(board)
+            pages = self._iter_issue_pages(
+                lambda skip: self._issues_query_url(query, skip, fields=self._issue_list_fields(num_comments)),
+                num_comments,
+                f"issues en curso del tablero {board.name}"
+            )
+            
+            try:
+                first_page = await anext(pages)
+            except YouTrackAPIError:
+                logger.warning(f"No se pudo filtrar en YouTrack con la consulta '{query}'; se filtrará localmente")
+                self.filter_stats["fallbacks"] += 1
+            else:
+                # El recuento opcional de issues terminadas (solo IDs) se solapa con la descarga
+                count_task = None
+                if self.config.count_filtered_issues:
+                    count_task = asyncio.create_task(self._count_issues(self._finished_query(board)))
+                try:
+                    issues_transferred = len(first_page[0])
+                    bytes_transferred = first_page[1]
+                    for issue in first_page[0]:
+                        yield issue
+                    
+                    async for issues, size in pages:
+                        issues_transferred += len(issues)
+                        bytes_transferred += size
+                        for issue in issues:
+                            yield issue
+                    
+                    issues_avoided = await count_task if count_task is not None else None
+                    self._record_filter_savings(issues_transferred, bytes_transferred, issues_avoided)
+                finally:
+                    if count_task is not None:
+                        count_task.cancel()
+                return
+        
+        # Filtrado local: se descarga el sprint completo
+        async for issue in self.iter_sprint_issues(board.id, board.current_sprint_id, num_comments):
+            if not issue.is_finished(self.config.finished_states):
+                yield issue
+    
+    async def iter_current_issues(self, board: Board, num_comments: int = 1, max_age: float = 0.0) -> AsyncIterator[Issue]:
+        """
+        Recorre las issues en curso del sprint actual usando el snapshot incremental del sprint
+        
+        La primera llamada (y cada config.snapshot_full_sync_interval segundos) descarga las
+        issues en curso completas; el resto solo pide las actualizadas desde la última
+        sincronización y las fusiona en el snapshot.
+        
+        Args:
+            board: Tablero con sprint actual
+            num_comments: Número de comentarios a obtener por issue (por defecto 1)
+            max_age: Segundos durante los que un snapshot recién sincronizado se sirve sin
+                     consultar a YouTrack (0 = sincronizar siempre)
+            
+        Yields:
+            Issue: Issues del sprint que no están terminadas
+            
+        Raises:
+            YouTrackAPIError: Si falla la descarga completa del sprint
+        """
+        if not self.sprint_snapshots.enabled:
+            async for issue in self.iter_active_issues(board, num_comments):
+                yield issue
+            return
+        
+        key = (board.id, board.current_sprint_id, num_comments)
+        snapshot = self.sprint_snapshots.get(key) or await self._restore_snapshot(key)
+        
+        if snapshot is not None and self.circuit_breaker.is_open:
+            # YouTrack caído: se sirve el snapshot tal cual, sin sincronizar
+            logger.warning(f"YouTrack no disponible: se sirve la copia en caché del sprint {board.current_sprint_id}")
+        elif snapshot is not None and time.monotonic() - snapshot.synced_at < max_age:
+            # Sincronizado hace poco (ej: por el refresco en segundo plano): se sirve de memoria
+            logger.debug(f"Sprint {board.current_sprint_id} sincronizado hace {time.monotonic() - snapshot.synced_at:.0f}s: se usa el snapshot")
+        elif not self.sprint_snapshots.needs_full_sync(snapshot):
+            snapshot = await self._sync_sprint_delta(board, key, snapshot, num_comments)
+        else:
+            snapshot = None
+        
+        if snapshot is None:
+            # Sincronización completa: se entrega cada issue según llega y se guarda el resultado
+            collected = []
+            async for issue in self.iter_active_issues(board, num_comments):
+                collected.append(issue)
+                yield issue
+            await self._persist_snapshot(key, self.sprint_snapshots.replace(key, collected))
+            return
+        
+        for issue in list(snapshot.issues.values()):
+            yield issue
+    
+    async def _sync_sprint_delta(self, board: Board, key: Tuple[str, str, int], snapshot: SprintSnapshot,
+                                 num_comments: int) -> Optional[SprintSnapshot]:
+        """
+        Descarga las issues del sprint actualizadas desde el snapshot y las fusiona
+        
+        Returns:
+            Optional[SprintSnapshot]: Snapshot actualizado, o None si hay que sincronizar por completo
+        """
+        timezone_id = await self._get_user_timezone()
+        query = self._updated_since_query(board, snapshot.max_updated, timezone_id)
+        pages = self._iter_issue_pages(
+            lambda skip: self._issues_query_url(query, skip, fields=self._issue_list_fields(num_comments)),
+            num_comments,
+            f"cambios del sprint {board.current_sprint_id}"
+        )
+        
+        try:
+            changed = [issue async for issues, _ in pages for issue in issues]
+            
+            if num_comments != 0:
+                stale = await self._find_commented_issues(board, snapshot, {issue.id for issue in changed})
+                if stale:
+                    ids_query = self._issue_ids_query(stale)
+                    pages = self._iter_issue_pages(
+                        lambda skip: self._issues_query_url(ids_query, skip, fields=self._issue_list_fields(num_comments)),
+                        num_comments,
+                        f"comentarios nuevos del sprint {board.current_sprint_id}"
+                    )
+                    changed += [issue async for issues, _ in pages for issue in issues]
+        except YouTrackAPIError:
+            if self.circuit_breaker.is_open:
+                logger.warning(f"YouTrack no disponible: se sirve la copia en caché del sprint {board.current_sprint_id}")
+                return snapshot
+            logger.warning(f"No se pudieron obtener los cambios del sprint {board.current_sprint_id}; se sincronizará por completo")
+            return None
+        
+        logger.debug(f"Sprint {board.current_sprint_id}: {len(changed)} issues actualizadas desde la última sincronización")
+        snapshot = self.sprint_snapshots.merge(key, changed, self.config.finished_states)
+        if snapshot is not None and changed:
+            await self._persist_snapshot(key, snapshot)
+        return snapshot
+    
+    async def _find_commented_issues(self, board: Board, snapshot: SprintSnapshot, changed_ids: Set[str]) -> List[str]:
+        """
+        Busca las issues del snapshot cuyo número de comentarios ha cambiado
+        
+        Añadir un comentario no siempre actualiza el campo "updated" de la issue, así que
+        la consulta de cambios no basta para tener al día los comentarios del snapshot: se
+        pide el commentsCount (solo ese campo) de las issues en curso y se compara.
+        
+        Args:
+            board: Tablero con sprint actual
+            snapshot: Snapshot del sprint
+            changed_ids: IDs internos de las issues que ya se han vuelto a descargar
+            
+        Returns:
+            List[str]: IDs legibles de las issues a descargar de nuevo (vacía si la consulta falla)
+        """
+        query = self._unfinished_query(board)
+        stale = []
+        skip = 0
+        try:
+            while True:
+                page = await self._get_json(self._issues_query_url(query, skip, fields="id,commentsCount"))
+                for row in page:
+                    issue = snapshot.issues.get(row["id"])
+                    if (issue is not None and issue.id not in changed_ids and issue.comments_count is not None
+                            and issue.comments_count != row.get("commentsCount")):
+                        stale.append(issue.idReadable)
+                if len(page) < self.config.page_size:
+                    break
+                skip += len(page)
+        except httpx.HTTPError as e:
+            logger.debug(f"No se pudo comprobar el número de comentarios del sprint {board.current_sprint_id}: {str(e)}")
+            return []
+        
+        if stale:
+            logger.debug(f"Sprint {board.current_sprint_id}: {len(stale)} issues con comentarios nuevos")
+        return stale
+    
+    async def _get_user_timezone(self) -> Optional[str]:
+        """Obtiene (una sola vez) la zona horaria con la que YouTrack interpreta las fechas de las consultas"""
+        if not self._user_timezone_resolved:
+            try:
+                self._user_timezone = self._parse_user_timezone(await self._get_json(self._user_timezone_url()))
+            except httpx.HTTPError as e:
+                logger.debug(f"No se pudo obtener la zona horaria del usuario: {str(e)}")
+            self._user_timezone_resolved = True
+        return self._user_timezone
+    
+    async def _count_issues(self, query: str) -> Optional[int]:
+        """
+        Cuenta las issues que cumplen una consulta pidiendo solo sus IDs
+        
+        Returns:
+            Optional[int]: Número de issues, o None si la consulta falla
+        """
+        count = 0
+        skip = 0
+        try:
+            while True:
+                page = await self._get_json(self._issues_query_url(query, skip, fields="id"))
+                count += len(page)
+                if len(page) < self.config.page_size:
+                    return count
+                skip += len(page)
+        except httpx.HTTPError as e:
+            logger.debug(f"No se pudieron contar las issues de '{query}': {str(e)}")
+            return None
+    
+    async def get_sprint_issues(self, board_id: str, sprint_id: str, num_comments: int = 1) -> Tuple[List[Issue], Optional[str]]:
+        """
+        Obtiene las issues de un sprint específico
+        
+        Args:
+            board_id: ID del tablero
+            sprint_id: ID del sprint
+            num_comments: Número de comentarios a obtener por issue (por defecto 1)
+            
+        Returns:
+            Tuple[List[Issue], Optional[str]]: Lista de issues y error si existe
+        """
+        try:
+            return [issue async for issue in self.iter_sprint_issues(board_id, sprint_id, num_comments)], None
+        except YouTrackAPIError as e:
+            return [], str(e)
+    
+    async def find_board_by_name(self, name: str) -> Tuple[Optional[Board], Optional[str]]:
+        """
+        Busca un tablero por nombre (coincidencia exacta, case-insensitive)
+        
+        Args:
+            name: Nombre del tablero a buscar
+        
+        Returns:
+            Tuple[Optional[Board], Optional[str]]: Tablero encontrado y error si existe
+        """
+        # Consultar primero el registro en memoria; recargar si caducó o no contiene el nombre
+        matching_boards = self.board_registry.lookup(name)
+        
+        # Tras un reinicio, el listado guardado en disco evita pedir los tableros de nuevo
+        if matching_boards is None and not self.board_registry.boards and await self._load_boards_from_disk():
+            matching_boards = self.board_registry.lookup(name)
+        
+        # Con YouTrack caído se usa el último listado aunque haya caducado
+        if matching_boards is None and self.circuit_breaker.is_open and self.board_registry.boards:
+            logger.warning("YouTrack no disponible: se usa el listado de tableros en caché")
+            matching_boards = self.board_registry.matches(name)
+        
+        if matching_boards is None:
+            boards, error = await self.get_boards()
+            if error:
+                return None, error
+            
+            await self._register_boards(boards)
+            matching_boards = self.board_registry.matches(name)
+        
+        return self._select_board(name, matching_boards)
+    
+    async def find_boards_by_names(self, names: List[str]) -> Tuple[List[Tuple[str, Optional[Board], Optional[str]]], Optional[str]]:
+        """
+        Busca varios tableros por nombre con, como mucho, una sola petición del listado
+        
+        Args:
+            names: Nombres de los tableros (vacío = todos los tableros)
+        
+        Returns:
+            Tuple[List[Tuple[str, Optional[Board], Optional[str]]], Optional[str]]: Por cada nombre,
+                el nombre, el tablero y su error; y el error si no se pudo obtener el listado
+        """
+        if await self._needs_boards_reload(names):
+            boards, error = await self.get_boards()
+            if error:
+                return [], error
+            await self._register_boards(boards)
+        
+        return self._resolve_board_names(names), None
+    
+    async def _load_issue(self, issue_id: str, sections: FrozenSet[str]) -> ExtendedIssue:
+        """
+        Obtiene el detalle de una issue revalidando las copias en caché
+        
+        Si hay una copia en memoria o en disco, solo se pide a YouTrack el "updated" de la
+        issue: si coincide, se evita descargar de nuevo descripción, enlaces y comentarios
+        (y, con la copia en memoria, también volver a transformarlos). Si a la copia en
+        memoria le faltan secciones, se piden solo esas secciones y se añaden a la issue.
+        Con el circuito abierto se sirve la copia en caché sin revalidarla.
+        
+        Args:
+            issue_id: ID de la issue
+            sections: Secciones que se necesitan
+        
+        Returns:
+            ExtendedIssue: Issue con al menos las secciones pedidas
+        """
+        cached_issue = self.issue_cache.get(issue_id)
+        cached_data = None if cached_issue is not None else await self._cached_issue_data(issue_id)
+        issue_data = None
+        
+        if self.circuit_breaker.is_open and (cached_issue is not None or cached_data is not None):
+            logger.warning(f"YouTrack no disponible: se sirve la copia en caché de la issue {issue_id}")
+            if cached_issue is not None:
+                return cached_issue
+            issue_data = cached_data[1]
+            sections = ExtendedIssue.ALL_SECTIONS
+        
+        elif cached_issue is not None:
+            missing = sections - cached_issue.loaded_sections
+            if missing:
+                # La petición de las secciones que faltan sirve también para revalidar
+                section_data = await self._get_json(self._issue_sections_url(issue_id, missing))
+                updated = section_data.get("updated")
+            else:
+                updated = (await self._get_json(self._issue_version_url(issue_id))).get("updated")
+            
+            if updated is not None and cached_issue.updated == updated:
+                logger.debug(f"Issue {issue_id} sin cambios: se usa la copia en memoria")
+                if missing:
+                    with metrics.span("phase_duration_seconds", phase="parse"):
+                        cached_issue.load_sections(section_data, missing)
+                self.issue_cache.confirm(issue_id)
+                return cached_issue
+        
+        elif cached_data is not None:
+            updated = (await self._get_json(self._issue_version_url(issue_id))).get("updated")
+            if cached_data[0] is not None and cached_data[0] == updated:
+                logger.debug(f"Issue {issue_id} sin cambios: se usa la copia de la caché de disco")
+                issue_data = cached_data[1]
+                sections = ExtendedIssue.ALL_SECTIONS
+        
+        if issue_data is None:
+            issue_data = await self._get_json(self._issue_url(issue_id, sections))
+            # En disco solo se guardan issues completas, válidas para cualquier combinación de secciones
+            if sections == ExtendedIssue.ALL_SECTIONS:
+                await self._store_issue_data(issue_id, issue_data)
+        
+        with metrics.span("phase_duration_seconds", phase="parse"):
+            issue = ExtendedIssue.from_youtrack_data(issue_data, num_comments=-1, sections=sections)
+        self.issue_cache.put(issue_id, issue)
+        return issue
+    
+    async def get_issue_by_id(self, issue_id: str, sections: Optional[List[str]] = None) -> Tuple[Optional[ExtendedIssue], Optional[str]]:
+        """
+        Obtiene una issue específica por su ID con información detallada
+        
+        Args:
+            issue_id: ID de la issue a obtener
+            sections: Secciones de detalle a obtener (ver ExtendedIssue.SECTION_API_FIELDS);
+                      None para obtenerlas todas
+        
+        Returns:
+            Tuple[Optional[ExtendedIssue], Optional[str]]: Issue extendida encontrada y error si existe
+        """
+        try:
+            resolved_sections = ExtendedIssue.resolve_sections(sections)
+        except ValueError as e:
+            return None, str(e)
+        
+        try:
+            # Las peticiones simultáneas de la misma issue comparten también su transformación
+            key = ("issue", issue_id, resolved_sections)
+            issue = await self._single_flight.do(key, self._load_issue, issue_id, resolved_sections)
+            self._index_issues([issue])
+            return issue, None
+        
+        except httpx.HTTPStatusError as e:
+            error_msg = self._issue_http_error_message(issue_id, e.response.status_code, e)
+            logger.error(error_msg)
+            return None, error_msg
+        except httpx.HTTPError as e:
+            error_msg = f"Error al obtener issue {issue_id}: {str(e)}"
+            logger.error(error_msg)
+            return None, error_msg
+        except Exception as e:
+            error_msg = f"Error inesperado al obtener issue {issue_id}: {str(e)}"
+            logger.error(error_msg)
+            return None, error_msg
+    
+    async def search_issues(self, text: str, board: Optional[Board] = None, limit: int = 10) -> Tuple[List[Issue], Optional[str]]:
+        """
+        Busca issues con la búsqueda de texto de YouTrack (query=)
+        
+        Las issues encontradas se añaden al índice local, de modo que las siguientes
+        búsquedas sobre ellas no necesitan consultar a YouTrack.
+        
+        Args:
+            text: Texto a buscar
+            board: Tablero a cuyas tareas en curso del sprint actual se restringe la búsqueda (None = todas)
+            limit: Número máximo de issues
+        
+        Returns:
+            Tuple[List[Issue], Optional[str]]: Issues encontradas (en el orden de YouTrack) y error si existe
+        """
+        query = self._search_query(text, board)
+        pages = self._iter_issue_pages(
+            lambda skip: self._issues_query_url(query, skip, fields=Issue.get_api_fields(0), top=limit),
+            0,
+            f"resultados de la búsqueda '{text}'"
+        )
+        
+        try:
+            async for issues, _ in pages:
+                return issues[:limit], None
+            return [], None
+        except YouTrackAPIError as e:
+            return [], str(e)
+        finally:
+            await pages.aclose()
+    
+    async def get_issues_by_ids(self, issue_ids: List[str]) -> List[Tuple[str, Optional[ExtendedIssue], Optional[str]]]:
+        """
+        Obtiene varias issues de forma concurrente, con un máximo de config.max_concurrency
+        peticiones simultáneas
+        
+        Args:
+            issue_ids: IDs de las issues a obtener
+            
+        Returns:
+            List[Tuple[str, Optional[ExtendedIssue], Optional[str]]]: Por cada ID (en el mismo orden),
+                el ID, la issue obtenida y el error si existe
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        
+        async def fetch(issue_id: str) -> Tuple[str, Optional[ExtendedIssue], Optional[str]]:
+            async with semaphore:
+                issue, error = await self.get_issue_by_id(issue_id)
+                return issue_id, issue, error
+        
+        return list(await asyncio.gather(*(fetch(issue_id) for issue_id in issue_ids)))
+    
+    async def _get_issue_node(self, issue_id: str, depth: int) -> Tuple[str, Optional[IssueNode], Optional[str]]:
+        """
+        Obtiene los campos ligeros y las relaciones de una issue (con descripción solo la raíz)
+        
+        Returns:
+            Tuple[str, Optional[IssueNode], Optional[str]]: ID pedido, nodo obtenido y error si existe
+        """
+        try:
+            issue_data = await self._get_json(self._issue_node_url(issue_id, with_description=depth == 0))
+            return issue_id, IssueNode.from_youtrack_data(issue_data, depth), None
+        except httpx.HTTPStatusError as e:
+            return issue_id, None, self._issue_http_error_message(issue_id, e.response.status_code, e)
+        except httpx.HTTPError as e:
+            return issue_id, None, f"Error al obtener issue {issue_id}: {str(e)}"
+        except Exception as e:
+            return issue_id, None, f"Error inesperado al obtener issue {issue_id}: {str(e)}"
+    
+    async def get_issue_graph(self, issue_id: str, depth: int = 2, max_nodes: int = 50) -> Tuple[Optional[IssueGraph], Optional[str]]:
+        """
+        Recorre en anchura las issues relacionadas con una issue (enlaces, padre y subtareas)
+        
+        Las issues de cada nivel se piden de forma concurrente, con un máximo de
+        config.max_concurrency peticiones simultáneas. Solo la raíz se pide con descripción;
+        del resto se piden título, estado, responsable y relaciones.
+        
+        Args:
+            issue_id: ID de la issue raíz
+            depth: Número máximo de saltos desde la raíz
+            max_nodes: Número máximo de issues a visitar (incluida la raíz)
+        
+        Returns:
+            Tuple[Optional[IssueGraph], Optional[str]]: Grafo obtenido y error si no se pudo obtener la raíz
+        """
+        _, root, error = await self._get_issue_node(issue_id, 0)
+        if error:
+            logger.error(error)
+            return None, error
+        
+        graph = IssueGraph(root=root, depth=depth, max_nodes=max_nodes)
+        graph.visited.add(issue_id)
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        
+        async def fetch(node_id: str, node_depth: int) -> Tuple[str, Optional[IssueNode], Optional[str]]:
+            async with semaphore:
+                return await self._get_issue_node(node_id, node_depth)
+        
+        level = [root]
+        for level_depth in range(1, depth + 1):
+            next_ids = graph.expand(level)
+            if not next_ids:
+                break
+            level = graph.add_level(await asyncio.gather(*(fetch(node_id, level_depth) for node_id in next_ids)))
+        
+        logger.debug(f"Grafo de {root.idReadable}: {len(graph.nodes)} issues, {len(graph.errors)} errores")
+        return graph, None
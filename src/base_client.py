@@ -0,0 +1,539 @@
+"""
+Lógica común a los clientes de YouTrack, independiente del transporte HTTP
+"""
+import asyncio
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, FrozenSet, List, Tuple, Optional, Dict
+from urllib.parse import quote
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import logging
+
+from .cache import BoardRegistry, IssueCache, SprintSnapshot, SprintSnapshotStore
+from .config import YouTrackConfig
+from .metrics import metrics
+from .models import Board, Comment, Issue, ExtendedIssue, IssueNode
+from .resilience import CircuitBreaker, RetryPolicy, TokenBucket
+from .search import SearchIndex
+
+logger = logging.getLogger("Youtrack MCP")
+
+# Versión del formato de los snapshots guardados en disco. La 1 guardaba los comentarios ya
+# formateados, con su antigüedad congelada; la 2 guarda autor, texto y timestamp
+SNAPSHOT_FORMAT = 2
+
+
+class YouTrackAPIError(Exception):
+    """Excepción específica para errores de la API de YouTrack"""
+    pass
+
+
+class BaseYouTrackClient:
+    """
+    Lógica común a los clientes de YouTrack: construcción de URLs, transformación
+    de respuestas y resolución de tableros. Las subclases solo implementan el transporte HTTP.
+    """
+    
+    def __init__(self, config: YouTrackConfig):
+        self.config = config
+        self.board_registry = BoardRegistry(ttl=config.board_cache_ttl)
+        self.sprint_snapshots = SprintSnapshotStore(full_sync_interval=config.snapshot_full_sync_interval)
+        self.filter_stats = {
+            "server_side_queries": 0,
+            "fallbacks": 0,
+            "issues_avoided": 0,
+            "bytes_avoided": 0
+        }
+        self.issue_cache = IssueCache(max_entries=config.issue_cache_size)
+        self.disk_cache = None
+        if config.cache_dir:
+            # sqlite3 solo se importa si se usa la caché en disco
+            from .disk_cache import DiskCache
+            self.disk_cache = DiskCache(config.cache_dir, config.cache_max_bytes)
+        self.retry_policy = RetryPolicy(config.max_retries, config.retry_backoff, config.retry_max_delay)
+        self.rate_limiter = TokenBucket(config.rate_limit, config.rate_limit_burst)
+        self.circuit_breaker = CircuitBreaker(config.circuit_failure_threshold, config.circuit_reset_timeout)
+        self.resilience_stats = {"retries": 0, "throttled": 0}
+        self.search_index = SearchIndex(max_documents=config.search_index_size)
+    
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Devuelve los contadores de las cachés del cliente
+        
+        Returns:
+            Dict[str, Dict[str, int]]: Aciertos y fallos de la caché de issues, de los snapshots
+                                       de sprint y (si están activos) de la caché de disco y
+                                       del índice de búsqueda
+        """
+        stats = {
+            "issue_cache": dict(self.issue_cache.stats),
+            "sprint_snapshots": dict(self.sprint_snapshots.stats)
+        }
+        if self.disk_cache is not None:
+            stats["disk_cache"] = self.disk_cache.get_stats()
+        if self.search_index.enabled:
+            stats["search_index"] = self.search_index.get_stats()
+        return stats
+    
+    def _index_issues(self, issues: List[Issue]) -> None:
+        """Añade al índice de búsqueda las issues recién transformadas"""
+        if not self.search_index.enabled:
+            return
+        with metrics.span("phase_duration_seconds", phase="index"):
+            for issue in issues:
+                self.search_index.add(issue)
+    
+    def get_resilience_stats(self) -> Dict[str, int]:
+        """
+        Devuelve los contadores de reintentos, limitación de ritmo y circuit breaker
+        
+        Returns:
+            Dict[str, int]: Reintentos realizados, peticiones retenidas por el limitador
+                            y estado del circuit breaker
+        """
+        return {**self.resilience_stats, **self.circuit_breaker.get_stats()}
+    
+    def _retry_delay(self, url: str, attempt: int, reason: str, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Registra un fallo transitorio y calcula la espera antes de reintentar
+        
+        Args:
+            url: URL de la petición fallida
+            attempt: Reintentos ya realizados
+            reason: Descripción del fallo para el log
+            retry_after: Segundos pedidos por YouTrack en Retry-After
+        
+        Returns:
+            Optional[float]: Segundos a esperar, o None si no se debe reintentar
+        """
+        self.circuit_breaker.record_failure()
+        delay = self.retry_policy.delay(attempt, retry_after)
+        if delay is None or self.circuit_breaker.is_open:
+            return None
+        
+        self.resilience_stats["retries"] += 1
+        logger.warning(f"Fallo transitorio en {url.split('?')[0]} ({reason}); reintento {attempt + 1} en {delay:.1f}s")
+        return delay
+    
+    def _unavailable_message(self) -> str:
+        """Mensaje de las peticiones rechazadas con el circuito abierto"""
+        return (
+            f"YouTrack no responde correctamente ({self.circuit_breaker.failure_threshold} fallos seguidos); "
+            f"se volverá a intentar en {self.circuit_breaker.reset_timeout:.0f}s"
+        )
+    
+    def _rate_limit_delay(self) -> float:
+        """Reserva un hueco en el limitador de ritmo y devuelve los segundos que hay que esperar"""
+        delay = self.rate_limiter.reserve()
+        if delay > 0:
+            self.resilience_stats["throttled"] += 1
+        return delay
+    
+    def _boards_url(self) -> str:
+        """URL para listar los tableros con su sprint actual"""
+        fields = "id,name,currentSprint(id,name)"
+        return f"{self.config.base_url}/agiles?fields={fields}"
+    
+    def _sprint_issues_url(self, board_id: str, sprint_id: str, skip: int = 0, num_comments: int = 1) -> str:
+        """URL para obtener una página de issues de un sprint"""
+        fields = self._issue_list_fields(num_comments)
+        return (
+            f"{self.config.base_url}/agiles/{board_id}/sprints/{sprint_id}/issues"
+            f"?fields={fields}&$top={self.config.page_size}&$skip={skip}"
+        )
+    
+    def _issues_query_url(self, query: str, skip: int = 0, fields: Optional[str] = None, top: Optional[int] = None) -> str:
+        """URL para obtener una página de issues (de top issues, por defecto page_size) que cumplen una consulta de YouTrack"""
+        fields = fields or Issue.get_api_fields()
+        return (
+            f"{self.config.base_url}/issues?query={quote(query)}"
+            f"&fields={fields}&$top={top or self.config.page_size}&$skip={skip}"
+        )
+    
+    def _search_query(self, text: str, board: Optional[Board] = None) -> str:
+        """Consulta de búsqueda de texto de YouTrack, restringida a las tareas en curso del sprint del tablero si se indica"""
+        return f"{self._unfinished_query(board)} {text}" if board else text
+    
+    def _issue_list_fields(self, num_comments: int) -> str:
+        """Campos de los listados de issues: con comentarios en línea salvo que se pidan aparte"""
+        count_only = num_comments > 0 and self.config.comments_subquery_threshold > 0
+        return Issue.get_api_fields(num_comments, comments_count_only=count_only)
+    
+    def _comments_url(self, issue_id: str, skip: int) -> str:
+        """URL para obtener los comentarios de una issue a partir del $skip-ésimo"""
+        return (
+            f"{self.config.base_url}/issues/{issue_id}/comments"
+            f"?fields={Issue.COMMENT_API_FIELDS}&$skip={skip}&$top=-1"
+        )
+    
+    def _comments_batch_url(self, issue_ids: List[str]) -> str:
+        """URL para obtener en una sola petición todos los comentarios de varias issues"""
+        fields = f"id,comments({Issue.COMMENT_API_FIELDS})"
+        return self._issues_query_url(self._issue_ids_query(issue_ids), fields=fields, top=len(issue_ids))
+    
+    @staticmethod
+    def _issue_ids_query(issue_ids: List[str]) -> str:
+        """Consulta de YouTrack que selecciona varias issues por su ID legible"""
+        return f"issue id: {', '.join(issue_ids)}"
+    
+    @staticmethod
+    def _query_value(value: str) -> str:
+        """Escapa un valor para el lenguaje de consultas de YouTrack (llaves si contiene espacios)"""
+        return f"{{{value}}}" if any(char.isspace() for char in value) else value
+    
+    def _sprint_query(self, board: Board) -> str:
+        """Consulta que restringe las issues al sprint actual del tablero"""
+        return f"Board {self._query_value(board.name)}: {self._query_value(board.current_sprint_name or '')}"
+    
+    def _unfinished_query(self, board: Board) -> str:
+        """Consulta de las issues del sprint actual que no están en un estado terminado"""
+        # Un término por estado: los términos separados se combinan con AND
+        excluded = " ".join(f"State: -{self._query_value(state)}" for state in self.config.finished_states)
+        return f"{self._sprint_query(board)} {excluded}"
+    
+    def _finished_query(self, board: Board) -> str:
+        """Consulta de las issues del sprint actual que están en un estado terminado"""
+        states = ", ".join(self._query_value(state) for state in self.config.finished_states)
+        return f"{self._sprint_query(board)} State: {states}"
+    
+    def _user_timezone_url(self) -> str:
+        """URL para obtener la zona horaria del usuario del token"""
+        return f"{self.config.base_url}/users/me?fields=profiles(general(timezone(id)))"
+    
+    @staticmethod
+    def _parse_user_timezone(user_data: Dict[str, Any]) -> Optional[str]:
+        """Extrae el identificador de zona horaria (ej: "Europe/Madrid") del perfil del usuario"""
+        general = (user_data.get("profiles") or {}).get("general") or {}
+        return (general.get("timezone") or {}).get("id")
+    
+    @staticmethod
+    def _format_query_datetime(timestamp_ms: int, timezone_id: Optional[str]) -> str:
+        """
+        Formatea un timestamp para usarlo en una consulta de YouTrack
+        
+        YouTrack interpreta las fechas de las consultas en la zona horaria del usuario.
+        Si no se conoce, se usa UTC retrocediendo 14 horas (el mayor desfase posible):
+        la consulta devuelve de más, pero nunca se pierde un cambio.
+        
+        Args:
+            timestamp_ms: Timestamp en milisegundos
+            timezone_id: Zona horaria del usuario en YouTrack
+            
+        Returns:
+            str: Fecha en formato YYYY-MM-DDTHH:MM:SS
+        """
+        tz = None
+        if timezone_id:
+            try:
+                tz = ZoneInfo(timezone_id)
+            except (ZoneInfoNotFoundError, ValueError):
+                tz = None
+        
+        # La consulta trabaja con segundos: se resta un minuto para incluir el propio instante
+        margin = timedelta(minutes=1) if tz else timedelta(hours=14, minutes=1)
+        moment = datetime.fromtimestamp(timestamp_ms / 1000, tz or timezone.utc) - margin
+        return moment.strftime("%Y-%m-%dT%H:%M:%S")
+    
+    def _updated_since_query(self, board: Board, timestamp_ms: int, timezone_id: Optional[str]) -> str:
+        """Consulta de las issues del sprint actual (en cualquier estado) actualizadas desde un instante"""
+        return f"{self._sprint_query(board)} updated: {self._format_query_datetime(timestamp_ms, timezone_id)} .. *"
+    
+    def _record_filter_savings(self, issues_transferred: int, bytes_transferred: int,
+                               issues_avoided: Optional[int]) -> None:
+        """
+        Acumula lo que se ha evitado descargar gracias al filtrado en servidor
+        
+        Args:
+            issues_transferred: Issues no terminadas descargadas
+            bytes_transferred: Bytes descargados para esas issues
+            issues_avoided: Issues terminadas que no se descargaron (None si no se contaron)
+        """
+        self.filter_stats["server_side_queries"] += 1
+        if not issues_avoided:
+            return
+        
+        # Los bytes evitados se estiman con el tamaño medio de las issues descargadas
+        average_issue_bytes = bytes_transferred // issues_transferred if issues_transferred else 0
+        self.filter_stats["issues_avoided"] += issues_avoided
+        self.filter_stats["bytes_avoided"] += issues_avoided * average_issue_bytes
+        logger.debug(f"Filtrado en servidor: {issues_avoided} issues terminadas evitadas ({self.filter_stats})")
+    
+    def _issue_url(self, issue_id: str, sections: Optional[FrozenSet[str]] = None) -> str:
+        """URL para obtener el detalle de una issue con las secciones indicadas (None = todas)"""
+        fields = ExtendedIssue.get_api_fields(sections)
+        return f"{self.config.base_url}/issues/{issue_id}?fields={fields}"
+    
+    def _issue_sections_url(self, issue_id: str, sections: FrozenSet[str]) -> str:
+        """URL para obtener solo algunas secciones de una issue (y su "updated" para comprobar que no cambió)"""
+        fields = ExtendedIssue.get_section_api_fields(sections)
+        return f"{self.config.base_url}/issues/{issue_id}?fields=id,updated,{fields}"
+    
+    def _issue_version_url(self, issue_id: str) -> str:
+        """URL para obtener solo el timestamp "updated" de una issue (revalidación de la caché)"""
+        return f"{self.config.base_url}/issues/{issue_id}?fields=id,updated"
+    
+    def _issue_node_url(self, issue_id: str, with_description: bool = False) -> str:
+        """URL para obtener solo los campos ligeros y las relaciones de una issue (grafo de issues)"""
+        return f"{self.config.base_url}/issues/{issue_id}?fields={IssueNode.get_api_fields(with_description)}"
+    
+    # Las operaciones de la caché en disco (SQLite) se ejecutan en un hilo con
+    # asyncio.to_thread para no bloquear el bucle de eventos
+    
+    async def _cached_issue_data(self, issue_id: str) -> Optional[Tuple[Optional[int], Dict[str, Any]]]:
+        """Devuelve el "updated" y los datos completos de una issue guardados en disco, si existen"""
+        if self.disk_cache is None:
+            return None
+        return await asyncio.to_thread(self.disk_cache.get, "issue", issue_id)
+    
+    async def _store_issue_data(self, issue_id: str, issue_data: Dict[str, Any]) -> None:
+        """Guarda en disco los datos completos de una issue junto con su timestamp updated"""
+        if self.disk_cache is not None:
+            await asyncio.to_thread(self.disk_cache.put, "issue", issue_id, issue_data, updated=issue_data.get("updated"))
+    
+    async def _load_boards_from_disk(self) -> bool:
+        """
+        Carga en el registro el listado de tableros guardado en disco si sigue dentro del TTL
+        
+        Returns:
+            bool: True si se ha cargado un listado válido
+        """
+        if self.disk_cache is None or self.board_registry.ttl <= 0:
+            return False
+        
+        cached = await asyncio.to_thread(self.disk_cache.get, "boards", "all")
+        if cached is None or cached[0] is None:
+            return False
+        
+        age = time.time() - cached[0] / 1000
+        if age >= self.board_registry.ttl:
+            return False
+        
+        self.board_registry.update([Board(**board_data) for board_data in cached[1]], age=age)
+        logger.debug(f"Listado de tableros recuperado de la caché de disco ({age:.0f}s de antigüedad)")
+        return True
+    
+    @staticmethod
+    def _snapshot_cache_key(key: Tuple[str, str, int]) -> str:
+        """Clave en disco del snapshot de un sprint"""
+        return ":".join(str(part) for part in key)
+    
+    async def _persist_snapshot(self, key: Tuple[str, str, int], snapshot: SprintSnapshot) -> None:
+        """Guarda en disco el snapshot de un sprint para recuperarlo tras un reinicio"""
+        if self.disk_cache is None:
+            return
+        
+        full_sync_age = time.monotonic() - snapshot.full_synced_at
+        payload = {
+            "format": SNAPSHOT_FORMAT,
+            "issues": [asdict(issue) for issue in snapshot.issues.values()],
+            "full_synced_at": time.time() - full_sync_age
+        }
+        await asyncio.to_thread(self.disk_cache.put, "sprint", self._snapshot_cache_key(key), payload,
+                                updated=snapshot.max_updated)
+    
+    @staticmethod
+    def _issue_from_snapshot(issue_data: Dict[str, Any]) -> Issue:
+        """Reconstruye una issue guardada con asdict (los comentarios quedan como diccionarios)"""
+        comments = issue_data.get("comments")
+        if comments is not None:
+            issue_data = {**issue_data, "comments": [Comment(**comment) for comment in comments]}
+        return Issue(**issue_data)
+    
+    async def _restore_snapshot(self, key: Tuple[str, str, int]) -> Optional[SprintSnapshot]:
+        """
+        Recupera de disco el snapshot de un sprint que no está en memoria
+        
+        Returns:
+            Optional[SprintSnapshot]: Snapshot recuperado, o None si no hay ninguno guardado
+        """
+        if self.disk_cache is None:
+            return None
+        
+        cached = await asyncio.to_thread(self.disk_cache.get, "sprint", self._snapshot_cache_key(key))
+        if cached is None or cached[0] is None:
+            return None
+        
+        max_updated, payload = cached
+        try:
+            if payload.get("format") != SNAPSHOT_FORMAT:
+                raise TypeError(f"formato {payload.get('format', 1)}")
+            issues = [self._issue_from_snapshot(issue_data) for issue_data in payload["issues"]]
+        except (KeyError, TypeError, AttributeError) as e:
+            # Formato de una versión anterior: se descarta y se sincroniza por completo
+            logger.debug(f"Snapshot del sprint {key[1]} en disco descartado ({str(e)})")
+            await asyncio.to_thread(self.disk_cache.delete, "sprint", self._snapshot_cache_key(key))
+            return None
+        
+        full_sync_age = max(time.time() - payload.get("full_synced_at", 0), 0)
+        logger.debug(f"Snapshot del sprint {key[1]} recuperado de la caché de disco ({len(issues)} issues)")
+        self._index_issues(issues)
+        return self.sprint_snapshots.restore(key, issues, max_updated, full_sync_age)
+    
+    async def invalidate(self, issue_id: Optional[str] = None, board_id: Optional[str] = None,
+                   sprint_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        Descarta de las cachés en memoria y en disco los datos afectados por un cambio en YouTrack
+
+        Pensado para las notificaciones de cambios (webhooks): con ellas las cachés pueden
+        usar TTL largos sin servir datos obsoletos, ya que la siguiente consulta de lo
+        descartado vuelve a pedirlo a YouTrack.
+
+        Args:
+            issue_id: Issue modificada (ID interno o legible): se descartan su detalle y los
+                      snapshots de sprint que la contienen
+            board_id: Tablero modificado: se descartan sus snapshots y el listado de tableros
+            sprint_id: Sprint modificado o iniciado: se descartan sus snapshots y el listado de tableros
+
+        Returns:
+            Dict[str, int]: Número de issues, snapshots de sprint y listados de tableros descartados
+        """
+        counts = {"issues": 0, "sprints": 0, "boards": 0}
+        issue_ids = []
+
+        if issue_id:
+            issue_ids = self.issue_cache.evict(issue_id)
+            counts["issues"] = 1 if issue_ids else 0
+
+        snapshot_keys = self.sprint_snapshots.evict(board_id, sprint_id, issue_id)
+        counts["sprints"] = len(snapshot_keys)
+        sprint_prefixes = [f"{board_id}:"] if board_id else []
+        if sprint_id:
+            sprint_prefixes += [
+                f"{board.id}:{sprint_id}:" for board in self.board_registry.boards
+                if board.current_sprint_id == sprint_id
+            ]
+
+        if board_id or sprint_id:
+            # Un cambio de tablero o de sprint puede cambiar su nombre o el sprint actual
+            self.board_registry.invalidate()
+            counts["boards"] = 1
+
+        if self.disk_cache is not None:
+            def drop_from_disk() -> None:
+                if issue_id:
+                    for cached_id in set(issue_ids) | {issue_id}:
+                        self.disk_cache.delete("issue", cached_id)
+                for key in snapshot_keys:
+                    self.disk_cache.delete("sprint", self._snapshot_cache_key(key))
+                for prefix in sprint_prefixes:
+                    self.disk_cache.delete_prefix("sprint", prefix)
+                if board_id or sprint_id:
+                    self.disk_cache.delete("boards", "all")
+
+            await asyncio.to_thread(drop_from_disk)
+
+        logger.info(
+            f"Caché invalidada (issue={issue_id or '-'}, tablero={board_id or '-'}, sprint={sprint_id or '-'}): "
+            f"{counts['issues']} issues, {counts['sprints']} snapshots de sprint, {counts['boards']} listados de tableros"
+        )
+        return counts
+
+    @staticmethod
+    def _parse_boards(boards_data: List[Dict[str, Any]]) -> List[Board]:
+        """
+        Transforma la respuesta de /agiles en tableros
+        
+        Args:
+            boards_data: Lista de tableros en formato JSON de YouTrack
+        
+        Returns:
+            List[Board]: Tableros con su sprint actual (si lo tienen)
+        """
+        boards = []
+        
+        for board_data in boards_data:
+            current_sprint = board_data.get('currentSprint')
+            board = Board(
+                id=board_data['id'],
+                name=board_data['name'],
+                current_sprint_id=current_sprint['id'] if current_sprint else None,
+                current_sprint_name=current_sprint['name'] if current_sprint else None
+            )
+            boards.append(board)
+        
+        return boards
+    
+    async def _register_boards(self, boards: List[Board]) -> None:
+        """Actualiza el registro de tableros con un listado recién obtenido"""
+        self.board_registry.update(boards)
+        if self.disk_cache is not None:
+            await asyncio.to_thread(self.disk_cache.put, "boards", "all", [asdict(board) for board in boards],
+                                    updated=int(time.time() * 1000))
+        
+        # Log de tableros disponibles
+        logger.info("Tableros disponibles:")
+        for board in boards:
+            logger.info(f"{board.id} - {board.name} con sprint: {board.current_sprint_name or 'N/A'}")
+    
+    def _select_board(self, name: str, matching_boards: List[Board]) -> Tuple[Optional[Board], Optional[str]]:
+        """
+        Elige el tablero a partir de las coincidencias por nombre
+        
+        Args:
+            name: Nombre buscado
+            matching_boards: Tableros cuyo nombre coincide
+        
+        Returns:
+            Tuple[Optional[Board], Optional[str]]: Tablero encontrado y error si existe
+        """
+        if not matching_boards:
+            available_boards = [b.name for b in self.board_registry.boards]
+            error_msg = f"No se encontró ningún tablero con el nombre '{name}'. Tableros disponibles: {', '.join(available_boards)}"
+            return None, error_msg
+        
+        if len(matching_boards) > 1:
+            board_names = [b.name for b in matching_boards]
+            error_msg = f"Se encontraron múltiples tableros con el nombre '{name}': {', '.join(board_names)}"
+            return None, error_msg
+        
+        return matching_boards[0], None
+    
+    async def _needs_boards_reload(self, names: List[str]) -> bool:
+        """
+        Indica si hay que pedir el listado de tableros para resolver varios nombres a la vez
+        
+        Args:
+            names: Nombres a resolver (vacío = todos los tableros)
+        
+        Returns:
+            bool: True si el registro caducó o le falta alguno de los nombres (tras intentar
+                  recuperarlo de disco o, con YouTrack caído, aceptar el listado caducado)
+        """
+        def stale() -> bool:
+            if not names:
+                return not self.board_registry.is_fresh
+            return any(self.board_registry.lookup(name) is None for name in names)
+        
+        if not stale():
+            return False
+        if not self.board_registry.boards and await self._load_boards_from_disk() and not stale():
+            return False
+        if self.circuit_breaker.is_open and self.board_registry.boards:
+            logger.warning("YouTrack no disponible: se usa el listado de tableros en caché")
+            return False
+        return True
+    
+    def _resolve_board_names(self, names: List[str]) -> List[Tuple[str, Optional[Board], Optional[str]]]:
+        """
+        Resuelve varios nombres contra el registro de tableros ya cargado
+        
+        Args:
+            names: Nombres a resolver (vacío = todos los tableros del registro)
+        
+        Returns:
+            List[Tuple[str, Optional[Board], Optional[str]]]: Por cada nombre (en el mismo orden),
+                el nombre, el tablero encontrado y el error si existe
+        """
+        if not names:
+            return [(board.name, board, None) for board in self.board_registry.boards]
+        return [(name, *self._select_board(name, self.board_registry.matches(name))) for name in names]
+    
+    @staticmethod
+    def _issue_http_error_message(issue_id: str, status_code: Optional[int], error: Exception) -> str:
+        """Traduce un error HTTP al obtener una issue a un mensaje legible"""
+        if status_code == 404:
+            return f"No se encontró la issue con ID '{issue_id}'"
+        if status_code == 403:
+            return f"Sin permisos para acceder a la issue '{issue_id}'"
+        return f"Error HTTP al obtener issue {issue_id}: {str(error)}"
@@ -0,0 +1,393 @@
+"""
+Cachés en memoria para datos de YouTrack
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Optional
+
+from .models import Board, ExtendedIssue, Issue
+
+
+class BoardRegistry:
+    """Índice en memoria de tableros por nombre con expiración (TTL)"""
+    
+    def __init__(self, ttl: int = 300):
+        """
+        Inicializa el registro de tableros
+        
+        Args:
+            ttl: Segundos que se considera válido el listado de tableros (0 = sin caché)
+        """
+        self.ttl = ttl
+        self._boards: List[Board] = []
+        self._index: Dict[str, List[Board]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _normalize(name: str) -> str:
+        """Normaliza un nombre de tablero para búsquedas case-insensitive"""
+        return name.strip().lower()
+    
+    @property
+    def is_fresh(self) -> bool:
+        """Indica si el listado de tableros sigue dentro del TTL"""
+        if self._loaded_at is None or self.ttl <= 0:
+            return False
+        return time.monotonic() - self._loaded_at < self.ttl
+    
+    @property
+    def boards(self) -> List[Board]:
+        """Devuelve el último listado de tableros cargado"""
+        return list(self._boards)
+    
+    def update(self, boards: List[Board], age: float = 0.0) -> None:
+        """
+        Reemplaza el listado de tableros y reconstruye el índice por nombre
+        
+        Args:
+            boards: Tableros obtenidos de YouTrack
+            age: Segundos transcurridos desde que se obtuvo el listado (ej: si viene de disco)
+        """
+        index: Dict[str, List[Board]] = {}
+        for board in boards:
+            index.setdefault(self._normalize(board.name), []).append(board)
+        
+        with self._lock:
+            self._boards = list(boards)
+            self._index = index
+            self._loaded_at = time.monotonic() - age
+    
+    def lookup(self, name: str) -> Optional[List[Board]]:
+        """
+        Busca tableros por nombre en el índice
+        
+        Args:
+            name: Nombre del tablero (case-insensitive)
+        
+        Returns:
+            Optional[List[Board]]: Tableros con ese nombre, o None si el índice
+                                   está caducado o no contiene el nombre
+        """
+        with self._lock:
+            if not self.is_fresh:
+                return None
+            return self._index.get(self._normalize(name))
+    
+    def matches(self, name: str) -> List[Board]:
+        """
+        Devuelve los tableros con ese nombre del último listado cargado, sin comprobar el TTL
+        
+        Args:
+            name: Nombre del tablero (case-insensitive)
+        """
+        with self._lock:
+            return list(self._index.get(self._normalize(name), []))
+    
+    def invalidate(self) -> None:
+        """Marca el listado como caducado para forzar una recarga en la próxima búsqueda"""
+        with self._lock:
+            self._loaded_at = None
+
+
+@dataclass
+class SprintSnapshot:
+    """Copia local de las issues en curso de un sprint"""
+    issues: Dict[str, Issue] = field(default_factory=dict)  # Issues en curso por id interno
+    max_updated: Optional[int] = None  # Mayor timestamp "updated" visto (ms)
+    full_synced_at: float = 0.0  # Instante (monotonic) de la última sincronización completa
+    synced_at: float = 0.0  # Instante (monotonic) de la última sincronización
+
+
+class SprintSnapshotStore:
+    """
+    Snapshots por sprint para sincronizar solo las issues modificadas
+    
+    Tras una sincronización completa, las siguientes solo piden a YouTrack las issues
+    actualizadas desde el mayor "updated" visto y las fusionan. Cada full_sync_interval
+    segundos se vuelve a sincronizar por completo para detectar issues eliminadas o
+    sacadas del sprint.
+    """
+    
+    def __init__(self, full_sync_interval: int = 600):
+        """
+        Inicializa el almacén de snapshots
+        
+        Args:
+            full_sync_interval: Segundos entre sincronizaciones completas (0 = sin snapshots)
+        """
+        self.full_sync_interval = full_sync_interval
+        self.stats = {"full_syncs": 0, "delta_syncs": 0, "delta_issues": 0}
+        self._snapshots: Dict[Hashable, SprintSnapshot] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        """Indica si se usan snapshots incrementales"""
+        return self.full_sync_interval > 0
+    
+    def get(self, key: Hashable) -> Optional[SprintSnapshot]:
+        """Devuelve el snapshot de un sprint, si existe"""
+        with self._lock:
+            return self._snapshots.get(key)
+    
+    def find(self, board_id: str, sprint_id: str) -> Optional[SprintSnapshot]:
+        """
+        Devuelve el snapshot sincronizado más recientemente de un sprint, con cualquier número de comentarios
+        
+        Args:
+            board_id: ID del tablero
+            sprint_id: ID del sprint
+        """
+        with self._lock:
+            snapshots = [
+                snapshot for key, snapshot in self._snapshots.items()
+                if key[0] == board_id and key[1] == sprint_id
+            ]
+        return max(snapshots, key=lambda snapshot: snapshot.synced_at, default=None)
+    
+    def needs_full_sync(self, snapshot: Optional[SprintSnapshot]) -> bool:
+        """
+        Indica si hay que descargar el sprint completo en lugar de solo los cambios
+        
+        Args:
+            snapshot: Snapshot actual del sprint (None si no existe)
+        """
+        if snapshot is None or snapshot.max_updated is None:
+            return True
+        return time.monotonic() - snapshot.full_synced_at >= self.full_sync_interval
+    
+    def replace(self, key: Hashable, issues: Iterable[Issue]) -> SprintSnapshot:
+        """
+        Guarda el resultado de una sincronización completa
+        
+        Args:
+            key: Identificador del sprint
+            issues: Issues en curso del sprint
+        
+        Returns:
+            SprintSnapshot: Nuevo snapshot del sprint
+        """
+        now = time.monotonic()
+        snapshot = SprintSnapshot(full_synced_at=now, synced_at=now)
+        for issue in issues:
+            snapshot.issues[issue.id] = issue
+            snapshot.max_updated = _max_updated(snapshot.max_updated, issue.updated)
+        
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self.stats["full_syncs"] += 1
+        return snapshot
+    
+    def restore(self, key: Hashable, issues: Iterable[Issue], max_updated: Optional[int],
+                full_sync_age: float) -> SprintSnapshot:
+        """
+        Recupera un snapshot guardado previamente (ej: en la caché de disco)
+        
+        Args:
+            key: Identificador del sprint
+            issues: Issues en curso del snapshot
+            max_updated: Mayor timestamp "updated" del snapshot (ms)
+            full_sync_age: Segundos transcurridos desde su última sincronización completa
+        
+        Returns:
+            SprintSnapshot: Snapshot recuperado
+        """
+        now = time.monotonic()
+        snapshot = SprintSnapshot(
+            issues={issue.id: issue for issue in issues},
+            max_updated=max_updated,
+            full_synced_at=now - full_sync_age,
+            synced_at=now - full_sync_age
+        )
+        
+        with self._lock:
+            self._snapshots[key] = snapshot
+        return snapshot
+    
+    def merge(self, key: Hashable, changed: Iterable[Issue], finished_states: List[str]) -> Optional[SprintSnapshot]:
+        """
+        Fusiona en el snapshot las issues modificadas desde la última sincronización
+        
+        Las issues que han pasado a un estado terminado se eliminan del snapshot.
+        
+        Args:
+            key: Identificador del sprint
+            changed: Issues del sprint actualizadas (en cualquier estado)
+            finished_states: Estados considerados como terminados
+        
+        Returns:
+            Optional[SprintSnapshot]: Snapshot actualizado, o None si no existía
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                return None
+            
+            self.stats["delta_syncs"] += 1
+            for issue in changed:
+                self.stats["delta_issues"] += 1
+                if issue.is_finished(finished_states):
+                    snapshot.issues.pop(issue.id, None)
+                else:
+                    snapshot.issues[issue.id] = issue
+                snapshot.max_updated = _max_updated(snapshot.max_updated, issue.updated)
+            
+            snapshot.synced_at = time.monotonic()
+            return snapshot
+    
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Descarta un snapshot (o todos) para forzar una sincronización completa
+        
+        Args:
+            key: Identificador del sprint, o None para descartar todos
+        """
+        with self._lock:
+            if key is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(key, None)
+    
+    def evict(self, board_id: Optional[str] = None, sprint_id: Optional[str] = None,
+              issue_id: Optional[str] = None) -> List[Hashable]:
+        """
+        Descarta los snapshots afectados por un cambio en YouTrack
+        
+        Args:
+            board_id: Tablero modificado: se descartan todos sus snapshots
+            sprint_id: Sprint modificado: se descartan sus snapshots
+            issue_id: Issue modificada (ID interno o legible): se descartan los snapshots que la contienen
+        
+        Returns:
+            List[Hashable]: Claves (tablero, sprint, comentarios) de los snapshots descartados
+        """
+        def affected(key: Hashable, snapshot: SprintSnapshot) -> bool:
+            if board_id is not None and key[0] == board_id:
+                return True
+            if sprint_id is not None and key[1] == sprint_id:
+                return True
+            return issue_id is not None and (
+                issue_id in snapshot.issues
+                or any(issue.idReadable == issue_id for issue in snapshot.issues.values())
+            )
+        
+        with self._lock:
+            keys = [key for key, snapshot in self._snapshots.items() if affected(key, snapshot)]
+            for key in keys:
+                del self._snapshots[key]
+        return keys
+
+
+class IssueCache:
+    """
+    Caché LRU en memoria de issues detalladas ya transformadas
+    
+    Las entradas no caducan por tiempo: quien las usa debe revalidarlas comparando su
+    "updated" con el actual de YouTrack antes de darlas por buenas.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        """
+        Inicializa la caché de issues
+        
+        Args:
+            max_entries: Número máximo de issues guardadas (0 = sin caché)
+        """
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+        self._issues: "OrderedDict[str, ExtendedIssue]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        """Indica si la caché guarda issues"""
+        return self.max_entries > 0
+    
+    def get(self, issue_id: str) -> Optional[ExtendedIssue]:
+        """
+        Devuelve la issue guardada con ese ID (sin revalidar), o None si no está
+        
+        Args:
+            issue_id: ID con el que se pidió la issue
+        """
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            issue = self._issues.get(issue_id)
+            if issue is None:
+                self.stats["misses"] += 1
+            return issue
+    
+    def confirm(self, issue_id: str) -> None:
+        """Registra que la issue guardada sigue vigente y la marca como usada recientemente"""
+        with self._lock:
+            if issue_id in self._issues:
+                self._issues.move_to_end(issue_id)
+                self.stats["hits"] += 1
+    
+    def put(self, issue_id: str, issue: ExtendedIssue) -> None:
+        """
+        Guarda (o reemplaza) una issue y expulsa las menos usadas si se supera el límite
+        
+        Args:
+            issue_id: ID con el que se pidió la issue
+            issue: Issue detallada
+        """
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            if issue_id in self._issues:
+                self.stats["stale"] += 1
+            self._issues[issue_id] = issue
+            self._issues.move_to_end(issue_id)
+            while len(self._issues) > self.max_entries:
+                self._issues.popitem(last=False)
+                self.stats["evictions"] += 1
+    
+    def invalidate(self, issue_id: Optional[str] = None) -> None:
+        """
+        Descarta una issue (o todas)
+        
+        Args:
+            issue_id: ID de la issue, o None para vaciar la caché
+        """
+        with self._lock:
+            if issue_id is None:
+                self._issues.clear()
+            else:
+                self._issues.pop(issue_id, None)
+    
+    def evict(self, issue_id: str) -> List[str]:
+        """
+        Descarta una issue guardada con cualquiera de sus IDs
+        
+        Args:
+            issue_id: ID interno o legible de la issue
+        
+        Returns:
+            List[str]: IDs (con los que se pidió, interno y legible) de las entradas descartadas
+        """
+        with self._lock:
+            keys = [
+                key for key, issue in self._issues.items()
+                if issue_id in (key, issue.id, issue.idReadable)
+            ]
+            evicted = set()
+            for key in keys:
+                issue = self._issues.pop(key)
+                evicted.update((key, issue.id, issue.idReadable))
+        return sorted(evicted)
+
+
+def _max_updated(current: Optional[int], updated: Optional[str]) -> Optional[int]:
+    """Devuelve el mayor entre el timestamp actual y el "updated" (ms) de una issue"""
+    try:
+        value = int(updated)
+    except (TypeError, ValueError):
+        return current
+    return value if current is None else max(current, value)
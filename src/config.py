@@ -5,14 +5,26 @@ import os
 import logging
 from typing import Optional, List
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Youtrack MCP")
 
 class YouTrackConfig:
     """Configuración para el cliente de YouTrack"""
     
-    def __init__(self, timeout: int = 30, finished_states: Optional[List[str]] = None):
+    def __init__(self, timeout: int = 30, finished_states: Optional[List[str]] = None,
+                 pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True,
+                 board_cache_ttl: int = 300, max_concurrency: int = 8,
+                 page_size: int = 100, server_side_filter: bool = True,
+                 count_filtered_issues: bool = False,
+                 comments_subquery_threshold: int = 20,
+                 snapshot_full_sync_interval: int = 600, cache_dir: Optional[str] = None,
+                 cache_max_mb: int = 100, issue_cache_size: int = 256,
+                 extra_fields: Optional[List[str]] = None, max_retries: int = 3,
+                 retry_backoff: float = 0.5, retry_max_delay: float = 10.0,
+                 rate_limit: float = 0.0, rate_limit_burst: int = 10,
+                 circuit_failure_threshold: int = 5, circuit_reset_timeout: float = 30.0,
+                 webhook_secret: Optional[str] = None, watch_boards: Optional[List[str]] = None,
+                 refresh_interval: float = 60.0, refresh_jitter: float = 0.1,
+                 refresh_idle_timeout: float = 3600.0, search_index_size: int = 10000):
         """
         Inicializa la configuración de YouTrack
         
@@ -20,6 +32,60 @@ class YouTrackConfig:
             timeout: Timeout para requests HTTP en segundos (default: 30)
             finished_states: Lista de estados considerados como terminados 
                            (default: ["Fixed", "Verified"])
+            pool_maxsize: Máximo de conexiones abiertas por host (default: 10)
+            pool_block: Si es True, espera a que haya una conexión libre en lugar de
+                        abrir conexiones extra por encima de pool_maxsize (default: False)
+            keep_alive: Reutilizar conexiones entre peticiones (default: True)
+            board_cache_ttl: Segundos que se reutiliza el listado de tableros antes de
+                             volver a pedirlo a YouTrack, 0 para desactivar (default: 300)
+            max_concurrency: Máximo de peticiones simultáneas a YouTrack en operaciones
+                             por lotes (default: 8)
+            page_size: Número de issues por página al recorrer un sprint (default: 100)
+            server_side_filter: Excluir los estados terminados en la consulta a YouTrack
+                                en lugar de descargarlos y filtrarlos localmente (default: True)
+            count_filtered_issues: Contar con una consulta adicional las issues terminadas que
+                                   evita el filtrado en servidor, para las estadísticas (default: False)
+            comments_subquery_threshold: Comentarios a partir de los cuales una issue de un
+                                         listado pide aparte solo sus últimos comentarios; el
+                                         resto de la página los recibe en una única petición.
+                                         0 para incluirlos siempre en la página (default: 20)
+            snapshot_full_sync_interval: Segundos entre descargas completas de un sprint; entre
+                                         ellas solo se piden las issues actualizadas, 0 para
+                                         descargar siempre el sprint completo (default: 600)
+            cache_dir: Directorio de la caché persistente en disco; si no se indica se usa
+                       YOUTRACK_CACHE_DIR y, si tampoco existe, la caché queda desactivada
+            cache_max_mb: Tamaño máximo de la caché en disco en MB (default: 100)
+            issue_cache_size: Número de issues detalladas que se mantienen en memoria para
+                              revalidarlas en lugar de descargarlas, 0 para desactivar (default: 256)
+            extra_fields: Custom fields adicionales de YouTrack que se extraen de cada issue
+                          (ej: ["Story points", "Component"]) (default: ninguno)
+            max_retries: Reintentos de una petición ante errores de red, timeouts y estados
+                         429/5xx, 0 para desactivar (default: 3)
+            retry_backoff: Espera base en segundos entre reintentos; se duplica en cada
+                           reintento y se le añade jitter (default: 0.5)
+            retry_max_delay: Espera máxima en segundos entre reintentos; si YouTrack pide
+                             en Retry-After esperar más, no se reintenta (default: 10)
+            rate_limit: Máximo de peticiones por segundo a YouTrack, 0 para no limitar (default: 0)
+            rate_limit_burst: Peticiones que pueden enviarse seguidas antes de aplicar
+                              rate_limit (default: 10)
+            circuit_failure_threshold: Fallos consecutivos tras los que se deja de llamar a
+                                       YouTrack durante circuit_reset_timeout, 0 para
+                                       desactivar (default: 5)
+            circuit_reset_timeout: Segundos sin llamar a YouTrack tras abrirse el circuito
+                                   antes de probar de nuevo (default: 30)
+            webhook_secret: Token que deben enviar las notificaciones de cambios de YouTrack;
+                            si no se indica se usa YOUTRACK_WEBHOOK_SECRET y, si tampoco
+                            existe, no se exige token
+            watch_boards: Tableros cuyo sprint se refresca en segundo plano; si no se indican
+                          se usa YOUTRACK_WATCH_BOARDS (nombres separados por comas) y, si
+                          tampoco existe, no se refresca ninguno
+            refresh_interval: Segundos entre refrescos de los tableros vigilados (default: 60)
+            refresh_jitter: Fracción del intervalo que se suma o resta al azar a cada espera
+                            para no coincidir con otros procesos (default: 0.1)
+            refresh_idle_timeout: Segundos sin que se pida un tablero vigilado tras los que deja
+                                  de refrescarse, 0 para refrescarlo siempre (default: 3600)
+            search_index_size: Número máximo de issues en el índice de búsqueda local,
+                               0 para desactivarlo (default: 10000)
         """
         # Variables de entorno requeridas
         self.base_url: Optional[str] = os.getenv('YOUTRACK_BASE_URL')
@@ -29,6 +95,59 @@ class YouTrackConfig:
         self.timeout = timeout
         self.finished_states = finished_states or ["Fixed", "Verified"]
         
+        # Pool de conexiones HTTP
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        
+        # Caché del listado de tableros
+        self.board_cache_ttl = board_cache_ttl
+        
+        # Concurrencia de las operaciones por lotes
+        self.max_concurrency = max(1, max_concurrency)
+        
+        # Paginación de listados de issues
+        self.page_size = max(1, page_size)
+        self.server_side_filter = server_side_filter
+        self.count_filtered_issues = count_filtered_issues
+        self.comments_subquery_threshold = max(0, comments_subquery_threshold)
+        
+        # Sincronización incremental de sprints
+        self.snapshot_full_sync_interval = snapshot_full_sync_interval
+        
+        # Caché persistente en disco (opcional)
+        self.cache_dir: Optional[str] = cache_dir or os.getenv('YOUTRACK_CACHE_DIR')
+        self.cache_max_bytes = max(1, cache_max_mb) * 1024 * 1024
+        
+        # Caché en memoria de issues detalladas
+        self.issue_cache_size = max(0, issue_cache_size)
+        
+        # Custom fields adicionales
+        self.extra_fields = extra_fields or []
+        
+        # Resiliencia: reintentos, limitación de ritmo y circuit breaker
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = max(0.0, retry_backoff)
+        self.retry_max_delay = max(0.0, retry_max_delay)
+        self.rate_limit = max(0.0, rate_limit)
+        self.rate_limit_burst = max(1, rate_limit_burst)
+        self.circuit_failure_threshold = max(0, circuit_failure_threshold)
+        self.circuit_reset_timeout = max(0.0, circuit_reset_timeout)
+        
+        # Notificaciones de cambios (webhooks)
+        self.webhook_secret: Optional[str] = webhook_secret or os.getenv('YOUTRACK_WEBHOOK_SECRET')
+        
+        # Refresco en segundo plano de tableros vigilados
+        self.watch_boards = watch_boards or [
+            name.strip() for name in os.getenv('YOUTRACK_WATCH_BOARDS', '').split(',') if name.strip()
+        ]
+        self.refresh_interval = max(1.0, refresh_interval)
+        self.refresh_jitter = min(max(0.0, refresh_jitter), 1.0)
+        self.refresh_idle_timeout = max(0.0, refresh_idle_timeout)
+        
+        # Índice de búsqueda local
+        self.search_index_size = max(0, search_index_size)
+        
         # Validar configuración
         self._validate_config()
         
@@ -49,10 +168,16 @@ class YouTrackConfig:
         if not self.api_token:
             return {}
         
-        return {
+        headers = {
             "Authorization": f"Bearer {self.api_token}",
             "Accept": "application/json"
         }
+        
+        # Sin keep-alive el servidor cierra la conexión tras cada respuesta
+        if not self.keep_alive:
+            headers["Connection"] = "close"
+        
+        return headers
     
     @property
     def is_configured(self) -> bool:
@@ -0,0 +1,191 @@
+"""
+Caché persistente en disco para datos de YouTrack
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("Youtrack MCP")
+
+
+class DiskCache:
+    """
+    Caché en SQLite que sobrevive a reinicios del servidor
+
+    Guarda payloads JSON por espacio de nombres y clave, junto con su timestamp
+    "updated" para poder revalidarlos contra YouTrack. Cuando el tamaño total supera
+    max_bytes se expulsan las entradas usadas hace más tiempo (LRU).
+
+    Las lecturas no escriben en la base de datos: el último acceso de cada entrada se
+    anota en memoria y se vuelca por lotes (en la siguiente escritura, cada
+    ACCESS_FLUSH_SIZE lecturas distintas o ACCESS_FLUSH_INTERVAL segundos, y al cerrar).
+    """
+
+    FILENAME = "youtrack_cache.sqlite3"
+    ACCESS_FLUSH_SIZE = 64
+    ACCESS_FLUSH_INTERVAL = 30.0
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Abre (o crea) la caché en un directorio
+
+        Args:
+            directory: Directorio donde se guarda el fichero de la caché
+            max_bytes: Tamaño máximo de los payloads almacenados
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.FILENAME)
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._pending_access: Dict[Tuple[str, str], float] = {}
+        self._flushed_at = time.monotonic()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " updated INTEGER,"
+            " payload TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " accessed REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._conn.commit()
+
+    def get(self, namespace: str, key: str) -> Optional[Tuple[Optional[int], Any]]:
+        """
+        Obtiene una entrada y la marca como usada recientemente
+
+        Args:
+            namespace: Tipo de dato (ej: "issue", "boards", "sprint")
+            key: Clave dentro del espacio de nombres
+
+        Returns:
+            Optional[Tuple[Optional[int], Any]]: Timestamp "updated" y payload, o None si no existe
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated, payload FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["hits"] += 1
+            self._pending_access[(namespace, key)] = time.time()
+            if (len(self._pending_access) >= self.ACCESS_FLUSH_SIZE
+                    or time.monotonic() - self._flushed_at >= self.ACCESS_FLUSH_INTERVAL):
+                self._flush_access()
+                self._conn.commit()
+
+        try:
+            return row[0], json.loads(row[1])
+        except ValueError:
+            logger.warning(f"Entrada corrupta en la caché de disco: {namespace}/{key}")
+            self.delete(namespace, key)
+            return None
+
+    def put(self, namespace: str, key: str, payload: Any, updated: Optional[int] = None) -> None:
+        """
+        Guarda (o reemplaza) una entrada y aplica el límite de tamaño
+
+        Args:
+            namespace: Tipo de dato (ej: "issue", "boards", "sprint")
+            key: Clave dentro del espacio de nombres
+            payload: Datos serializables a JSON
+            updated: Timestamp "updated" de los datos (ms), si lo tienen
+        """
+        serialized = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, updated, payload, size, accessed)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, updated, serialized, len(serialized.encode()), time.time())
+            )
+            self._pending_access.pop((namespace, key), None)
+            self.stats["writes"] += 1
+            # Los accesos pendientes se vuelcan antes de expulsar para respetar el orden LRU
+            self._flush_access()
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, namespace: str, key: Optional[str] = None) -> None:
+        """
+        Elimina una entrada, o todas las de un espacio de nombres
+
+        Args:
+            namespace: Tipo de dato
+            key: Clave a eliminar, o None para vaciar el espacio de nombres
+        """
+        with self._lock:
+            if key is None:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            else:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+            self._conn.commit()
+
+    def delete_prefix(self, namespace: str, prefix: str) -> int:
+        """
+        Elimina las entradas de un espacio de nombres cuya clave empieza por un prefijo
+
+        Args:
+            namespace: Tipo de dato
+            prefix: Prefijo de las claves a eliminar (ej: "120-1:" para los snapshots de un tablero)
+
+        Returns:
+            int: Número de entradas eliminadas
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND substr(key, 1, ?) = ?",
+                (namespace, len(prefix), prefix)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def _flush_access(self) -> None:
+        """Vuelca a la base de datos los últimos accesos anotados en memoria (requiere el lock, sin commit)"""
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?",
+                [(accessed, namespace, key) for (namespace, key), accessed in self._pending_access.items()]
+            )
+            self._pending_access.clear()
+        self._flushed_at = time.monotonic()
+
+    def _evict(self) -> None:
+        """Expulsa las entradas menos usadas hasta respetar max_bytes (requiere el lock)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT namespace, key, size FROM entries ORDER BY accessed").fetchall()
+        for namespace, key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+            total -= size
+            self.stats["evictions"] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Devuelve los contadores de uso y el tamaño actual de la caché"""
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {**self.stats, "entries": entries, "bytes": size}
+
+    def close(self) -> None:
+        """Vuelca los accesos pendientes y cierra la conexión con la base de datos"""
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+            self._conn.close()
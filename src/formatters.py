@@ -1,156 +1,556 @@
 """
 Formateadores para generar salidas en diferentes formatos
 """
-from typing import List, Dict, Any
-from .models import Issue, ExtendedIssue
-from .utils import _calculate_time_elapsed
+import time
+from typing import AbstractSet, AsyncIterable, AsyncIterator, Awaitable, Iterable, Iterator, List, Dict, Any, Optional, Tuple
+from .metrics import metrics
+from .models import Board, Comment, Issue, ExtendedIssue, IssueGraph, SprintMetrics
+from .search import SearchResult
+from .utils import _calculate_time_elapsed, _format_minutes
 
 
 class MarkdownFormatter:
     """Formateador para generar markdown"""
     
+    TASKS_TABLE_HEADER = (
+        "| Internal ID - User Id | Título | Responsable | Estado | Estimación | Tiempo gastado | Última actualización | Comentarios |\n"
+        "|-----------------------|--------|------------|---------|------------|----------------|----------------------|-------------|\n"
+    )
+    TASKS_REPORT_HEADER = "# Tareas en curso\n\n" + TASKS_TABLE_HEADER
+    EMPTY_TASKS_REPORT = "# Tareas en curso\n\nNo hay tareas en curso."
+    
+    @staticmethod
+    def format_comment(comment: Comment) -> str:
+        """
+        Genera el texto de un comentario con su antigüedad calculada en este momento
+        
+        Args:
+            comment: Comentario a formatear
+            
+        Returns:
+            str: "Autor: texto (hace ...)"
+        """
+        elapsed = _calculate_time_elapsed(comment.created) if comment.created else "Desconocido"
+        return f"{comment.author}: {comment.text} ({elapsed})"
+    
+    @staticmethod
+    def format_task_row(task: Issue) -> str:
+        """
+        Genera la fila de la tabla de tareas para una issue
+        
+        Args:
+            task: Issue a formatear
+            
+        Returns:
+            str: Fila de la tabla en markdown (terminada en salto de línea)
+        """
+        assignee_name = task.assignee or "Sin asignar"
+        estimation = task.estimation or "Sin est."
+        spent = task.spent or "Sin tiempo"
+        state = task.state or "Sin estado"
+        time_elapsed = _calculate_time_elapsed(task.updated) if task.updated else "Desconocido"
+        
+        # Formatear comentarios
+        if task.comments and len(task.comments) > 0:
+            if len(task.comments) == 1:
+                comments_text = MarkdownFormatter.format_comment(task.comments[0])
+            else:
+                # Para múltiples comentarios, mostrarlos en líneas separadas
+                comments_text = "<br>".join(MarkdownFormatter.format_comment(comment) for comment in task.comments)
+        else:
+            comments_text = "Sin comentarios"
+        
+        return f"| {task.id} - {task.idReadable} | {task.summary} | {assignee_name} | {state} | {estimation} | {spent} | {time_elapsed} | {comments_text} |\n"
+    
+    @staticmethod
+    def iter_tasks_report(issues: Iterable[Issue]) -> Iterator[str]:
+        """
+        Genera el reporte de tareas por fragmentos (cabecera y una fila por issue)
+        
+        Args:
+            issues: Issues a formatear; se consumen una a una, por lo que
+                    admite generadores paginados
+            
+        Yields:
+            str: Fragmentos consecutivos del reporte en markdown
+        """
+        has_rows = False
+        
+        for task in issues:
+            if not has_rows:
+                yield MarkdownFormatter.TASKS_REPORT_HEADER
+                has_rows = True
+            yield MarkdownFormatter.format_task_row(task)
+        
+        if not has_rows:
+            yield MarkdownFormatter.EMPTY_TASKS_REPORT
+    
+    @staticmethod
+    async def aiter_tasks_report(issues: AsyncIterable[Issue], heading: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Genera el reporte de tareas por fragmentos consumiendo un iterador asíncrono de issues
+        
+        Cada fila se formatea en cuanto llega su issue, sin esperar a que se
+        descarguen todas las páginas del sprint.
+        
+        Args:
+            issues: Iterador asíncrono de issues a formatear
+            heading: Título del reporte en markdown (por defecto "# Tareas en curso")
+            
+        Yields:
+            str: Fragmentos consecutivos del reporte en markdown
+        """
+        header = MarkdownFormatter.TASKS_REPORT_HEADER
+        empty_report = MarkdownFormatter.EMPTY_TASKS_REPORT
+        if heading is not None:
+            header = f"{heading}\n\n{MarkdownFormatter.TASKS_TABLE_HEADER}"
+            empty_report = f"{heading}\n\nNo hay tareas en curso."
+        
+        has_rows = False
+        # Solo se mide el formateo de las filas, no la espera de las páginas
+        format_seconds = 0.0
+        
+        async for task in issues:
+            if not has_rows:
+                yield header
+                has_rows = True
+            start = time.perf_counter()
+            row = MarkdownFormatter.format_task_row(task)
+            format_seconds += time.perf_counter() - start
+            yield row
+        
+        if not has_rows:
+            yield empty_report
+        metrics.observe("phase_duration_seconds", format_seconds, phase="format")
+    
     @staticmethod
-    def format_tasks_report(issues: List[Issue]) -> str:
+    def format_tasks_report(issues: Iterable[Issue]) -> str:
         """
         Genera un reporte en markdown de las tareas
         
         Args:
-            issues: Lista de issues a formatear
+            issues: Issues a formatear; se consumen una a una, por lo que
+                    admite generadores paginados
             
         Returns:
             str: Reporte en formato markdown
         """
-        if not issues:
-            return "# Tareas en curso\n\nNo hay tareas en curso."
-
-        # Generar reporte principal
-        md = "# Tareas en curso\n\n"
-        md += "| Internal ID - User Id | Título | Responsable | Estado | Estimación | Tiempo gastado | Última actualización | Comentarios |\n"
-        md += "|-----------------------|--------|------------|---------|------------|----------------|----------------------|-------------|\n"
-
-
-        for task in issues:
-            assignee_name = task.assignee or "Sin asignar"
-            estimation = task.estimation or "Sin est."
-            spent = task.spent or "Sin tiempo"
-            state = task.state or "Sin estado"
-            time_elapsed = _calculate_time_elapsed(task.updated) if task.updated else "Desconocido"
-            
-            # Formatear comentarios
-            if task.comments and len(task.comments) > 0:
-                if len(task.comments) == 1:
-                    comments_text = task.comments[0]
-                else:
-                    # Para múltiples comentarios, mostrarlos en líneas separadas
-                    comments_text = "<br>".join(task.comments)
-            else:
-                comments_text = "Sin comentarios"
-
-            md += f"| {task.id} - {task.idReadable} | {task.summary} | {assignee_name} | {state} | {estimation} | {spent} | {time_elapsed} | {comments_text} |\n"
-
-        return md
+        return "".join(MarkdownFormatter.iter_tasks_report(issues))
+    
+    @staticmethod
+    async def format_tasks_report_async(issues: AsyncIterable[Issue], heading: Optional[str] = None) -> str:
+        """
+        Genera el reporte de tareas consumiendo un iterador asíncrono de issues
+        
+        Args:
+            issues: Iterador asíncrono de issues a formatear
+            heading: Título del reporte en markdown (por defecto "# Tareas en curso")
+            
+        Returns:
+            str: Reporte en formato markdown
+        """
+        return "".join([chunk async for chunk in MarkdownFormatter.aiter_tasks_report(issues, heading)])
+    
+    @staticmethod
+    def board_heading(board: Board) -> str:
+        """Título de la sección de un tablero en el reporte de varios tableros"""
+        return f"## 📋 {board.name} · {board.current_sprint_name or 'Sin sprint'}"
+    
+    @staticmethod
+    async def aiter_boards_report(sections: List[Awaitable[Tuple[str, str]]]) -> AsyncIterator[str]:
+        """
+        Genera por fragmentos el reporte combinado de varios tableros
+        
+        Las secciones se calculan de forma concurrente; se entregan en el orden pedido en
+        cuanto está lista cada una, sin esperar a las siguientes.
+        
+        Args:
+            sections: Por cada tablero, la sección en markdown y su resultado
+                      ("ok", "warning" o "error"), pendientes de calcular
+            
+        Yields:
+            str: Título, sección de cada tablero y resumen final
+        """
+        yield f"# Tareas en curso de {len(sections)} tableros\n\n"
+        
+        outcomes = {"ok": 0, "warning": 0, "error": 0}
+        for section in sections:
+            text, outcome = await section
+            outcomes[outcome] += 1
+            yield text
+            yield "\n" if text.endswith("\n") else "\n\n"
+        
+        yield (
+            "---\n\n"
+            f"- ✅ **Con reporte:** {outcomes['ok']}\n"
+            f"- ⚠️ **Sin sprint activo:** {outcomes['warning']}\n"
+            f"- ❌ **Con error:** {outcomes['error']}\n"
+        )
 
     @staticmethod
-    def format_extended_issue(issue: ExtendedIssue) -> str:
+    def iter_extended_issue(issue: ExtendedIssue, sections: Optional[AbstractSet[str]] = None) -> Iterator[str]:
         """
-        Formatea una ExtendedIssue para análisis por IA de manera optimizada
+        Genera el detalle de una ExtendedIssue por fragmentos
         
         Args:
             issue: ExtendedIssue a formatear
+            sections: Secciones a incluir además de la información básica y temporal
+                      (None = todas las que tenga cargadas la issue)
             
-        Returns:
-            str: Información completa en formato markdown optimizado para IA
+        Yields:
+            str: Fragmentos consecutivos del markdown de la issue
         """
+        if sections is None:
+            sections = issue.loaded_sections
         
         # Encabezado principal
-        md = f"# Issue {issue.idReadable}: {issue.summary}\n\n"
+        yield f"# Issue {issue.idReadable}: {issue.summary}\n\n"
         
         # Información básica en tabla estructurada
-        md += "## 📋 Información Básica\n\n"
-        md += "| Campo | Valor |\n"
-        md += "|-------|-------|\n"
-        md += f"| **ID Interno** | {issue.id} |\n"
-        md += f"| **ID Legible** | {issue.idReadable} |\n"
-        md += f"| **Título** | {issue.summary} |\n"
-        md += f"| **Estado** | {issue.state or 'Sin estado'} |\n"
-        md += f"| **Prioridad** | {issue.priority or 'Sin prioridad'} |\n"
-        md += f"| **Tipo** | {issue.type or 'Sin tipo'} |\n"
-        md += f"| **Subsistema** | {issue.subsystem or 'Sin subsistema'} |\n"
-        md += f"| **Responsable** | {issue.assignee or 'Sin asignar'} |\n"
-        md += f"| **Proyecto** | {issue.project_name or 'Sin proyecto'} |\n"
+        yield (
+            "## 📋 Información Básica\n\n"
+            "| Campo | Valor |\n"
+            "|-------|-------|\n"
+            f"| **ID Interno** | {issue.id} |\n"
+            f"| **ID Legible** | {issue.idReadable} |\n"
+            f"| **Título** | {issue.summary} |\n"
+            f"| **Estado** | {issue.state or 'Sin estado'} |\n"
+            f"| **Prioridad** | {issue.priority or 'Sin prioridad'} |\n"
+            f"| **Tipo** | {issue.type or 'Sin tipo'} |\n"
+            f"| **Subsistema** | {issue.subsystem or 'Sin subsistema'} |\n"
+            f"| **Responsable** | {issue.assignee or 'Sin asignar'} |\n"
+            f"| **Proyecto** | {issue.project_name or 'Sin proyecto'} |\n"
+        )
         
-        # Información temporal
-        md += "\n## ⏰ Información Temporal\n\n"
-        md += "| Campo | Valor |\n"
-        md += "|-------|-------|\n"
+        # Custom fields adicionales configurados (--extra-fields)
+        if issue.extra_fields:
+            for name, value in issue.extra_fields.items():
+                yield f"| **{name}** | {value} |\n"
         
-        if issue.created:
-            created_elapsed = _calculate_time_elapsed(issue.created)
-            md += f"| **Creado** | {created_elapsed} |\n"
-        else:
-            md += f"| **Creado** | Fecha desconocida |\n"
-            
-        if issue.updated:
-            updated_elapsed = _calculate_time_elapsed(issue.updated)
-            md += f"| **Última actualización** | {updated_elapsed} |\n"
-        else:
-            md += f"| **Última actualización** | Fecha desconocida |\n"
-            
-        md += f"| **Estimación** | {issue.estimation or 'Sin estimación'} |\n"
-        md += f"| **Tiempo gastado** | {issue.spent or 'Sin tiempo registrado'} |\n"
+        # Información temporal
+        created = _calculate_time_elapsed(issue.created) if issue.created else "Fecha desconocida"
+        updated = _calculate_time_elapsed(issue.updated) if issue.updated else "Fecha desconocida"
+        yield (
+            "\n## ⏰ Información Temporal\n\n"
+            "| Campo | Valor |\n"
+            "|-------|-------|\n"
+            f"| **Creado** | {created} |\n"
+            f"| **Última actualización** | {updated} |\n"
+            f"| **Estimación** | {issue.estimation or 'Sin estimación'} |\n"
+            f"| **Tiempo gastado** | {issue.spent or 'Sin tiempo registrado'} |\n"
+        )
         
         # Personas involucradas
-        md += "\n## 👥 Personas Involucradas\n\n"
-        md += "| Rol | Persona |\n"
-        md += "|-----|----------|\n"
-        md += f"| **Reporter** | {issue.reporter_name or 'Desconocido'} |\n"
-        md += f"| **Responsable** | {issue.assignee or 'Sin asignar'} |\n"
-        md += f"| **Último editor** | {issue.updater_name or 'Desconocido'} |\n"
+        if "people" in sections:
+            yield (
+                "\n## 👥 Personas Involucradas\n\n"
+                "| Rol | Persona |\n"
+                "|-----|----------|\n"
+                f"| **Reporter** | {issue.reporter_name or 'Desconocido'} |\n"
+                f"| **Responsable** | {issue.assignee or 'Sin asignar'} |\n"
+                f"| **Último editor** | {issue.updater_name or 'Desconocido'} |\n"
+            )
         
         # Descripción
-        if issue.wikifiedDescription:
-            md += "\n## 📝 Descripción\n\n"
-            md += f"{issue.wikifiedDescription}\n\n"
+        if "description" in sections and issue.wikifiedDescription:
+            yield f"\n## 📝 Descripción\n\n{issue.wikifiedDescription}\n\n"
         
         # Comentarios
-        if issue.comments:
-            md += f"\n## 💬 Comentarios ({len(issue.comments)})\n\n"
-            for i, comment in enumerate(issue.comments, 1):
-                md += f"**Comentario {i}:** {comment}\n\n"
-        else:
-            md += "\n## 💬 Comentarios\n\nSin comentarios.\n\n"
+        if "comments" in sections:
+            if issue.comments:
+                yield f"\n## 💬 Comentarios ({len(issue.comments)})\n\n"
+                for i, comment in enumerate(issue.comments, 1):
+                    yield f"**Comentario {i}:** {MarkdownFormatter.format_comment(comment)}\n\n"
+            else:
+                yield "\n## 💬 Comentarios\n\nSin comentarios.\n\n"
         
         # Relaciones (parent, subtasks, links)
-        has_relations = issue.parent or issue.subtasks or issue.links
+        has_relations = "relations" in sections and (issue.parent or issue.subtasks or issue.links)
         if has_relations:
-            md += "\n## 🔗 Relaciones\n\n"
+            yield "\n## 🔗 Relaciones\n\n"
             
             if issue.parent:
-                md += f"**Issue padre:** {issue.parent}\n\n"
+                yield f"**Issue padre:** {issue.parent}\n\n"
             
             if issue.subtasks:
-                md += f"**Subtareas ({len(issue.subtasks)}):**\n"
+                yield f"**Subtareas ({len(issue.subtasks)}):**\n"
                 for subtask in issue.subtasks:
-                    md += f"- {subtask}\n"
-                md += "\n"
+                    yield f"- {subtask}\n"
+                yield "\n"
             
             if issue.links:
-                md += f"**Enlaces ({len(issue.links)}):**\n"
+                yield f"**Enlaces ({len(issue.links)}):**\n"
                 for link in issue.links:
-                    md += f"- {link}\n"
-                md += "\n"
+                    yield f"- {link}\n"
+                yield "\n"
         
         # Archivos adjuntos
-        if issue.attachments:
-            md += f"\n## 📎 Archivos Adjuntos ({len(issue.attachments)})\n\n"
+        if "attachments" in sections and issue.attachments:
+            yield f"\n## 📎 Archivos Adjuntos ({len(issue.attachments)})\n\n"
             for attachment in issue.attachments:
-                md += f"- {attachment}\n"
-            md += "\n"
+                yield f"- {attachment}\n"
+            yield "\n"
         
         # Tags
-        if issue.tags:
-            md += f"\n## 🏷️ Tags\n\n"
-            tags_text = ", ".join(issue.tags)
-            md += f"{tags_text}\n\n"
+        if "tags" in sections and issue.tags:
+            yield f"\n## 🏷️ Tags\n\n{', '.join(issue.tags)}\n\n"
+    
+    @staticmethod
+    def format_extended_issue(issue: ExtendedIssue, sections: Optional[AbstractSet[str]] = None) -> str:
+        """
+        Formatea una ExtendedIssue para análisis por IA de manera optimizada
+        
+        Args:
+            issue: ExtendedIssue a formatear
+            sections: Secciones a incluir (None = todas las que tenga cargadas la issue)
+            
+        Returns:
+            str: Información completa en formato markdown optimizado para IA
+        """
+        return "".join(MarkdownFormatter.iter_extended_issue(issue, sections))
+    
+    @staticmethod
+    def iter_extended_issues(results: List[Tuple[str, Optional[ExtendedIssue], Optional[str]]]) -> Iterator[str]:
+        """
+        Genera por fragmentos el detalle combinado de varias issues
+        
+        Args:
+            results: Por cada issue solicitada, su ID, la ExtendedIssue obtenida y el error si existe
+            
+        Yields:
+            str: Resumen del lote seguido del detalle (o el error) de cada issue
+        """
+        found = sum(1 for _, issue, _ in results if issue)
+        failed = len(results) - found
+        
+        yield (
+            f"# Detalle de {len(results)} issues\n\n"
+            f"- ✅ **Obtenidas:** {found}\n"
+            f"- ❌ **Con error:** {failed}\n\n"
+        )
+        
+        for issue_id, issue, error in results:
+            yield "---\n\n"
+            if issue:
+                yield from MarkdownFormatter.iter_extended_issue(issue)
+            else:
+                yield f"# Issue {issue_id}\n\n❌ **Error al obtener issue**\n\n{error or 'Issue no encontrada'}\n\n"
+    
+    @staticmethod
+    def format_extended_issues(results: List[Tuple[str, Optional[ExtendedIssue], Optional[str]]]) -> str:
+        """
+        Combina el detalle de varias issues en un único markdown
+        
+        Args:
+            results: Por cada issue solicitada, su ID, la ExtendedIssue obtenida y el error si existe
+            
+        Returns:
+            str: Resumen del lote seguido del detalle (o el error) de cada issue
+        """
+        return "".join(MarkdownFormatter.iter_extended_issues(results))
+    
+    @staticmethod
+    def format_sprint_metrics(board: Board, sprint_metrics: SprintMetrics, stale_days: int, max_outliers: int = 10) -> str:
+        """
+        Genera el resumen compacto de las métricas de un sprint
+        
+        Args:
+            board: Tablero del sprint
+            sprint_metrics: Agregados del sprint
+            stale_days: Días sin actualizar con los que se consideró estancada una issue
+            max_outliers: Máximo de IDs que se listan por cada tipo de issue a revisar
+            
+        Returns:
+            str: Totales, issues por estado, carga por responsable e IDs de las issues a revisar
+        """
+        m = sprint_metrics
+        chunks = [f"# 📊 Métricas del sprint: {board.name} · {board.current_sprint_name or 'Sin sprint'}\n\n"]
+        
+        if not m.total:
+            chunks.append("El sprint no tiene issues.")
+            return "".join(chunks)
+        
+        progress = f" ({m.spent_minutes / m.estimation_minutes:.0%} de lo estimado)" if m.estimation_minutes else ""
+        chunks.append(
+            f"- **Issues:** {m.total} ({m.in_progress} en curso, {m.finished} terminadas)\n"
+            f"- **Estimación total:** {_format_minutes(m.estimation_minutes)}\n"
+            f"- **Tiempo gastado:** {_format_minutes(m.spent_minutes)}{progress}\n\n"
+        )
+        
+        chunks.append("## Por estado\n\n| Estado | Issues |\n|--------|--------|\n")
+        for state, count in sorted(m.by_state.items(), key=lambda item: -item[1]):
+            chunks.append(f"| {state} | {count} |\n")
+        chunks.append("\n")
+        
+        if m.by_assignee:
+            chunks.append("## Carga en curso por responsable\n\n| Responsable | Issues | Estimación | Gastado |\n|-------------|--------|------------|---------|\n")
+            for assignee, load in sorted(m.by_assignee.items(), key=lambda item: (-item[1].issues, item[0])):
+                chunks.append(
+                    f"| {assignee} | {load.issues} | {_format_minutes(load.estimation_minutes)} | {_format_minutes(load.spent_minutes)} |\n"
+                )
+            chunks.append("\n")
+        
+        def outliers(title: str, items: List[str]) -> None:
+            if items:
+                more = f", … (+{len(items) - max_outliers})" if len(items) > max_outliers else ""
+                chunks.append(f"- **{title}:** {len(items)} → {', '.join(items[:max_outliers])}{more}\n")
+        
+        chunks.append("## ⚠️ A revisar\n\n")
+        # Las más antiguas y las más desviadas primero
+        outliers(
+            f"Estancadas (sin cambios en {stale_days} días)",
+            [issue_id for issue_id, _ in sorted(m.stale, key=lambda item: item[1])]
+        )
+        outliers(
+            "Por encima de la estimación",
+            [
+                f"{issue_id} ({_format_minutes(spent)} / {_format_minutes(estimation)})"
+                for issue_id, spent, estimation in sorted(m.over_estimate, key=lambda item: -item[1] / item[2])
+            ]
+        )
+        outliers("En curso sin estimación", m.unestimated)
+        outliers("En curso sin responsable", m.unassigned)
+        if not (m.stale or m.over_estimate or m.unestimated or m.unassigned):
+            chunks.append("No hay issues que requieran atención.\n")
+        
+        return "".join(chunks)
+    
+    @staticmethod
+    def format_search_results(query: str, results: List[SearchResult], source: str, board: Optional[Board] = None) -> str:
+        """
+        Genera la lista de resultados de una búsqueda de issues
+        
+        Args:
+            query: Texto buscado
+            results: Issues encontradas, de más a menos relevante
+            source: "local" si ha respondido el índice local o "youtrack" si la búsqueda de YouTrack
+            board: Tablero al que se restringió la búsqueda, si se indicó
+            
+        Returns:
+            str: Tabla en markdown con ID, título, estado, responsable y campos coincidentes
+        """
+        scope = f" en {board.name} · {board.current_sprint_name or 'Sin sprint'}" if board else ""
+        chunks = [f"# 🔎 Búsqueda: \"{query}\"{scope}\n\n"]
+        chunks.append("_Fuente: índice local_\n\n" if source == "local" else "_Fuente: búsqueda de YouTrack_\n\n")
+        
+        if not results:
+            chunks.append("No se han encontrado issues.")
+            return "".join(chunks)
+        
+        chunks.append("| ID | Título | Estado | Responsable | Coincide en |\n|----|--------|--------|-------------|-------------|\n")
+        for result in results:
+            matched = ", ".join(result.matched_fields) or "-"
+            chunks.append(
+                f"| {result.idReadable} | {result.summary} | {result.state or 'Sin estado'} | "
+                f"{result.assignee or 'Sin asignar'} | {matched} |\n"
+            )
+        return "".join(chunks)
+    
+    @staticmethod
+    def format_issue_graph(graph: IssueGraph) -> str:
+        """
+        Genera el informe del grafo de relaciones de una issue
+        
+        Args:
+            graph: Grafo recorrido desde la issue raíz
+            
+        Returns:
+            str: Markdown con la descripción de la raíz, una tabla con un resumen de cada issue
+                 y la lista de relaciones agrupadas por issue de origen
+        """
+        root = graph.root
+        chunks = [f"# 🕸️ Grafo de {root.idReadable}: {root.summary}\n\n"]
+        chunks.append(
+            f"_{len(graph.nodes)} issues hasta profundidad {graph.depth}"
+            f"{f', {len(graph.errors)} no disponibles' if graph.errors else ''}"
+            f"{f' (recortado a {graph.max_nodes} issues)' if graph.truncated else ''}_\n\n"
+        )
+        
+        if root.description:
+            chunks.append(f"## 📝 Descripción\n\n{root.description}\n\n")
+        
+        chunks.append("## Issues\n\n| ID | Título | Estado | Responsable | Profundidad |\n|----|--------|--------|-------------|-------------|\n")
+        for node in graph.nodes:
+            state = node.state or ("Resuelta" if node.resolved else "Sin estado")
+            chunks.append(f"| {node.idReadable} | {node.summary} | {state} | {node.assignee or 'Sin asignar'} | {node.depth} |\n")
+        
+        chunks.append("\n## 🔗 Relaciones\n\n")
+        edges = [node for node in graph.nodes if node.edges]
+        if not edges:
+            chunks.append("La issue no tiene relaciones.\n")
+        for node in edges:
+            relations: Dict[str, List[str]] = {}
+            for relation, target in node.edges:
+                relations.setdefault(relation, []).append(target)
+            chunks.append(f"- **{node.idReadable}** → " + "; ".join(
+                f"{relation}: {', '.join(targets)}" for relation, targets in relations.items()
+            ) + "\n")
+        
+        if graph.errors:
+            chunks.append("\n## ❌ No disponibles\n\n")
+            for issue_id, error in graph.errors.items():
+                chunks.append(f"- **{issue_id}:** {error}\n")
+        return "".join(chunks)
+    
+    @staticmethod
+    def format_diagnostics(snapshot: Dict[str, List[Dict[str, Any]]], client_stats: Dict[str, Dict[str, int]]) -> str:
+        """
+        Genera el informe de diagnóstico del servidor
+        
+        Args:
+            snapshot: Métricas de tiempos y contadores (ver Metrics.snapshot)
+            client_stats: Estadísticas del cliente por componente (ver AsyncYouTrackClient.get_diagnostics)
+            
+        Returns:
+            str: Informe en markdown con tiempos por herramienta y fase, tráfico con YouTrack,
+                 cachés y conexiones
+        """
+        counters = snapshot["counters"]
+        timings = snapshot["timings"]
+        chunks = ["# Diagnóstico del servidor\n\n"]
+        
+        tool_timings = [timing for timing in timings if timing["name"] == "tool_duration_seconds"]
+        chunks.append("## ⏱️ Herramientas\n\n")
+        if tool_timings:
+            chunks.append("| Herramienta | Llamadas | Errores | Media (ms) | Máx (ms) |\n|-------------|----------|---------|------------|----------|\n")
+            for timing in tool_timings:
+                tool = timing["labels"]["tool"]
+                errors = sum(
+                    counter["value"] for counter in counters
+                    if counter["name"] == "tool_calls_total" and counter["labels"].get("tool") == tool
+                    and counter["labels"].get("outcome") != "ok"
+                )
+                chunks.append(f"| {tool} | {timing['count']} | {errors:g} | {timing['mean_ms']:.1f} | {timing['max_ms']:.1f} |\n")
+            chunks.append("\n")
+        else:
+            chunks.append("Aún no se ha llamado a ninguna herramienta.\n\n")
+        
+        phase_timings = [timing for timing in timings if timing["name"] == "phase_duration_seconds"]
+        if phase_timings:
+            chunks.append("## 🔬 Fases\n\n| Fase | Mediciones | Total (ms) | Media (ms) | Máx (ms) |\n|------|------------|------------|------------|----------|\n")
+            for timing in phase_timings:
+                chunks.append(
+                    f"| {timing['labels']['phase']} | {timing['count']} | {timing['total_ms']:.1f} | "
+                    f"{timing['mean_ms']:.2f} | {timing['max_ms']:.1f} |\n"
+                )
+            chunks.append("\n")
+        
+        requests_by_status = {
+            counter["labels"]["status"]: counter["value"] for counter in counters if counter["name"] == "upstream_requests_total"
+        }
+        upstream_bytes = sum(counter["value"] for counter in counters if counter["name"] == "upstream_bytes_total")
+        chunks.append("## 🌐 YouTrack\n\n")
+        chunks.append(f"- **Peticiones:** {sum(requests_by_status.values()):g}")
+        if requests_by_status:
+            chunks.append(" (" + ", ".join(f"{status}: {count:g}" for status, count in sorted(requests_by_status.items())) + ")")
+        chunks.append(f"\n- **Datos recibidos:** {upstream_bytes / 1024:.1f} KiB\n\n")
+        
+        chunks.append("## 🗄️ Cachés y conexiones\n\n| Componente | Estadísticas |\n|------------|--------------|\n")
+        for component, stats in client_stats.items():
+            values = ", ".join(f"{name}: {value}" for name, value in stats.items())
+            lookups = stats.get("hits", 0) + stats.get("misses", 0)
+            if lookups:
+                values += f" (aciertos: {stats['hits'] / lookups:.0%})"
+            chunks.append(f"| {component} | {values} |\n")
         
-        return md
\ No newline at end of file
+        return "".join(chunks)
@@ -3,7 +3,6 @@
 Punto de entrada principal para el servidor MCP de YouTrack
 """
 import argparse
-from .server import run_server
 
 
 def main():
@@ -20,11 +19,251 @@ def main():
         default="Fixed,Verified",
         help="Estados considerados como terminados, separados por comas (default: 'Fixed,Verified')"
     )
+    parser.add_argument(
+        "--pool-maxsize",
+        type=int,
+        default=10,
+        help="Máximo de conexiones abiertas por host (default: 10)"
+    )
+    parser.add_argument(
+        "--pool-block",
+        action="store_true",
+        help="Esperar a que haya una conexión libre en lugar de abrir conexiones extra por encima de --pool-maxsize"
+    )
+    parser.add_argument(
+        "--no-keep-alive",
+        action="store_true",
+        help="Desactivar la reutilización de conexiones (keep-alive) entre peticiones"
+    )
+    parser.add_argument(
+        "--board-cache-ttl",
+        type=int,
+        default=300,
+        help="Segundos que se reutiliza el listado de tableros antes de volver a pedirlo, 0 para desactivar (default: 300)"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Máximo de peticiones simultáneas a YouTrack en operaciones por lotes (default: 8)"
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=100,
+        help="Número de issues por página al recorrer un sprint (default: 100)"
+    )
+    parser.add_argument(
+        "--no-server-side-filter",
+        action="store_true",
+        help="Descargar todas las issues del sprint y descartar las terminadas localmente en lugar de filtrarlas en YouTrack"
+    )
+    parser.add_argument(
+        "--count-filtered-issues",
+        action="store_true",
+        help="Contar con una consulta adicional las issues terminadas que evita el filtrado en YouTrack (estadísticas de getDiagnostics)"
+    )
+    parser.add_argument(
+        "--comments-subquery-threshold",
+        type=int,
+        default=20,
+        help="Comentarios a partir de los cuales una issue pide aparte solo sus últimos comentarios en lugar de incluirlos todos en la página, 0 para incluirlos siempre (default: 20)"
+    )
+    parser.add_argument(
+        "--snapshot-full-sync-interval",
+        type=int,
+        default=600,
+        help="Segundos entre descargas completas de un sprint; entre ellas solo se piden las issues actualizadas, 0 para desactivar (default: 600)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directorio de la caché persistente en disco; también se puede indicar con YOUTRACK_CACHE_DIR (default: sin caché)"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=100,
+        help="Tamaño máximo de la caché en disco en MB; se expulsan las entradas menos usadas (default: 100)"
+    )
+    parser.add_argument(
+        "--issue-cache-size",
+        type=int,
+        default=256,
+        help="Número de issues detalladas que se mantienen en memoria y se revalidan con su fecha de actualización, 0 para desactivar (default: 256)"
+    )
+    parser.add_argument(
+        "--extra-fields",
+        type=str,
+        default="",
+        help="Custom fields adicionales de YouTrack a extraer de cada issue, separados por comas (ej: \"Story points,Component\")"
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=3,
+        help="Reintentos de una petición ante errores de red, timeouts y estados 429/5xx, 0 para desactivar (default: 3)"
+    )
+    parser.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=0.5,
+        help="Espera base en segundos entre reintentos; se duplica en cada reintento y se le añade jitter (default: 0.5)"
+    )
+    parser.add_argument(
+        "--retry-max-delay",
+        type=float,
+        default=10.0,
+        help="Espera máxima en segundos entre reintentos; si YouTrack pide en Retry-After esperar más, no se reintenta (default: 10)"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=0.0,
+        help="Máximo de peticiones por segundo a YouTrack, 0 para no limitar (default: 0)"
+    )
+    parser.add_argument(
+        "--rate-limit-burst",
+        type=int,
+        default=10,
+        help="Peticiones que pueden enviarse seguidas antes de aplicar --rate-limit (default: 10)"
+    )
+    parser.add_argument(
+        "--circuit-failure-threshold",
+        type=int,
+        default=5,
+        help="Fallos consecutivos tras los que se deja de llamar a YouTrack y se sirve lo que haya en caché, 0 para desactivar (default: 5)"
+    )
+    parser.add_argument(
+        "--circuit-reset-timeout",
+        type=float,
+        default=30.0,
+        help="Segundos sin llamar a YouTrack tras abrirse el circuito antes de volver a probar (default: 30)"
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "streamable-http"],
+        default="stdio",
+        help="Transporte MCP: stdio (un proceso por cliente) o streamable-http (un proceso compartido por todos los clientes) (default: stdio)"
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Interfaz de escucha con --transport streamable-http (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Puerto de escucha con --transport streamable-http (default: 8000)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Máximo de llamadas a herramientas que se ejecutan a la vez; el resto espera turno, 0 para no limitar (default: 0)"
+    )
+    parser.add_argument(
+        "--webhook",
+        action="store_true",
+        help="Exponer POST /webhooks/youtrack para que YouTrack notifique cambios y se descarten de las cachés los datos afectados"
+    )
+    parser.add_argument(
+        "--webhook-port",
+        type=int,
+        default=8001,
+        help="Puerto del endpoint de notificaciones con --transport stdio; con streamable-http se usa --port (default: 8001)"
+    )
+    parser.add_argument(
+        "--webhook-secret",
+        type=str,
+        default=None,
+        help="Token que deben enviar las notificaciones en X-Webhook-Token o Authorization: Bearer (también YOUTRACK_WEBHOOK_SECRET)"
+    )
+    parser.add_argument(
+        "--watch-boards",
+        type=str,
+        default="",
+        help="Tableros cuyo sprint se refresca en segundo plano para responder desde memoria, separados por comas (también YOUTRACK_WATCH_BOARDS)"
+    )
+    parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=60.0,
+        help="Segundos entre refrescos de los tableros de --watch-boards (default: 60)"
+    )
+    parser.add_argument(
+        "--refresh-jitter",
+        type=float,
+        default=0.1,
+        help="Fracción de --refresh-interval que varía al azar en cada espera (default: 0.1)"
+    )
+    parser.add_argument(
+        "--refresh-idle-timeout",
+        type=float,
+        default=3600.0,
+        help="Segundos sin que se pida un tablero vigilado tras los que deja de refrescarse, 0 para refrescarlo siempre (default: 3600)"
+    )
+    parser.add_argument(
+        "--search-index-size",
+        type=int,
+        default=10000,
+        help="Número máximo de issues en el índice local de searchIssues, 0 para buscar siempre en YouTrack (default: 10000)"
+    )
+    
+    parser.add_argument(
+        "--prewarm",
+        action="store_true",
+        help="Abrir la conexión con YouTrack y cargar el listado de tableros en segundo plano al arrancar, mientras el cliente MCP completa la inicialización"
+    )
     
     args = parser.parse_args()
     
+    # El servidor (y el SDK de MCP) se importa tras validar los argumentos: --help y los
+    # errores de uso responden sin esperar a la carga
+    from .server import run_server
+    
     # Ejecutar servidor con configuración
-    run_server(timeout=args.timeout, finished_states=args.finished_states)
+    run_server(
+        timeout=args.timeout,
+        finished_states=args.finished_states,
+        pool_maxsize=args.pool_maxsize,
+        pool_block=args.pool_block,
+        keep_alive=not args.no_keep_alive,
+        board_cache_ttl=args.board_cache_ttl,
+        max_concurrency=args.max_concurrency,
+        page_size=args.page_size,
+        server_side_filter=not args.no_server_side_filter,
+        count_filtered_issues=args.count_filtered_issues,
+        comments_subquery_threshold=args.comments_subquery_threshold,
+        snapshot_full_sync_interval=args.snapshot_full_sync_interval,
+        cache_dir=args.cache_dir,
+        cache_max_mb=args.cache_max_mb,
+        issue_cache_size=args.issue_cache_size,
+        extra_fields=args.extra_fields,
+        max_retries=args.max_retries,
+        retry_backoff=args.retry_backoff,
+        retry_max_delay=args.retry_max_delay,
+        rate_limit=args.rate_limit,
+        rate_limit_burst=args.rate_limit_burst,
+        circuit_failure_threshold=args.circuit_failure_threshold,
+        circuit_reset_timeout=args.circuit_reset_timeout,
+        transport=args.transport,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        webhook=args.webhook,
+        webhook_port=args.webhook_port,
+        webhook_secret=args.webhook_secret,
+        watch_boards=args.watch_boards,
+        refresh_interval=args.refresh_interval,
+        refresh_jitter=args.refresh_jitter,
+        refresh_idle_timeout=args.refresh_idle_timeout,
+        search_index_size=args.search_index_size,
+        prewarm=args.prewarm
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,243 @@
+"""
+Métricas internas del servidor: contadores y tiempos por herramienta y por fase
+"""
+import functools
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Etiquetas de una métrica como tupla ordenada de pares (nombre, valor)
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Límites superiores (segundos) de los buckets de los histogramas
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_PREFIX = "youtrack_mcp_"
+
+
+class Timing:
+    """Acumulado de duraciones de una métrica: recuento, suma, máximo y buckets"""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)
+
+    def add(self, seconds: float) -> None:
+        """Registra una duración"""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        for index, bound in enumerate(DURATION_BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def to_dict(self) -> Dict[str, float]:
+        """Resumen de las duraciones en milisegundos"""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3)
+        }
+
+
+class _Span:
+    """Context manager que mide el tiempo de un bloque y lo registra al salir"""
+
+    __slots__ = ("_metrics", "_name", "_labels", "_start")
+
+    def __init__(self, metrics: "Metrics", name: str, labels: LabelKey):
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._metrics._observe(self._name, self._labels, time.perf_counter() - self._start)
+
+
+class Metrics:
+    """
+    Registro en memoria de contadores y tiempos con etiquetas
+
+    Cada medida es una suma bajo un lock, sin reservas de memoria salvo la primera vez
+    que aparece una combinación de nombre y etiquetas, por lo que puede dejarse activo
+    en producción.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._timings: Dict[Tuple[str, LabelKey], Timing] = {}
+
+    @staticmethod
+    def _labels(labels: Dict[str, Any]) -> LabelKey:
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    def incr(self, name: str, value: float = 1, **labels: Any) -> None:
+        """
+        Incrementa un contador
+
+        Args:
+            name: Nombre del contador (ej: "upstream_bytes_total")
+            value: Cantidad a sumar
+            **labels: Etiquetas del contador (ej: status="200")
+        """
+        key = (name, self._labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """
+        Registra una duración ya medida
+
+        Args:
+            name: Nombre de la métrica de tiempo (ej: "phase_duration_seconds")
+            seconds: Duración en segundos
+            **labels: Etiquetas de la medida (ej: phase="format")
+        """
+        self._observe(name, self._labels(labels), seconds)
+
+    def _observe(self, name: str, labels: LabelKey, seconds: float) -> None:
+        key = (name, labels)
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = Timing()
+            timing.add(seconds)
+
+    def span(self, name: str, **labels: Any) -> _Span:
+        """
+        Mide el tiempo de un bloque with
+
+        Ejemplo:
+            with metrics.span("phase_duration_seconds", phase="parse"):
+                issues = [Issue.from_youtrack_data(data) for data in page]
+        """
+        return _Span(self, name, self._labels(labels))
+
+    def timed_tool(self, fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        """
+        Decorador para herramientas MCP: mide su duración y cuenta las llamadas por resultado
+
+        Una respuesta que empieza por "❌" cuenta como error; una excepción, como "exception".
+        Conserva la firma y el docstring de la herramienta.
+        """
+        tool = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            start = time.perf_counter()
+            outcome = "exception"
+            try:
+                result = await fn(*args, **kwargs)
+                outcome = "error" if isinstance(result, str) and result.startswith("❌") else "ok"
+                return result
+            finally:
+                self.observe("tool_duration_seconds", time.perf_counter() - start, tool=tool)
+                self.incr("tool_calls_total", tool=tool, outcome=outcome)
+
+        return wrapper
+
+    def reset(self) -> None:
+        """Vacía todos los contadores y tiempos"""
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Copia de las métricas actuales
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: "counters" (nombre, etiquetas y valor) y
+                "timings" (nombre, etiquetas y el resumen de Timing.to_dict)
+        """
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            timings = [
+                {"name": name, "labels": dict(labels), **timing.to_dict()}
+                for (name, labels), timing in sorted(self._timings.items())
+            ]
+        return {"counters": counters, "timings": timings}
+
+    def render_prometheus(self, extra_gauges: Optional[Iterable[Tuple[str, Dict[str, Any], float]]] = None) -> str:
+        """
+        Exporta las métricas en el formato de texto de Prometheus
+
+        Args:
+            extra_gauges: Valores externos (nombre, etiquetas, valor) a incluir como gauges,
+                          como las estadísticas de cachés y conexiones del cliente
+
+        Returns:
+            str: Métricas con el prefijo "youtrack_mcp_"; los tiempos como histogramas
+        """
+        with self._lock:
+            counters = [(name, dict(labels), value) for (name, labels), value in self._counters.items()]
+            timings = [
+                (name, dict(labels), timing.count, timing.total, list(timing.buckets))
+                for (name, labels), timing in self._timings.items()
+            ]
+
+        def by_name(item: Tuple[Any, ...]) -> Tuple[str, List[Tuple[str, Any]]]:
+            return item[0], sorted(item[1].items())
+
+        lines: List[str] = []
+        declared = set()
+        samples = [("counter", *item) for item in counters] + [("gauge", *item) for item in extra_gauges or []]
+        for kind, name, labels, value in sorted(samples, key=lambda sample: by_name(sample[1:])):
+            metric = PROMETHEUS_PREFIX + name
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} {kind}")
+                declared.add(metric)
+            lines.append(f"{metric}{_format_labels(labels)} {_format_value(value)}")
+
+        for name, labels, count, total, buckets in sorted(timings, key=by_name):
+            metric = PROMETHEUS_PREFIX + name
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} histogram")
+                declared.add(metric)
+            cumulative = 0
+            for bound, bucket in zip(DURATION_BUCKETS, buckets):
+                cumulative += bucket
+                lines.append(f"{metric}_bucket{_format_labels({**labels, 'le': f'{bound:g}'})} {cumulative}")
+            lines.append(f"{metric}_bucket{_format_labels({**labels, 'le': '+Inf'})} {count}")
+            lines.append(f"{metric}_sum{_format_labels(labels)} {total:.6f}")
+            lines.append(f"{metric}_count{_format_labels(labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    """Valor de una muestra sin notación exponencial para enteros"""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: Any) -> str:
+    """Escapa un valor de etiqueta de Prometheus"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    """Etiquetas en sintaxis de Prometheus ({a="1",b="2"}), vacío si no hay"""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in sorted(labels.items())) + "}"
+
+
+# Registro global del proceso
+metrics = Metrics()
@@ -1,12 +1,13 @@
 """
 Modelos de datos para YouTrack
 """
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
-from .utils import _calculate_time_elapsed
+import sys
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from .utils import _parse_duration_minutes
 
 
-@dataclass
+@dataclass(slots=True)
 class Board:
     """Representa un tablero de YouTrack"""
     id: str
@@ -15,7 +16,31 @@ class Board:
     current_sprint_name: Optional[str] = None
 
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """Interna los textos que se repiten entre issues (estados, personas, proyectos...)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _custom_field_text(value: Any) -> Optional[str]:
+    """Representación legible del valor de un custom field de cualquier tipo"""
+    if isinstance(value, dict):
+        text = value.get("presentation") or value.get("name") or value.get("text") or value.get("login")
+        return _intern(text) if text is not None else None
+    if isinstance(value, list):
+        texts = [text for text in (_custom_field_text(item) for item in value) if text]
+        return ", ".join(texts) if texts else None
+    return str(value) if value is not None else None
+
+
+@dataclass(slots=True)
+class Comment:
+    """Comentario de una issue; su antigüedad se calcula al mostrarlo"""
+    author: str
+    text: str
+    created: Optional[int] = None  # Timestamp en milisegundos
+
+
+@dataclass(slots=True)
 class Issue:
     """Representa una issue de YouTrack con campos extraídos"""
     id: str
@@ -26,65 +51,125 @@ class Issue:
     estimation: Optional[str] = None
     spent: Optional[str] = None
     updated: Optional[str] = None
-    comments: Optional[List[str]] = None
+    comments: Optional[List[Comment]] = None  # Del más reciente al más antiguo
+    extra_fields: Optional[Dict[str, str]] = None  # Custom fields configurados con configure_extra_fields
+    comments_count: Optional[int] = None  # Total de comentarios en YouTrack (None si no se pidieron)
+    
+    COMMENT_API_FIELDS: ClassVar[str] = "author(name),text,created"
+    
+    # Custom fields con atributo propio: nombre en YouTrack -> (atributo, clave del valor)
+    CUSTOM_FIELDS: ClassVar[Dict[str, Tuple[str, str]]] = {
+        "State": ("state", "name"),
+        "Assignee": ("assignee", "name"),
+        "Estimation": ("estimation", "presentation"),
+        "Spent time": ("spent", "presentation"),
+    }
+    
+    # Custom fields adicionales que se guardan en extra_fields (comunes a todas las issues)
+    EXTRA_CUSTOM_FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+    
+    @staticmethod
+    def configure_extra_fields(names: Iterable[str]) -> None:
+        """
+        Define los custom fields adicionales que se extraen de todas las issues
+        
+        Args:
+            names: Nombres de los custom fields en YouTrack (ej: "Story points")
+        """
+        Issue.EXTRA_CUSTOM_FIELDS = frozenset(name.strip() for name in names if name.strip())
     
     @classmethod
-    def get_api_fields(cls) -> str:
-        """Devuelve los campos necesarios para consultas básicas de Issue"""
-        return "id,idReadable,summary,updated,customFields(name,value),comments(author(name),text,created)"
+    def get_api_fields(cls, num_comments: int = -1, comments_count_only: bool = False) -> str:
+        """
+        Devuelve los campos necesarios para consultas básicas de Issue
+        
+        Args:
+            num_comments: Comentarios que se van a mostrar por issue. Con 0 no se piden
+                          comentarios; en otro caso se incluyen en la respuesta.
+            comments_count_only: Pedir solo el número de comentarios (commentsCount) para
+                                 traer después los últimos aparte
+        """
+        fields = "id,idReadable,summary,updated,customFields(name,value)"
+        if num_comments == 0:
+            return fields
+        if comments_count_only:
+            return f"{fields},commentsCount"
+        return f"{fields},comments({cls.COMMENT_API_FIELDS})"
     
     @classmethod
     def from_youtrack_data(cls, issue_data: Dict[str, Any], num_comments: int = 1) -> 'Issue':
         """Crea una Issue desde los datos de YouTrack"""
-        extracted = cls(
+        issue = cls(
             id=issue_data["id"],
             idReadable=issue_data["idReadable"],
             summary=issue_data["summary"],
             updated=issue_data.get("updated")
         )
-
-        # Extracción específica de custom fields
-        custom_fields_data = issue_data.get("customFields", [])
-        for field in custom_fields_data:
-            field_name = field["name"]
-            field_value = field.get("value")
-            
-            if field_name == "State" and field_value:
-                extracted.state = field_value.get("name")
-            elif field_name == "Assignee" and field_value:
-                extracted.assignee = field_value.get("name")
-            elif field_name == "Estimation" and field_value:
-                extracted.estimation = field_value.get("presentation")
-            elif field_name == "Spent time" and field_value:
-                extracted.spent = field_value.get("presentation")
-        
-        # Extraer comentarios
-        comments_data = issue_data.get("comments", [])
-        if comments_data:
-            # Ordenar comentarios por fecha de creación (más reciente primero)
-            sorted_comments = sorted(comments_data, key=lambda x: x.get("created", 0), reverse=True)
+        issue._decode_custom_fields(issue_data)
+        issue._decode_comments(issue_data, num_comments)
+        return issue
+    
+    def _decode_custom_fields(self, issue_data: Dict[str, Any]) -> None:
+        """
+        Rellena los custom fields en una sola pasada sobre customFields
+        
+        Args:
+            issue_data: Datos de la issue en formato JSON de YouTrack
+        """
+        # Extracción de custom fields dirigida por la tabla CUSTOM_FIELDS
+        target_for = self.CUSTOM_FIELDS.get
+        extra_names = Issue.EXTRA_CUSTOM_FIELDS
+        intern = sys.intern
+        for custom_field in issue_data.get("customFields", ()):
+            field_value = custom_field.get("value")
+            if not field_value:
+                continue
             
-            # Obtener comentarios según num_comments (-1 = todos, >0 = límite)
+            target = target_for(custom_field["name"])
+            if target is not None:
+                attribute, key = target
+                if field_value.__class__ is dict:
+                    value = field_value.get(key)
+                    setattr(self, attribute, intern(value) if value.__class__ is str else value)
+                else:
+                    # Custom fields multivalor (ej: varios Assignee o Subsystem): valores unidos por comas
+                    setattr(self, attribute, _custom_field_text(field_value))
+            elif extra_names and custom_field["name"] in extra_names:
+                text = _custom_field_text(field_value)
+                if text is not None:
+                    if self.extra_fields is None:
+                        self.extra_fields = {}
+                    self.extra_fields[custom_field["name"]] = text
+        
+    def _decode_comments(self, issue_data: Dict[str, Any], num_comments: int) -> None:
+        """
+        Rellena los comentarios, del más reciente al más antiguo
+        
+        Args:
+            issue_data: Datos de la issue en formato JSON de YouTrack
+            num_comments: Número de comentarios a conservar (-1 = todos, 0 = ninguno)
+        """
+        comments_data = issue_data.get("comments") or []
+        if "commentsCount" in issue_data or "comments" in issue_data:
+            self.comments_count = issue_data.get("commentsCount", len(comments_data))
+        if comments_data and num_comments != 0:
+            # YouTrack devuelve los comentarios en orden cronológico: basta con
+            # recorrerlos al revés para tener primero el más reciente
             if num_comments == -1:
-                selected_comments = sorted_comments  # Todos los comentarios
+                selected_comments = comments_data[::-1]  # Todos los comentarios
             else:
-                selected_comments = sorted_comments[:num_comments]
+                selected_comments = comments_data[-num_comments:][::-1]
             
-            # Formatear los comentarios
-            formatted_comments = []
+            # Se guarda el timestamp, no la antigüedad: las issues en caché la recalculan al mostrarse
+            comments = []
             for comment in selected_comments:
                 comment_text = comment.get("text", "").strip()
-                author_name = comment.get("author", {}).get("name", "Desconocido")
-                comment_created = comment.get("created")
-                elapsed = _calculate_time_elapsed(comment_created) if comment_created else "Desconocido"
-                
                 if comment_text:
-                    formatted_comments.append(f"{author_name}: {comment_text} ({elapsed})")
+                    author_name = (comment.get("author") or {}).get("name", "Desconocido")
+                    comments.append(Comment(author=_intern(author_name), text=comment_text,
+                                            created=comment.get("created")))
             
-            # Asignar comentarios
-            extracted.comments = formatted_comments if formatted_comments else None
-        
-        return extracted
+            self.comments = comments if comments else None
     
     def is_finished(self, finished_states: List[str]) -> bool:
         """
@@ -95,7 +180,7 @@ class Issue:
         """
         return self.state in finished_states
 
-@dataclass
+@dataclass(slots=True)
 class ExtendedIssue(Issue):
     """Representa una issue de YouTrack con información completa para análisis detallado"""
     # Campos procesados (ya extraídos para fácil acceso)
@@ -115,58 +200,143 @@ class ExtendedIssue(Issue):
     type: Optional[str] = None  # Type custom field
     subsystem: Optional[str] = None  # Subsystem custom field
     
-    @classmethod
-    def get_api_fields(cls) -> str:
-        """Devuelve los campos completos necesarios para análisis detallado"""
-        # Comenzamos con los campos básicos de la clase padre
-        basic_fields = super().get_api_fields()
-        
-        # Agregamos los campos específicos de ExtendedIssue
-        extended_fields = (
-            "created,wikifiedDescription,"
-            "attachments(name),"
+    CUSTOM_FIELDS: ClassVar[Dict[str, Tuple[str, str]]] = {
+        **Issue.CUSTOM_FIELDS,
+        "Priority": ("priority", "name"),
+        "Type": ("type", "name"),
+        "Subsystem": ("subsystem", "name"),
+    }
+    
+    # Secciones que se pueden pedir por separado: nombre -> campos de la API
+    SECTION_API_FIELDS: ClassVar[Dict[str, str]] = {
+        "description": "wikifiedDescription",
+        "comments": f"comments({Issue.COMMENT_API_FIELDS})",
+        "people": "reporter(name,email),updater(name,email)",
+        "relations": (
             "links(direction,linkType(name),issues(id,idReadable,summary)),"
             "parent(issues(id,idReadable,summary)),"
-            "subtasks(issues(id,idReadable,summary,resolved)),"
-            "project(id,name),"
-            "reporter(name,email),"
-            "updater(name,email),"
-            "tags(name)"
-        )
+            "subtasks(issues(id,idReadable,summary,resolved))"
+        ),
+        "attachments": "attachments(name)",
+        "tags": "tags(name)",
+    }
+    ALL_SECTIONS: ClassVar[FrozenSet[str]] = frozenset(SECTION_API_FIELDS)
+    
+    loaded_sections: FrozenSet[str] = frozenset()  # Secciones ya descargadas y transformadas
+    
+    @classmethod
+    def resolve_sections(cls, sections: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+        """
+        Normaliza una lista de secciones pedidas
+        
+        Args:
+            sections: Nombres de sección (None = todas)
         
-        return f"{basic_fields},{extended_fields}"
+        Returns:
+            FrozenSet[str]: Secciones válidas
+        
+        Raises:
+            ValueError: Si alguna sección no existe
+        """
+        if sections is None:
+            return cls.ALL_SECTIONS
+        
+        resolved = frozenset(section.strip().lower() for section in sections if section.strip())
+        unknown = resolved - cls.ALL_SECTIONS
+        if unknown:
+            raise ValueError(
+                f"Secciones desconocidas: {', '.join(sorted(unknown))}. "
+                f"Secciones disponibles: {', '.join(sorted(cls.ALL_SECTIONS))}"
+            )
+        return resolved
     
     @classmethod
-    def from_youtrack_data(cls, issue_data: Dict[str, Any], num_comments: int = -1) -> 'ExtendedIssue':
-        """Crea una ExtendedIssue desde los datos completos de YouTrack"""
-        # Primero creamos la issue básica
-        basic_issue = super().from_youtrack_data(issue_data, num_comments)
-        
-        # Procesamos custom fields adicionales (más allá de los que ya procesa Issue)
-        custom_fields_data = issue_data.get("customFields", [])
-        priority = None
-        issue_type = None
-        subsystem = None
-        
-        for field in custom_fields_data:
-            field_name = field["name"]
-            field_value = field.get("value")
-            
-            if field_name == "Priority" and field_value:
-                priority = field_value.get("name")
-            elif field_name == "Type" and field_value:
-                issue_type = field_value.get("name")
-            elif field_name == "Subsystem" and field_value:
-                subsystem = field_value.get("name")
-        
-        # Procesamos los campos específicos de ExtendedIssue
+    def get_section_api_fields(cls, sections: Iterable[str]) -> str:
+        """Devuelve solo los campos de la API de las secciones indicadas"""
+        return ",".join(cls.SECTION_API_FIELDS[section] for section in sorted(sections))
+    
+    @classmethod
+    def get_api_fields(cls, sections: Optional[Iterable[str]] = None) -> str:
+        """
+        Devuelve los campos necesarios para el detalle de una issue
+        
+        Args:
+            sections: Secciones a incluir además de la información básica (None = todas)
+        """
+        # Información básica sin comentarios; cada sección añade sus propios campos
+        # (Issue explícito: super() sin argumentos no funciona en dataclasses con slots)
+        basic_fields = f"{Issue.get_api_fields(num_comments=0)},created,project(id,name)"
+        section_fields = cls.get_section_api_fields(cls.resolve_sections(sections))
+        
+        return f"{basic_fields},{section_fields}" if section_fields else basic_fields
+    
+    @classmethod
+    def from_youtrack_data(cls, issue_data: Dict[str, Any], num_comments: int = -1,
+                           sections: Optional[Iterable[str]] = None) -> 'ExtendedIssue':
+        """
+        Crea una ExtendedIssue desde los datos de YouTrack
+        
+        Args:
+            issue_data: Datos de la issue en formato JSON de YouTrack
+            num_comments: Número de comentarios a conservar (-1 = todos)
+            sections: Secciones presentes en issue_data (None = todas)
+        """
+        issue = cls(
+            id=issue_data["id"],
+            idReadable=issue_data["idReadable"],
+            summary=issue_data["summary"],
+            updated=issue_data.get("updated"),
+            created=issue_data.get("created")
+        )
+        
+        # Custom fields (incluidos Priority, Type y Subsystem) en una sola pasada
+        issue._decode_custom_fields(issue_data)
+        if issue_data.get("project"):
+            issue.project_name = _intern(issue_data["project"].get("name"))
+        
+        issue.load_sections(issue_data, cls.resolve_sections(sections), num_comments)
+        return issue
+    
+    def load_sections(self, issue_data: Dict[str, Any], sections: FrozenSet[str], num_comments: int = -1) -> None:
+        """
+        Transforma y añade a la issue las secciones indicadas
+        
+        Permite completar más tarde una issue obtenida solo con algunas secciones.
+        
+        Args:
+            issue_data: Datos de la issue con los campos de esas secciones
+            sections: Secciones presentes en issue_data
+            num_comments: Número de comentarios a conservar (-1 = todos)
+        """
+        if "description" in sections:
+            self.wikifiedDescription = issue_data.get("wikifiedDescription")
+        
+        if "comments" in sections:
+            self._decode_comments(issue_data, num_comments)
+        
+        # Reporter y updater: extraer nombres
+        if "people" in sections:
+            if issue_data.get("reporter"):
+                self.reporter_name = _intern(issue_data["reporter"].get("name"))
+            if issue_data.get("updater"):
+                self.updater_name = _intern(issue_data["updater"].get("name"))
+        
+        if "relations" in sections:
+            self._decode_relations(issue_data)
+        
         # Attachments: extraer solo nombres
-        attachments_processed = None
-        if issue_data.get("attachments"):
-            attachments_processed = [att.get("name", "Sin nombre") for att in issue_data["attachments"]]
+        if "attachments" in sections and issue_data.get("attachments"):
+            self.attachments = [att.get("name", "Sin nombre") for att in issue_data["attachments"]]
+        
+        # Tags: extraer nombres
+        if "tags" in sections and issue_data.get("tags"):
+            self.tags = [_intern(tag.get("name")) for tag in issue_data["tags"] if tag.get("name")]
         
+        self.loaded_sections = self.loaded_sections | sections
+    
+    def _decode_relations(self, issue_data: Dict[str, Any]) -> None:
+        """Rellena enlaces, issue padre y subtareas"""
         # Links: formatear enlaces de forma legible
-        links_processed = None
         if issue_data.get("links"):
             links_processed = []
             for link in issue_data["links"]:
@@ -175,79 +345,234 @@ class ExtendedIssue(Issue):
                 issues = link.get("issues", [])
                 
                 if issues:
-                    issues_desc = ", ".join([f"{issue.get('idReadable', issue.get('id', '?'))}: {issue.get('summary', 'Sin título')}" for issue in issues])
+                    issues_desc = ", ".join([f"{linked.get('idReadable', linked.get('id', '?'))}: {linked.get('summary', 'Sin título')}" for linked in issues])
                     links_processed.append(f"{direction} {link_type} → {issues_desc}")
+            self.links = links_processed
         
         # Parent: formatear información del padre
-        parent_processed = None
         if issue_data.get("parent"):
             parent_issues = issue_data["parent"].get("issues", [])
             if parent_issues:
                 parent_issue = parent_issues[0]  # Tomamos el primer padre
-                parent_processed = f"{parent_issue.get('idReadable', parent_issue.get('id', '?'))}: {parent_issue.get('summary', 'Sin título')}"
+                self.parent = f"{parent_issue.get('idReadable', parent_issue.get('id', '?'))}: {parent_issue.get('summary', 'Sin título')}"
         
         # Subtasks: formatear subtareas
-        subtasks_processed = None
         if issue_data.get("subtasks"):
             # subtasks es un diccionario con estructura: {"issues": [...], "$type": "IssueLink"}
-            subtasks_data = issue_data["subtasks"]
-            subtask_issues = subtasks_data.get("issues", [])
-            
+            subtask_issues = issue_data["subtasks"].get("issues", [])
             if subtask_issues:
-                subtasks_processed = []
-                for issue in subtask_issues:
-                    resolved_status = " (RESUELTO)" if issue.get("resolved") else ""
-                    subtasks_processed.append(f"{issue.get('idReadable', issue.get('id', '?'))}: {issue.get('summary', 'Sin título')}{resolved_status}")
+                self.subtasks = [
+                    f"{subtask.get('idReadable', subtask.get('id', '?'))}: {subtask.get('summary', 'Sin título')}"
+                    f"{' (RESUELTO)' if subtask.get('resolved') else ''}"
+                    for subtask in subtask_issues
+                ]
+
+
+@dataclass(slots=True)
+class AssigneeLoad:
+    """Carga de trabajo en curso de un responsable"""
+    issues: int = 0
+    estimation_minutes: int = 0
+    spent_minutes: int = 0
+
+
+@dataclass(slots=True)
+class SprintMetrics:
+    """
+    Agregados de un sprint calculados en una sola pasada sobre sus issues
+    
+    Se alimenta issue a issue con add() mientras se recorren las páginas del sprint, sin
+    guardar las issues: solo los contadores y los IDs de las issues que requieren atención.
+    """
+    finished_states: List[str]
+    stale_before: int  # Timestamp (ms): las issues en curso sin actualizar desde entonces están estancadas
+    total: int = 0
+    finished: int = 0
+    estimation_minutes: int = 0
+    spent_minutes: int = 0
+    by_state: Dict[str, int] = field(default_factory=dict)
+    by_assignee: Dict[str, AssigneeLoad] = field(default_factory=dict)  # Solo issues en curso
+    stale: List[Tuple[str, int]] = field(default_factory=list)  # (ID, updated) de las estancadas
+    over_estimate: List[Tuple[str, int, int]] = field(default_factory=list)  # (ID, gastado, estimado)
+    unestimated: List[str] = field(default_factory=list)  # En curso sin estimación
+    unassigned: List[str] = field(default_factory=list)  # En curso sin responsable
+    
+    UNASSIGNED: ClassVar[str] = "Sin asignar"
+    NO_STATE: ClassVar[str] = "Sin estado"
+    
+    def add(self, issue: Issue) -> None:
+        """Acumula una issue del sprint"""
+        self.total += 1
+        state = issue.state or self.NO_STATE
+        self.by_state[state] = self.by_state.get(state, 0) + 1
         
-        # Project: extraer nombre
-        project_name = None
-        if issue_data.get("project"):
-            project_name = issue_data["project"].get("name")
+        estimation = _parse_duration_minutes(issue.estimation)
+        spent = _parse_duration_minutes(issue.spent)
+        self.estimation_minutes += estimation or 0
+        self.spent_minutes += spent or 0
+        if estimation and spent is not None and spent > estimation:
+            self.over_estimate.append((issue.idReadable, spent, estimation))
         
-        # Reporter: extraer nombre
-        reporter_name = None
-        if issue_data.get("reporter"):
-            reporter_name = issue_data["reporter"].get("name")
+        if issue.is_finished(self.finished_states):
+            self.finished += 1
+            return
         
-        # Updater: extraer nombre
-        updater_name = None
-        if issue_data.get("updater"):
-            updater_name = issue_data["updater"].get("name")
+        load = self.by_assignee.get(issue.assignee or self.UNASSIGNED)
+        if load is None:
+            load = self.by_assignee[issue.assignee or self.UNASSIGNED] = AssigneeLoad()
+        load.issues += 1
+        load.estimation_minutes += estimation or 0
+        load.spent_minutes += spent or 0
         
-        # Tags: extraer nombres
-        tags_processed = None
-        if issue_data.get("tags"):
-            tags_processed = [tag.get("name") for tag in issue_data["tags"] if tag.get("name")]
-        
-        # Crear ExtendedIssue con datos procesados
-        extended = cls(
-            # Campos heredados de Issue
-            id=basic_issue.id,
-            idReadable=basic_issue.idReadable,
-            summary=basic_issue.summary,
-            state=basic_issue.state,
-            assignee=basic_issue.assignee,
-            estimation=basic_issue.estimation,
-            spent=basic_issue.spent,
-            updated=basic_issue.updated,
-            comments=basic_issue.comments,
-            
-            # Campos específicos de ExtendedIssue (procesados)
-            attachments=attachments_processed,
-            created=issue_data.get("created"),
-            links=links_processed,
-            parent=parent_processed,
-            project_name=project_name,
-            reporter_name=reporter_name,
-            subtasks=subtasks_processed,
-            tags=tags_processed,
-            updater_name=updater_name,
-            wikifiedDescription=issue_data.get("wikifiedDescription"),
-            
-            # Custom fields adicionales
-            priority=priority,
-            type=issue_type,
-            subsystem=subsystem
+        if not issue.assignee:
+            self.unassigned.append(issue.idReadable)
+        if estimation is None:
+            self.unestimated.append(issue.idReadable)
+        try:
+            updated = int(issue.updated)
+        except (TypeError, ValueError):
+            return
+        if updated < self.stale_before:
+            self.stale.append((issue.idReadable, updated))
+    
+    @property
+    def in_progress(self) -> int:
+        """Número de issues no terminadas"""
+        return self.total - self.finished
+
+
+@dataclass(slots=True)
+class IssueNode:
+    """Nodo del grafo de relaciones de una issue, con solo los campos ligeros"""
+    id: str
+    idReadable: str
+    summary: str
+    state: Optional[str] = None
+    assignee: Optional[str] = None
+    resolved: bool = False
+    description: Optional[str] = None  # Solo en el nodo raíz
+    depth: int = 0  # Distancia a la issue raíz
+    edges: List[Tuple[str, str]] = field(default_factory=list)  # (relación, ID legible de la issue relacionada)
+    
+    ISSUE_REF_FIELDS: ClassVar[str] = "issues(id,idReadable)"
+    API_FIELDS: ClassVar[str] = (
+        "id,idReadable,summary,resolved,customFields(name,value(name)),"
+        f"links(direction,linkType(name,sourceToTarget,targetToSource),{ISSUE_REF_FIELDS}),"
+        f"parent({ISSUE_REF_FIELDS}),subtasks({ISSUE_REF_FIELDS})"
+    )
+    
+    @classmethod
+    def get_api_fields(cls, with_description: bool = False) -> str:
+        """Campos a pedir para un nodo (la descripción solo para la raíz)"""
+        return f"{cls.API_FIELDS},wikifiedDescription" if with_description else cls.API_FIELDS
+    
+    @classmethod
+    def from_youtrack_data(cls, issue_data: Dict[str, Any], depth: int = 0) -> 'IssueNode':
+        """
+        Crea un nodo desde los datos de YouTrack, con sus relaciones como aristas
+        
+        Args:
+            issue_data: Datos de la issue pedidos con get_api_fields
+            depth: Distancia a la issue raíz
+        """
+        node = cls(
+            id=issue_data["id"],
+            idReadable=issue_data["idReadable"],
+            summary=issue_data.get("summary", ""),
+            resolved=bool(issue_data.get("resolved")),
+            description=issue_data.get("wikifiedDescription"),
+            depth=depth
         )
         
-        return extended
+        for custom_field in issue_data.get("customFields", ()):
+            value = custom_field.get("value")
+            if isinstance(value, dict) and custom_field.get("name") in ("State", "Assignee"):
+                setattr(node, custom_field["name"].lower(), _intern(value.get("name")))
+        
+        seen = set()
+        
+        def add_edges(relation: str, issues: Iterable[Dict[str, Any]]) -> None:
+            for related in issues:
+                target = related.get("idReadable") or related.get("id")
+                if target and target != node.idReadable and (relation, target) not in seen:
+                    seen.add((relation, target))
+                    node.edges.append((_intern(relation), target))
+        
+        for link in issue_data.get("links") or ():
+            link_type = link.get("linkType") or {}
+            # Nombre de la relación vista desde esta issue (ej: "depends on" / "is required for")
+            if link.get("direction") == "OUTWARD":
+                relation = link_type.get("sourceToTarget") or link_type.get("name")
+            elif link.get("direction") == "INWARD":
+                relation = link_type.get("targetToSource") or link_type.get("name")
+            else:
+                relation = link_type.get("name")
+            add_edges(relation or "relacionado", link.get("issues") or ())
+        
+        add_edges("subtask of", (issue_data.get("parent") or {}).get("issues") or ())
+        add_edges("parent for", (issue_data.get("subtasks") or {}).get("issues") or ())
+        return node
+
+
+@dataclass(slots=True)
+class IssueGraph:
+    """
+    Grafo de relaciones alrededor de una issue, recorrido en anchura
+    
+    Cada issue se visita una sola vez aunque varias issues la enlacen, y no se
+    visitan más de max_nodes issues (contando la raíz y las que fallen).
+    """
+    root: IssueNode
+    depth: int  # Profundidad máxima del recorrido
+    max_nodes: int
+    nodes: List[IssueNode] = field(default_factory=list)  # En orden de recorrido, la raíz la primera
+    errors: Dict[str, str] = field(default_factory=dict)  # ID -> error de las issues que no se pudieron obtener
+    truncated: bool = False  # Quedaron issues relacionadas sin visitar por max_nodes
+    visited: Set[str] = field(default_factory=set)  # IDs (internos y legibles) ya visitados o pendientes
+    
+    def __post_init__(self):
+        self.nodes.insert(0, self.root)
+        self.visited.update((self.root.id, self.root.idReadable))
+    
+    def expand(self, level: List[IssueNode]) -> List[str]:
+        """
+        Marca como visitadas y devuelve las issues relacionadas con las de un nivel que aún no
+        se han visitado, sin superar max_nodes
+        
+        Args:
+            level: Nodos del nivel actual
+        
+        Returns:
+            List[str]: IDs legibles a obtener para el siguiente nivel, en orden de aparición
+        """
+        next_ids = []
+        for node in level:
+            for _, target in node.edges:
+                if target in self.visited:
+                    continue
+                if len(self.nodes) + len(self.errors) + len(next_ids) >= self.max_nodes:
+                    self.truncated = True
+                    return next_ids
+                self.visited.add(target)
+                next_ids.append(target)
+        return next_ids
+    
+    def add_level(self, results: Iterable[Tuple[str, Optional[IssueNode], Optional[str]]]) -> List[IssueNode]:
+        """
+        Añade al grafo los nodos obtenidos para un nivel
+        
+        Args:
+            results: Por cada ID pedido, el ID, el nodo obtenido y el error si existe
+        
+        Returns:
+            List[IssueNode]: Nodos obtenidos, que forman el siguiente nivel a expandir
+        """
+        level = []
+        for issue_id, node, error in results:
+            if node is None:
+                self.errors[issue_id] = error
+                continue
+            self.visited.update((node.id, node.idReadable))
+            self.nodes.append(node)
+            level.append(node)
+        return level
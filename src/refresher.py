@@ -0,0 +1,148 @@
+"""
+Refresco en segundo plano de los tableros vigilados
+"""
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .metrics import metrics
+
+logger = logging.getLogger("Youtrack MCP")
+
+
+class BoardRefresher:
+    """
+    Mantiene sincronizados en memoria los sprints de una lista de tableros
+
+    Cada interval segundos (con jitter) sincroniza el sprint actual de los tableros
+    vigilados, de modo que getTasksInformation los sirve del snapshot sin esperar a
+    YouTrack. Solo se refrescan los tableros pedidos en los últimos idle_timeout segundos
+    (al arrancar se consideran todos pedidos); un tablero inactivo vuelve a refrescarse
+    en cuanto alguien lo pide.
+    """
+
+    def __init__(self, client, board_names: List[str], interval: float = 60.0,
+                 jitter: float = 0.1, idle_timeout: float = 3600.0):
+        """
+        Inicializa el refresco
+
+        Args:
+            client: Cliente asíncrono de YouTrack (AsyncYouTrackClient)
+            board_names: Nombres de los tableros a vigilar
+            interval: Segundos entre refrescos
+            jitter: Fracción de interval que se suma o resta al azar a cada espera (ej: 0.1 = ±10%)
+            idle_timeout: Segundos sin que nadie pida un tablero tras los que se deja de refrescar
+                          (0 = refrescar siempre)
+        """
+        self.client = client
+        self.interval = max(1.0, interval)
+        self.jitter = min(max(0.0, jitter), 1.0)
+        self.idle_timeout = max(0.0, idle_timeout)
+        self.stats = {"cycles": 0, "refreshes": 0, "errors": 0, "idle_skips": 0}
+        self._names = {name.strip().lower(): name.strip() for name in board_names if name.strip()}
+        # Último uso de cada tablero vigilado por número de comentarios pedido
+        now = time.monotonic()
+        self._last_used: Dict[str, Dict[int, float]] = {key: {1: now} for key in self._names}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def max_age(self) -> float:
+        """Antigüedad con la que se sirve el snapshot de un tablero vigilado (tolera un refresco retrasado)"""
+        return 2 * self.interval
+
+    def is_watched(self, name: str) -> bool:
+        """Indica si un tablero está en la lista de vigilados"""
+        return name.strip().lower() in self._names
+
+    def record_use(self, name: str, num_comments: int = 1) -> None:
+        """
+        Registra que se ha pedido un tablero vigilado, para seguir refrescándolo
+
+        Args:
+            name: Nombre del tablero (case-insensitive)
+            num_comments: Número de comentarios pedido (cada valor tiene su propio snapshot)
+        """
+        key = name.strip().lower()
+        if key in self._last_used:
+            self._last_used[key][num_comments] = time.monotonic()
+
+    def _active(self) -> List[Tuple[str, int]]:
+        """Tableros y números de comentarios pedidos dentro de idle_timeout"""
+        now = time.monotonic()
+        return [
+            (self._names[key], num_comments)
+            for key, uses in self._last_used.items()
+            for num_comments, last_used in uses.items()
+            if not self.idle_timeout or now - last_used < self.idle_timeout
+        ]
+
+    async def refresh(self) -> None:
+        """Sincroniza una vez los sprints de los tableros vigilados activos"""
+        active = self._active()
+        self.stats["cycles"] += 1
+        self.stats["idle_skips"] += sum(len(uses) for uses in self._last_used.values()) - len(active)
+        if not active:
+            return
+
+        resolved, error = await self.client.find_boards_by_names(list(dict.fromkeys(name for name, _ in active)))
+        if error:
+            self.stats["errors"] += 1
+            logger.warning(f"Refresco en segundo plano: no se pudieron obtener los tableros: {error}")
+            return
+
+        boards = {name.lower(): (board, board_error) for name, board, board_error in resolved}
+        for name, num_comments in active:
+            board, board_error = boards[name.lower()]
+            if board_error or not board.current_sprint_id:
+                logger.debug(f"Refresco en segundo plano: se omite '{name}' ({board_error or 'sin sprint activo'})")
+                continue
+
+            try:
+                with metrics.span("refresh_duration_seconds", board=board.name):
+                    count = sum([1 async for _ in self.client.iter_current_issues(board, num_comments)])
+            except Exception as e:
+                self.stats["errors"] += 1
+                metrics.incr("refreshes_total", outcome="error")
+                logger.warning(f"Refresco en segundo plano de '{board.name}' fallido: {e}")
+                continue
+
+            self.stats["refreshes"] += 1
+            metrics.incr("refreshes_total", outcome="ok")
+            logger.debug(f"Refresco en segundo plano de '{board.name}': {count} tareas en curso")
+
+    async def _run(self) -> None:
+        """Bucle de refresco: refresca al arrancar y después cada interval ± jitter segundos"""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Error inesperado en el refresco en segundo plano: {e}")
+            await asyncio.sleep(self.interval * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    def start(self) -> None:
+        """Arranca el refresco en segundo plano en el bucle de eventos actual"""
+        if self._task is None and self._names:
+            logger.info(f"Refresco en segundo plano cada {self.interval:.0f}s de: {', '.join(self._names.values())}")
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Detiene el refresco en segundo plano"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Devuelve los contadores del refresco y el número de tableros vigilados y activos"""
+        return {
+            **self.stats,
+            "watched": len(self._names),
+            "active": len({name for name, _ in self._active()})
+        }
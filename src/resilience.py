@@ -0,0 +1,235 @@
+"""
+Políticas de resiliencia para las peticiones a YouTrack: reintentos, limitación de
+ritmo y circuit breaker
+"""
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+# Estados HTTP que indican un fallo transitorio de YouTrack
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """La petición no se envía porque YouTrack se considera caído (circuito abierto)"""
+    pass
+
+
+class RetryPolicy:
+    """Reintentos con backoff exponencial, jitter y respeto de Retry-After"""
+
+    def __init__(self, max_retries: int = 3, backoff: float = 0.5, max_delay: float = 10.0):
+        """
+        Inicializa la política de reintentos
+
+        Args:
+            max_retries: Reintentos tras el primer intento fallido (0 = sin reintentos)
+            backoff: Espera base en segundos; se duplica en cada reintento
+            max_delay: Espera máxima en segundos entre intentos. Si YouTrack pide
+                       (Retry-After) esperar más, no se reintenta
+        """
+        self.max_retries = max(0, max_retries)
+        self.backoff = max(0.0, backoff)
+        self.max_delay = max(0.0, max_delay)
+
+    @staticmethod
+    def should_retry_status(status_code: int) -> bool:
+        """Indica si un estado HTTP corresponde a un fallo transitorio"""
+        return status_code in RETRYABLE_STATUS
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Calcula la espera antes del siguiente intento
+
+        Args:
+            attempt: Número de reintentos ya realizados
+            retry_after: Segundos pedidos por YouTrack en la cabecera Retry-After, si la hay
+
+        Returns:
+            Optional[float]: Segundos a esperar, o None si no se debe reintentar
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+
+        # Mitad fija y mitad aleatoria: evita que los clientes reintenten a la vez
+        cap = min(self.max_delay, self.backoff * (2 ** attempt))
+        return cap / 2 + random.uniform(0, cap / 2)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Interpreta la cabecera Retry-After (segundos o fecha HTTP)
+
+        Returns:
+            Optional[float]: Segundos a esperar, o None si no hay cabecera o no es válida
+        """
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Limitador de peticiones por segundo con ráfagas (token bucket)"""
+
+    def __init__(self, rate: float = 0.0, burst: int = 10):
+        """
+        Inicializa el limitador
+
+        Args:
+            rate: Peticiones por segundo permitidas de forma sostenida (0 = sin límite)
+            burst: Peticiones que pueden enviarse seguidas sin esperar
+        """
+        self.rate = max(0.0, rate)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si el limitador está activo"""
+        return self.rate > 0
+
+    def reserve(self) -> float:
+        """
+        Reserva un token para una petición
+
+        Los tokens reservados por adelantado dejan el saldo en negativo, de modo que las
+        peticiones concurrentes quedan espaciadas en lugar de salir todas a la vez.
+
+        Returns:
+            float: Segundos que hay que esperar antes de enviar la petición
+        """
+        if not self.enabled:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker de fallos consecutivos
+
+    Tras failure_threshold fallos seguidos el circuito se abre y las peticiones se
+    rechazan sin enviarlas durante reset_timeout segundos. Pasado ese tiempo se deja
+    pasar una petición de prueba: si va bien el circuito se cierra, y si falla vuelve a abrirse.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Inicializa el circuit breaker
+
+        Args:
+            failure_threshold: Fallos consecutivos que abren el circuito (0 = desactivado)
+            reset_timeout: Segundos que el circuito permanece abierto antes de probar de nuevo
+        """
+        self.failure_threshold = max(0, failure_threshold)
+        self.reset_timeout = max(0.0, reset_timeout)
+        self.state = self.CLOSED
+        self.stats = {"opened": 0, "rejected": 0}
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si el circuit breaker está activo"""
+        return self.failure_threshold > 0
+
+    @property
+    def is_open(self) -> bool:
+        """Indica si las peticiones se están rechazando (abierto y sin llegar a reset_timeout)"""
+        return self.state == self.OPEN and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def allow(self) -> bool:
+        """
+        Decide si una petición puede enviarse
+
+        Returns:
+            bool: False si el circuito está abierto (la petición debe fallar sin enviarse)
+        """
+        if not self.enabled:
+            return True
+
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_started_at = None
+
+            # Una sola petición de prueba a la vez (otra si la anterior no informó de su resultado)
+            if self.state == self.HALF_OPEN and (
+                self._trial_started_at is None or now - self._trial_started_at >= self.reset_timeout
+            ):
+                self._trial_started_at = now
+                return True
+
+            self.stats["rejected"] += 1
+            return False
+
+    def record_success(self) -> None:
+        """Registra una respuesta de YouTrack: cierra el circuito"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+            self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """Registra un fallo transitorio: abre el circuito al alcanzar el umbral o si falla la prueba"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.stats["opened"] += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_started_at = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Devuelve los contadores del circuit breaker
+
+        Returns:
+            Dict[str, int]: Veces que se ha abierto, peticiones rechazadas, fallos
+                            consecutivos y si está abierto ahora (1) o no (0)
+        """
+        return {
+            **self.stats,
+            "consecutive_failures": self._failures,
+            "open": int(self.state != self.CLOSED)
+        }
@@ -0,0 +1,248 @@
+"""
+Índice de búsqueda de texto completo en memoria sobre las issues ya obtenidas de YouTrack
+"""
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Collection, Dict, List, Optional, Tuple
+
+from .models import ExtendedIssue, Issue
+
+_TOKEN = re.compile(r"\w+")
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Divide un texto en términos normalizados (minúsculas y sin tildes)
+
+    Args:
+        text: Texto a dividir
+
+    Returns:
+        List[str]: Términos de al menos dos caracteres, en orden de aparición
+    """
+    normalized = unicodedata.normalize("NFKD", text.lower())
+    normalized = "".join(char for char in normalized if not unicodedata.combining(char))
+    return [token for token in _TOKEN.findall(normalized) if len(token) > 1]
+
+
+@dataclass(slots=True)
+class IndexedIssue:
+    """Issue indexada: metadatos para mostrar el resultado y términos por campo"""
+    id: str
+    idReadable: str
+    summary: str
+    state: Optional[str]
+    assignee: Optional[str]
+    updated: Optional[str]
+    fields: Dict[str, Counter]  # Campo -> frecuencia de cada término
+    length: float = 0.0  # Longitud ponderada por FIELD_WEIGHTS
+
+
+@dataclass(slots=True)
+class SearchResult:
+    """Issue encontrada por una búsqueda"""
+    id: str
+    idReadable: str
+    summary: str
+    state: Optional[str] = None
+    assignee: Optional[str] = None
+    score: Optional[float] = None  # Relevancia BM25 (None si la ha encontrado YouTrack)
+    matched_fields: Tuple[str, ...] = ()  # Campos en los que aparecen los términos buscados
+
+    @classmethod
+    def from_issue(cls, issue: Issue) -> "SearchResult":
+        """Resultado a partir de una issue devuelta por la búsqueda de YouTrack"""
+        return cls(id=issue.id, idReadable=issue.idReadable, summary=issue.summary,
+                   state=issue.state, assignee=issue.assignee)
+
+
+class SearchIndex:
+    """
+    Índice invertido con ranking BM25 sobre títulos, descripciones y comentarios
+
+    Se actualiza de forma incremental cada vez que el cliente transforma una issue: si su
+    "updated" no ha cambiado y no aporta campos nuevos, no se vuelve a indexar. Una issue
+    del listado de un sprint aporta título y últimos comentarios; el detalle completo
+    aporta además la descripción y todos los comentarios. Los campos que una fuente no
+    trae se conservan de la versión anterior. Al superar max_documents se descartan las
+    issues indexadas hace más tiempo.
+    """
+
+    # Peso de cada campo en la frecuencia de los términos: el título pesa más
+    FIELD_WEIGHTS = {"summary": 3.0, "description": 1.0, "comments": 1.0}
+    FIELD_LABELS = {"id": "ID", "summary": "título", "description": "descripción", "comments": "comentarios"}
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, max_documents: int = 10000):
+        """
+        Inicializa el índice
+
+        Args:
+            max_documents: Número máximo de issues indexadas (0 = índice desactivado)
+        """
+        self.max_documents = max_documents
+        self.stats = {"indexed": 0, "unchanged": 0, "evictions": 0, "searches": 0}
+        self._docs: "OrderedDict[str, IndexedIssue]" = OrderedDict()
+        self._postings: Dict[str, Dict[str, float]] = {}  # Término -> ID interno -> frecuencia ponderada
+        self._by_readable: Dict[str, str] = {}  # ID legible (minúsculas) -> ID interno
+        self._total_length = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si se indexan issues"""
+        return self.max_documents > 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @staticmethod
+    def _extract_fields(issue: Issue) -> Dict[str, Optional[str]]:
+        """Textos de los campos que aporta esta versión de la issue (los ausentes no se incluyen)"""
+        fields = {"summary": issue.summary or ""}
+        loaded = issue.loaded_sections if isinstance(issue, ExtendedIssue) else frozenset()
+
+        if isinstance(issue, ExtendedIssue) and "description" in loaded:
+            fields["description"] = _HTML_TAG.sub(" ", issue.wikifiedDescription or "")
+        if issue.comments is not None or "comments" in loaded:
+            fields["comments"] = " ".join(f"{comment.author} {comment.text}" for comment in issue.comments or ())
+        return fields
+
+    def add(self, issue: Issue) -> None:
+        """
+        Indexa (o reindexa) una issue
+
+        Args:
+            issue: Issue recién obtenida de YouTrack (del listado de un sprint o detallada)
+        """
+        if not self.enabled:
+            return
+
+        texts = self._extract_fields(issue)
+        with self._lock:
+            previous = self._docs.get(issue.id)
+            if previous is not None and previous.updated == issue.updated and texts.keys() <= previous.fields.keys():
+                self._docs.move_to_end(issue.id)
+                self.stats["unchanged"] += 1
+                return
+
+        # La tokenización se hace fuera del lock
+        fields = {name: Counter(tokenize(text)) for name, text in texts.items()}
+
+        with self._lock:
+            previous = self._docs.pop(issue.id, None)
+            if previous is not None:
+                self._unlink(previous)
+                for name, counts in previous.fields.items():
+                    fields.setdefault(name, counts)
+
+            doc = IndexedIssue(
+                id=issue.id,
+                idReadable=issue.idReadable,
+                summary=issue.summary,
+                state=issue.state,
+                assignee=issue.assignee,
+                updated=issue.updated,
+                fields=fields
+            )
+            weighted: Dict[str, float] = {}
+            for name, counts in fields.items():
+                weight = self.FIELD_WEIGHTS[name]
+                for term, count in counts.items():
+                    weighted[term] = weighted.get(term, 0.0) + weight * count
+            for term, frequency in weighted.items():
+                self._postings.setdefault(term, {})[doc.id] = frequency
+            doc.length = sum(weighted.values())
+
+            self._docs[doc.id] = doc
+            self._by_readable[doc.idReadable.lower()] = doc.id
+            self._total_length += doc.length
+            self.stats["indexed"] += 1
+
+            while len(self._docs) > self.max_documents:
+                _, evicted = self._docs.popitem(last=False)
+                self._unlink(evicted)
+                self.stats["evictions"] += 1
+
+    def _unlink(self, doc: IndexedIssue) -> None:
+        """Quita de los índices invertidos una issue ya sacada de _docs (requiere el lock)"""
+        for counts in doc.fields.values():
+            for term in counts:
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(doc.id, None)
+                    if not postings:
+                        del self._postings[term]
+        if self._by_readable.get(doc.idReadable.lower()) == doc.id:
+            del self._by_readable[doc.idReadable.lower()]
+        self._total_length -= doc.length
+
+    def search(self, query: str, limit: int = 10, within: Optional[Collection[str]] = None) -> List[SearchResult]:
+        """
+        Busca las issues más relevantes para una consulta
+
+        Las issues que contienen más términos de la consulta, con más frecuencia y en el
+        título puntúan más (BM25). Si la consulta es el ID legible de una issue indexada,
+        esa issue aparece la primera.
+
+        Args:
+            query: Texto a buscar
+            limit: Número máximo de resultados
+            within: IDs internos a los que restringir la búsqueda (None = todas las issues)
+
+        Returns:
+            List[SearchResult]: Resultados ordenados de mayor a menor relevancia
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            self.stats["searches"] += 1
+            total_docs = len(self._docs)
+            if not total_docs:
+                return []
+            average_length = self._total_length / total_docs or 1.0
+
+            scores: Dict[str, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    if within is not None and doc_id not in within:
+                        continue
+                    length_norm = 1 - self.B + self.B * self._docs[doc_id].length / average_length
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.K1 + 1) / (frequency + self.K1 * length_norm)
+
+            exact_id = self._by_readable.get(query.strip().lower())
+            if exact_id is not None and (within is None or exact_id in within):
+                scores[exact_id] = math.inf
+
+            ranked = sorted(scores.items(), key=lambda item: -item[1])[:max(0, limit)]
+            results = []
+            for doc_id, score in ranked:
+                doc = self._docs[doc_id]
+                matched = tuple(
+                    self.FIELD_LABELS[name] for name, counts in doc.fields.items()
+                    if any(term in counts for term in terms)
+                )
+                results.append(SearchResult(
+                    id=doc.id,
+                    idReadable=doc.idReadable,
+                    summary=doc.summary,
+                    state=doc.state,
+                    assignee=doc.assignee,
+                    score=score,
+                    matched_fields=matched if score != math.inf else ("ID",)
+                ))
+            return results
+
+    def get_stats(self) -> Dict[str, int]:
+        """Devuelve los contadores del índice, las issues y los términos indexados"""
+        with self._lock:
+            return {**self.stats, "documents": len(self._docs), "terms": len(self._postings)}
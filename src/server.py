@@ -2,11 +2,27 @@
 Servidor MCP para YouTrack
 """
 from mcp.server.fastmcp import FastMCP
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import contextlib
+import functools
+import hmac
 import logging
+import time
 
 from .config import YouTrackConfig
-from .youtrack_client import YouTrackClient
+from .async_youtrack_client import AsyncYouTrackClient
 from .formatters import MarkdownFormatter
+from .metrics import metrics
+from .models import Board, ExtendedIssue, Issue, SprintMetrics
+from .refresher import BoardRefresher
+from .search import SearchResult
+from .base_client import YouTrackAPIError
+
+if TYPE_CHECKING:
+    # Starlette solo se importa al servir por HTTP o exponer el endpoint de notificaciones
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
 
 logger = logging.getLogger("Youtrack MCP")
 
@@ -17,10 +33,46 @@ formatter = MarkdownFormatter()
 # Variables globales que se inicializarán en run_server()
 config = None
 client = None
+tool_slots: Optional[asyncio.Semaphore] = None  # Límite de llamadas simultáneas (--workers)
+refresher: Optional[BoardRefresher] = None  # Refresco de tableros vigilados (--watch-boards)
+prewarm_task: Optional[asyncio.Task] = None  # Precalentamiento en curso (--prewarm)
+
+TRANSPORTS = ("stdio", "streamable-http")
+WEBHOOK_PATH = "/webhooks/youtrack"
+
+
+def limit_concurrency(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """
+    Decorador para herramientas que consultan YouTrack: con --workers, las llamadas que
+    superan el límite esperan turno en lugar de ejecutarse todas a la vez
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        if tool_slots is None:
+            return await fn(*args, **kwargs)
+        async with tool_slots:
+            return await fn(*args, **kwargs)
+    
+    return wrapper
+
+
+def _snapshot_max_age(board: Board, num_comments: int) -> float:
+    """
+    Antigüedad máxima con la que se sirve el snapshot del sprint de un tablero sin consultar a YouTrack
+    
+    Los tableros vigilados se refrescan en segundo plano, así que se sirven de memoria;
+    el resto se sincroniza en cada llamada.
+    """
+    if refresher is None or not refresher.is_watched(board.name):
+        return 0.0
+    refresher.record_use(board.name, num_comments)
+    return refresher.max_age
 
 
 @mcp.tool()
-def getTasksInformation(name: str, num_comments: int = 1) -> str:
+@metrics.timed_tool
+@limit_concurrency
+async def getTasksInformation(name: str, num_comments: int = 1) -> str:
     """
     Read the Agile Panel from Youtrack, obtaining information about all the tasks and returns a markdown detailing it.
 
@@ -41,7 +93,7 @@ def getTasksInformation(name: str, num_comments: int = 1) -> str:
         return "❌ **Error de parámetro**\n\nEl número de comentarios debe ser mayor o igual a 0."
     
     # Buscar tablero por nombre
-    board, error = client.find_board_by_name(name)
+    board, error = await client.find_board_by_name(name)
     if error:
         return f"❌ **Error al buscar tablero**\n\n{error}"
     
@@ -49,27 +101,220 @@ def getTasksInformation(name: str, num_comments: int = 1) -> str:
     if not board.current_sprint_id:
         return f"⚠️ **Sin sprint activo**\n\nEl tablero '{board.name}' no tiene un sprint activo."
     
-    # Obtener issues del sprint
-    issues, error = client.get_sprint_issues(board.id, board.current_sprint_id, num_comments)
-    if error:
-        return f"❌ **Error al obtener tareas**\n\n{error}"
+    # Recorrer solo las tareas en progreso (no terminadas), sincronizando solo los cambios
+    active_issues = client.iter_current_issues(board, num_comments, max_age=_snapshot_max_age(board, num_comments))
+    
+    issue_count = 0
+    
+    async def in_progress_issues() -> AsyncIterator[Issue]:
+        nonlocal issue_count
+        async for issue in active_issues:
+            logger.debug(f"- {issue.id} | {issue.summary}")
+            issue_count += 1
+            yield issue
     
-    # Filtrar solo tareas en progreso (no terminadas)
-    in_progress_issues = [
-        issue for issue in issues 
-        if not issue.is_finished(config.finished_states)
-    ]
+    # Generar el reporte en markdown a medida que llegan las páginas
+    try:
+        report = await formatter.format_tasks_report_async(in_progress_issues())
+    except YouTrackAPIError as e:
+        return f"❌ **Error al obtener tareas**\n\n{e}"
     
     # Log de tareas en progreso
-    logger.info("Tareas EN CURSO:")
-    for task in in_progress_issues:
-        logger.info(f"- {task.id} | {task.summary}")
+    logger.info(f"Tareas EN CURSO en '{board.name}': {issue_count}")
+    return report
+
+@mcp.tool()
+@metrics.timed_tool
+@limit_concurrency
+async def getTasksInformationForBoards(names: Optional[List[str]] = None, num_comments: int = 1) -> str:
+    """
+    Read several Agile Panels from Youtrack in a single call and returns a combined markdown report
+    with one section per board.
+
+    The boards are resolved from a single listing and their sprints are fetched concurrently.
+    A board that fails (unknown name, no active sprint, API error) shows the error in its own
+    section without affecting the others.
+
+    Args:
+        names (List[str], optional): Names of the boards to report. Empty or omitted for all boards.
+        num_comments (int): Number of latest comments to retrieve per task (default: 1).
+
+    Returns:
+        str: A string containing the tasks of every board in markdown format.
+    """
+    
+    # Validar configuración
+    if not config or not config.is_configured:
+        return "❌ **Error de configuración**\n\nLas variables de entorno YOUTRACK_BASE_URL y YOUTRACK_API_TOKEN deben estar configuradas."
     
-    # Generar el reporte en markdown
-    return formatter.format_tasks_report(in_progress_issues)
+    # Validar parámetro num_comments
+    if num_comments < 0:
+        return "❌ **Error de parámetro**\n\nEl número de comentarios debe ser mayor o igual a 0."
+    
+    # Normalizar nombres: quitar vacíos y duplicados (sin distinguir mayúsculas) conservando el orden
+    unique_names = list({
+        name.strip().lower(): name.strip() for name in reversed(names or []) if name and name.strip()
+    }.values())[::-1]
+    
+    # Resolver todos los tableros con un único listado
+    boards, error = await client.find_boards_by_names(unique_names)
+    if error:
+        return f"❌ **Error al buscar tableros**\n\n{error}"
+    
+    if not boards:
+        return "⚠️ **Sin tableros**\n\nNo hay tableros disponibles en YouTrack."
+    
+    semaphore = asyncio.Semaphore(config.max_concurrency)
+    
+    async def board_section(name: str, board: Optional[Board], error: Optional[str]) -> Tuple[str, str]:
+        if error:
+            return f"## 📋 {name}\n\n❌ **Error al buscar tablero**\n\n{error}", "error"
+        
+        heading = formatter.board_heading(board)
+        if not board.current_sprint_id:
+            return f"{heading}\n\n⚠️ **Sin sprint activo**\n\nEl tablero '{board.name}' no tiene un sprint activo.", "warning"
+        
+        async with semaphore:
+            try:
+                issues = client.iter_current_issues(board, num_comments, max_age=_snapshot_max_age(board, num_comments))
+                report = await formatter.format_tasks_report_async(issues, heading)
+            except YouTrackAPIError as e:
+                return f"{heading}\n\n❌ **Error al obtener tareas**\n\n{e}", "error"
+        return report, "ok"
+    
+    # Todos los tableros se consultan a la vez (con el límite del semáforo) y se entregan en orden
+    sections = [asyncio.ensure_future(board_section(name, board, error)) for name, board, error in boards]
+    try:
+        report = "".join([chunk async for chunk in formatter.aiter_boards_report(sections)])
+    finally:
+        for section in sections:
+            section.cancel()
+    
+    # Log del reporte combinado
+    logger.info(f"Reporte de {len(boards)} tableros generado")
+    return report
 
 @mcp.tool()
-def getIssueById(issue_id: str) -> str:
+@metrics.timed_tool
+@limit_concurrency
+async def getSprintMetrics(name: str, stale_days: int = 7) -> str:
+    """
+    Compute aggregate metrics for the current sprint of a board and return a compact markdown summary.
+
+    Instead of the full task table, it returns totals per state, in-progress workload per assignee,
+    estimation vs. spent time, and only the IDs of the issues that need attention (stale, over
+    estimate, without estimation or without assignee). Use getIssueById to inspect them.
+
+    Args:
+        name (str): The name of the board.
+        stale_days (int): Days without updates after which an in-progress issue is considered stale (default: 7).
+
+    Returns:
+        str: Sprint metrics in markdown format.
+    """
+    
+    # Validar configuración
+    if not config or not config.is_configured:
+        return "❌ **Error de configuración**\n\nLas variables de entorno YOUTRACK_BASE_URL y YOUTRACK_API_TOKEN deben estar configuradas."
+    
+    # Validar parámetro stale_days
+    if stale_days < 1:
+        return "❌ **Error de parámetro**\n\nEl número de días para considerar una issue estancada debe ser mayor o igual a 1."
+    
+    # Buscar tablero por nombre
+    board, error = await client.find_board_by_name(name)
+    if error:
+        return f"❌ **Error al buscar tablero**\n\n{error}"
+    
+    # Verificar que tenga sprint activo
+    if not board.current_sprint_id:
+        return f"⚠️ **Sin sprint activo**\n\nEl tablero '{board.name}' no tiene un sprint activo."
+    
+    # Agregar todas las issues del sprint (también las terminadas) a medida que llegan, sin comentarios
+    sprint_metrics = SprintMetrics(
+        finished_states=config.finished_states,
+        stale_before=int((time.time() - stale_days * 86400) * 1000)
+    )
+    try:
+        async for issue in client.iter_sprint_issues(board.id, board.current_sprint_id, num_comments=0):
+            sprint_metrics.add(issue)
+    except YouTrackAPIError as e:
+        return f"❌ **Error al obtener tareas**\n\n{e}"
+    
+    # Log de las métricas calculadas
+    logger.info(f"Métricas del sprint de '{board.name}': {sprint_metrics.total} issues, {sprint_metrics.in_progress} en curso")
+    
+    with metrics.span("phase_duration_seconds", phase="format"):
+        return formatter.format_sprint_metrics(board, sprint_metrics, stale_days)
+
+@mcp.tool()
+@metrics.timed_tool
+@limit_concurrency
+async def searchIssues(query: str, board: Optional[str] = None, limit: int = 10) -> str:
+    """
+    Busca issues que mencionan un texto en su título, descripción o comentarios.
+    
+    Responde en milisegundos desde un índice local de todas las issues que el servidor ya ha
+    obtenido (tableros, issues consultadas y búsquedas anteriores), ordenadas por relevancia.
+    Si el índice no cubre el ámbito pedido o no encuentra nada, usa la búsqueda de YouTrack.
+
+    Args:
+        query (str): Texto a buscar (ej: "timeout login"). También acepta un ID legible (ej: "DEMO-123").
+        board (str, opcional): Nombre del tablero a cuyas tareas en curso del sprint actual se
+                               restringe la búsqueda. Por defecto se busca en todas las issues.
+        limit (int): Número máximo de resultados, entre 1 y 50 (default: 10).
+
+    Returns:
+        str: Issues encontradas con su estado, responsable y los campos en los que coinciden.
+    """
+    
+    # Validar configuración
+    if not config or not config.is_configured:
+        return "❌ **Error de configuración**\n\nLas variables de entorno YOUTRACK_BASE_URL y YOUTRACK_API_TOKEN deben estar configuradas."
+    
+    # Validar parámetros
+    if not query or not query.strip():
+        return "❌ **Error de parámetro**\n\nEl texto a buscar es requerido y no puede estar vacío."
+    if not 1 <= limit <= 50:
+        return "❌ **Error de parámetro**\n\nEl número máximo de resultados debe estar entre 1 y 50."
+    
+    query = query.strip()
+    scope_board = None
+    within = None
+    
+    if board:
+        scope_board, error = await client.find_board_by_name(board)
+        if error:
+            return f"❌ **Error al buscar tablero**\n\n{error}"
+        if not scope_board.current_sprint_id:
+            return f"⚠️ **Sin sprint activo**\n\nEl tablero '{scope_board.name}' no tiene un sprint activo."
+        
+        # El índice cubre el tablero si ya se ha sincronizado su sprint (ej: con getTasksInformation)
+        snapshot = client.sprint_snapshots.find(scope_board.id, scope_board.current_sprint_id)
+        within = set(snapshot.issues) if snapshot is not None else None
+    
+    results: List[SearchResult] = []
+    source = "local"
+    if client.search_index.enabled and (scope_board is None or within is not None):
+        with metrics.span("phase_duration_seconds", phase="search"):
+            results = client.search_index.search(query, limit, within)
+    
+    # Sin cobertura o sin coincidencias locales (el índice puede no tener descripciones): buscar en YouTrack
+    if not results:
+        issues, error = await client.search_issues(query, scope_board, limit)
+        if error:
+            return f"❌ **Error al buscar issues**\n\n{error}"
+        results = [SearchResult.from_issue(issue) for issue in issues]
+        source = "youtrack"
+    
+    # Log de la búsqueda
+    logger.info(f"Búsqueda '{query}': {len(results)} resultados ({source})")
+    return formatter.format_search_results(query, results, source, scope_board)
+
+@mcp.tool()
+@metrics.timed_tool
+@limit_concurrency
+async def getIssueById(issue_id: str, sections: Optional[List[str]] = None) -> str:
     """
     Obtiene información detallada de una issue específica por su ID.
     
@@ -81,6 +326,10 @@ def getIssueById(issue_id: str) -> str:
         issue_id (str): El ID de la issue a analizar. Acepta tanto:
                        - ID legible (ej: "DEMO-123", "PROJ-456") 
                        - ID interno (ej: "3-3", "2-15")
+        sections (List[str], opcional): Secciones de detalle a incluir además de la información
+                       básica y temporal. Valores: "description", "comments", "people",
+                       "relations", "attachments", "tags". Por defecto se incluyen todas;
+                       para un triaje rápido basta con ["description", "comments"].
 
     Returns:
         str: Información completa de la issue en formato markdown estructurado.
@@ -96,8 +345,14 @@ def getIssueById(issue_id: str) -> str:
     
     issue_id = issue_id.strip()
     
-    # Obtener issue por ID
-    issue, error = client.get_issue_by_id(issue_id)
+    # Validar secciones
+    try:
+        requested_sections = ExtendedIssue.resolve_sections(sections)
+    except ValueError as e:
+        return f"❌ **Error de parámetro**\n\n{e}"
+    
+    # Obtener issue por ID (solo con las secciones pedidas)
+    issue, error = await client.get_issue_by_id(issue_id, sections)
     if error:
         return f"❌ **Error al obtener issue**\n\n{error}"
     
@@ -106,26 +361,404 @@ def getIssueById(issue_id: str) -> str:
     
     # Log de la issue obtenida
     logger.info(f"Issue obtenida: {issue.id} | {issue.summary}")
+    logger.debug(f"Estadísticas de caché: {client.get_cache_stats()}")
     
     # Generar el reporte detallado en markdown
-    return formatter.format_extended_issue(issue)
+    with metrics.span("phase_duration_seconds", phase="format"):
+        return formatter.format_extended_issue(issue, requested_sections)
+
+@mcp.tool()
+@metrics.timed_tool
+@limit_concurrency
+async def getIssuesByIds(issue_ids: List[str]) -> str:
+    """
+    Obtiene información detallada de varias issues en una sola llamada.
+    
+    Las issues se consultan de forma concurrente. Si alguna falla (no existe, sin permisos...)
+    su error aparece en su sección sin afectar al resto del lote.
+
+    Args:
+        issue_ids (List[str]): IDs de las issues a analizar, legibles (ej: "DEMO-123")
+                               o internos (ej: "3-3").
 
+    Returns:
+        str: Resumen del lote y la información completa de cada issue en formato markdown.
+    """
+    
+    # Validar configuración
+    if not config or not config.is_configured:
+        return "❌ **Error de configuración**\n\nLas variables de entorno YOUTRACK_BASE_URL y YOUTRACK_API_TOKEN deben estar configuradas."
+    
+    # Normalizar IDs: quitar vacíos y duplicados conservando el orden
+    unique_ids = list(dict.fromkeys(issue_id.strip() for issue_id in issue_ids if issue_id and issue_id.strip()))
+    
+    if not unique_ids:
+        return "❌ **Error de parámetro**\n\nSe requiere al menos un ID de issue no vacío."
+    
+    results = await client.get_issues_by_ids(unique_ids)
+    
+    # Log del lote obtenido
+    logger.info(f"Lote de issues obtenido: {len(unique_ids)} solicitadas, {sum(1 for _, issue, _ in results if issue)} encontradas")
+    
+    # Generar el reporte combinado en markdown
+    with metrics.span("phase_duration_seconds", phase="format"):
+        return formatter.format_extended_issues(results)
+
+@mcp.tool()
+@metrics.timed_tool
+@limit_concurrency
+async def getIssueGraph(issue_id: str, depth: int = 2, max_nodes: int = 50) -> str:
+    """
+    Obtiene el grafo de issues relacionadas con una issue en una sola llamada.
+    
+    Recorre en anchura los enlaces (depende de, duplica, relacionada...), el padre y las
+    subtareas de la issue y de las issues que va encontrando, sin repetir issues. De cada
+    issue se devuelve un resumen ligero (título, estado, responsable); la descripción
+    solo se incluye para la issue raíz. Útil para analizar bloqueos y dependencias sin
+    pedir las issues una a una.
+
+    Args:
+        issue_id (str): ID de la issue raíz, legible (ej: "DEMO-123") o interno (ej: "3-3").
+        depth (int): Número máximo de saltos desde la raíz, entre 0 y 5 (default: 2).
+        max_nodes (int): Número máximo de issues a incluir, entre 1 y 200 (default: 50).
+
+    Returns:
+        str: Tabla con un resumen de cada issue y la lista de relaciones entre ellas en formato markdown.
+    """
+    
+    # Validar configuración
+    if not config or not config.is_configured:
+        return "❌ **Error de configuración**\n\nLas variables de entorno YOUTRACK_BASE_URL y YOUTRACK_API_TOKEN deben estar configuradas."
+    
+    # Validar parámetros
+    if not issue_id or not issue_id.strip():
+        return "❌ **Error de parámetro**\n\nEl ID de la issue es requerido y no puede estar vacío."
+    if not 0 <= depth <= 5:
+        return "❌ **Error de parámetro**\n\nLa profundidad debe estar entre 0 y 5."
+    if not 1 <= max_nodes <= 200:
+        return "❌ **Error de parámetro**\n\nEl número máximo de issues debe estar entre 1 y 200."
+    
+    graph, error = await client.get_issue_graph(issue_id.strip(), depth, max_nodes)
+    if error:
+        return f"❌ **Error al obtener issue**\n\n{error}"
+    
+    # Log del grafo obtenido
+    logger.info(f"Grafo de {graph.root.idReadable}: {len(graph.nodes)} issues hasta profundidad {depth}")
+    
+    with metrics.span("phase_duration_seconds", phase="format"):
+        return formatter.format_issue_graph(graph)
 
-def run_server(timeout: int = 30, finished_states: str = "Fixed,Verified"):
+@mcp.tool()
+@metrics.timed_tool
+async def getDiagnostics(output_format: str = "markdown") -> str:
+    """
+    Devuelve métricas internas del servidor para analizar su rendimiento.
+    
+    Incluye la duración de cada herramienta, el tiempo empleado en cada fase (petición
+    HTTP, decodificación JSON, transformación en modelos y formateo markdown), las
+    peticiones y bytes recibidos de YouTrack y las estadísticas de cachés y conexiones.
+
+    Args:
+        output_format (str): "markdown" para un informe legible (por defecto) o "prometheus"
+                             para el formato de texto de exposición de Prometheus.
+
+    Returns:
+        str: Métricas en el formato pedido.
+    """
+    
+    if output_format not in ("markdown", "prometheus"):
+        return "❌ **Error de parámetro**\n\nEl formato debe ser 'markdown' o 'prometheus'."
+    
+    client_stats = client.get_diagnostics() if client else {}
+    if refresher is not None:
+        client_stats["refresher"] = refresher.get_stats()
+    
+    if output_format == "prometheus":
+        gauges = [
+            ("client_stats", {"component": component, "stat": name}, value)
+            for component, stats in client_stats.items()
+            for name, value in stats.items()
+        ]
+        return metrics.render_prometheus(gauges)
+    
+    return formatter.format_diagnostics(metrics.snapshot(), client_stats)
+
+
+def _webhook_authorized(request: "Request") -> bool:
+    """Comprueba el token de la notificación (X-Webhook-Token o Authorization: Bearer) si hay secreto configurado"""
+    if not config.webhook_secret:
+        return True
+    
+    token = request.headers.get("x-webhook-token")
+    if token is None:
+        scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+        token = credentials if scheme.lower() == "bearer" else ""
+    return hmac.compare_digest(token.encode("utf-8"), config.webhook_secret.encode("utf-8"))
+
+
+def _parse_webhook_events(payload: Any) -> Tuple[List[Dict[str, Optional[str]]], Optional[str]]:
+    """
+    Extrae los cambios notificados: un objeto o una lista de objetos con issueId, boardId y/o sprintId
+    
+    Returns:
+        Tuple[List[Dict[str, Optional[str]]], Optional[str]]: Cambios (issue_id, board_id, sprint_id) y error si existe
+    """
+    items = payload if isinstance(payload, list) else [payload]
+    events = []
+    
+    for item in items:
+        if not isinstance(item, dict):
+            return [], "Cada notificación debe ser un objeto JSON"
+        
+        event = {}
+        for key, field_name in (("issue_id", "issueId"), ("board_id", "boardId"), ("sprint_id", "sprintId")):
+            value = item.get(field_name)
+            if value is not None and not isinstance(value, str):
+                return [], f"'{field_name}' debe ser un texto"
+            event[key] = value.strip() if value and value.strip() else None
+        
+        if not any(event.values()):
+            return [], "Cada notificación debe incluir issueId, boardId o sprintId"
+        events.append(event)
+    
+    return events, None
+
+
+async def youtrack_webhook(request: "Request") -> "JSONResponse":
+    """
+    Recibe notificaciones de cambios de YouTrack y descarta de las cachés los datos afectados
+    
+    Cuerpo: {"issueId": "DEMO-1", "boardId": "120-1", "sprintId": "121-1"} (todos opcionales,
+    al menos uno) o una lista de objetos así. Responde con lo descartado por cada cambio.
+    """
+    from starlette.responses import JSONResponse
+    
+    if not _webhook_authorized(request):
+        metrics.incr("webhook_events_total", outcome="unauthorized")
+        return JSONResponse({"error": "Token no válido"}, status_code=401)
+    
+    try:
+        payload = await request.json()
+    except ValueError:
+        metrics.incr("webhook_events_total", outcome="invalid")
+        return JSONResponse({"error": "El cuerpo debe ser JSON"}, status_code=400)
+    
+    events, error = _parse_webhook_events(payload)
+    if error:
+        metrics.incr("webhook_events_total", outcome="invalid")
+        return JSONResponse({"error": error}, status_code=400)
+    
+    invalidated = [await client.invalidate(**event) for event in events]
+    metrics.incr("webhook_events_total", len(events), outcome="ok")
+    return JSONResponse({"invalidated": invalidated})
+
+
+def run_server(timeout: int = 30, finished_states: str = "Fixed,Verified",
+               pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True,
+               board_cache_ttl: int = 300, max_concurrency: int = 8,
+               page_size: int = 100, server_side_filter: bool = True,
+               count_filtered_issues: bool = False,
+               comments_subquery_threshold: int = 20,
+               snapshot_full_sync_interval: int = 600, cache_dir: Optional[str] = None,
+               cache_max_mb: int = 100, issue_cache_size: int = 256,
+               extra_fields: str = "", max_retries: int = 3,
+               retry_backoff: float = 0.5, retry_max_delay: float = 10.0,
+               rate_limit: float = 0.0, rate_limit_burst: int = 10,
+               circuit_failure_threshold: int = 5, circuit_reset_timeout: float = 30.0,
+               transport: str = "stdio", host: str = "127.0.0.1", port: int = 8000,
+               workers: int = 0, webhook: bool = False, webhook_port: int = 8001,
+               webhook_secret: Optional[str] = None, watch_boards: str = "",
+               refresh_interval: float = 60.0, refresh_jitter: float = 0.1,
+               refresh_idle_timeout: float = 3600.0, search_index_size: int = 10000,
+               prewarm: bool = False):
     """
     Ejecuta el servidor MCP con configuración personalizable
     
     Args:
         timeout: Timeout para requests en segundos
         finished_states: Estados considerados terminados (separados por comas)
+        pool_maxsize: Máximo de conexiones abiertas por host
+        pool_block: Esperar una conexión libre en lugar de abrir conexiones extra
+        keep_alive: Reutilizar conexiones entre peticiones
+        board_cache_ttl: Segundos de validez del listado de tableros en caché
+        max_concurrency: Máximo de peticiones simultáneas en operaciones por lotes
+        page_size: Número de issues por página al recorrer un sprint
+        server_side_filter: Excluir los estados terminados en la consulta a YouTrack
+        count_filtered_issues: Contar aparte las issues terminadas evitadas por el filtrado en servidor
+        comments_subquery_threshold: Comentarios a partir de los cuales una issue pide aparte sus últimos comentarios (0 = siempre en la página)
+        snapshot_full_sync_interval: Segundos entre descargas completas de un sprint
+        cache_dir: Directorio de la caché persistente en disco (None = YOUTRACK_CACHE_DIR o sin caché)
+        cache_max_mb: Tamaño máximo de la caché en disco en MB
+        issue_cache_size: Número de issues detalladas que se mantienen en memoria
+        extra_fields: Custom fields adicionales a extraer de cada issue (separados por comas)
+        max_retries: Reintentos ante errores de red, timeouts y estados 429/5xx
+        retry_backoff: Espera base en segundos entre reintentos (exponencial con jitter)
+        retry_max_delay: Espera máxima en segundos entre reintentos
+        rate_limit: Máximo de peticiones por segundo a YouTrack (0 = sin límite)
+        rate_limit_burst: Peticiones seguidas permitidas antes de aplicar rate_limit
+        circuit_failure_threshold: Fallos consecutivos que abren el circuito (0 = desactivado)
+        circuit_reset_timeout: Segundos con el circuito abierto antes de volver a probar
+        transport: "stdio" (un proceso por cliente) o "streamable-http" (un proceso compartido
+                   por todos los clientes, con el mismo pool de conexiones y cachés)
+        host: Interfaz de escucha en modo streamable-http
+        port: Puerto de escucha en modo streamable-http
+        workers: Máximo de llamadas a herramientas que se ejecutan a la vez (0 = sin límite)
+        webhook: Exponer POST /webhooks/youtrack para recibir notificaciones de cambios y
+                 descartar de las cachés los datos afectados
+        webhook_port: Puerto del endpoint de notificaciones con transport="stdio" (con
+                      streamable-http se sirve en el mismo puerto que MCP)
+        webhook_secret: Token exigido a las notificaciones (None = YOUTRACK_WEBHOOK_SECRET o sin token)
+        watch_boards: Tableros a refrescar en segundo plano (separados por comas; vacío = YOUTRACK_WATCH_BOARDS)
+        refresh_interval: Segundos entre refrescos de los tableros vigilados
+        refresh_jitter: Fracción del intervalo que varía al azar en cada espera
+        refresh_idle_timeout: Segundos sin pedir un tablero vigilado tras los que deja de refrescarse
+        search_index_size: Número máximo de issues en el índice de búsqueda local (0 = desactivado)
+        prewarm: Abrir la conexión con YouTrack y cargar el listado de tableros en segundo
+                 plano mientras el cliente MCP completa la inicialización
     """
-    global config, client
+    global config, client, tool_slots, refresher
+    
+    # El logging se configura al arrancar el servidor, no al importar los módulos (force:
+    # sustituye la configuración que FastMCP aplica al crearse)
+    logging.basicConfig(level=logging.INFO, force=True)
+    
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Transporte no válido: '{transport}'. Valores válidos: {', '.join(TRANSPORTS)}")
     
     # Parsear estados terminados
     parsed_states = [state.strip() for state in finished_states.split(',')]
     
     # Inicializar configuración y cliente una sola vez
-    config = YouTrackConfig(timeout=timeout, finished_states=parsed_states)
-    client = YouTrackClient(config)
+    config = YouTrackConfig(
+        timeout=timeout,
+        finished_states=parsed_states,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        keep_alive=keep_alive,
+        board_cache_ttl=board_cache_ttl,
+        max_concurrency=max_concurrency,
+        page_size=page_size,
+        server_side_filter=server_side_filter,
+        count_filtered_issues=count_filtered_issues,
+        comments_subquery_threshold=comments_subquery_threshold,
+        snapshot_full_sync_interval=snapshot_full_sync_interval,
+        cache_dir=cache_dir,
+        cache_max_mb=cache_max_mb,
+        issue_cache_size=issue_cache_size,
+        extra_fields=[name.strip() for name in extra_fields.split(',') if name.strip()],
+        max_retries=max_retries,
+        retry_backoff=retry_backoff,
+        retry_max_delay=retry_max_delay,
+        rate_limit=rate_limit,
+        rate_limit_burst=rate_limit_burst,
+        circuit_failure_threshold=circuit_failure_threshold,
+        circuit_reset_timeout=circuit_reset_timeout,
+        webhook_secret=webhook_secret,
+        watch_boards=[name.strip() for name in watch_boards.split(',') if name.strip()],
+        refresh_interval=refresh_interval,
+        refresh_jitter=refresh_jitter,
+        refresh_idle_timeout=refresh_idle_timeout,
+        search_index_size=search_index_size
+    )
+    Issue.configure_extra_fields(config.extra_fields)
+    client = AsyncYouTrackClient(config)
+    tool_slots = asyncio.Semaphore(workers) if workers > 0 else None
+    if config.watch_boards:
+        refresher = BoardRefresher(
+            client,
+            config.watch_boards,
+            interval=config.refresh_interval,
+            jitter=config.refresh_jitter,
+            idle_timeout=config.refresh_idle_timeout
+        )
+    
+    if webhook and not config.webhook_secret:
+        logger.warning("Endpoint de notificaciones sin token: cualquiera con acceso a la red puede vaciar las cachés")
+    
+    asyncio.run(_serve(transport, host, port, webhook_port if webhook else None, prewarm))
+
+
+async def _serve(transport: str, host: str, port: int, webhook_port: Optional[int] = None,
+                 prewarm: bool = False) -> None:
+    """
+    Atiende a los clientes MCP con el transporte indicado hasta que se detiene el servidor
+    
+    Args:
+        webhook_port: Puerto del endpoint de notificaciones, o None si está desactivado
+        prewarm: Precalentar el cliente en segundo plano (ver AsyncYouTrackClient.prewarm)
+    """
+    global prewarm_task
+    
+    if prewarm and config.is_configured:
+        prewarm_task = asyncio.create_task(client.prewarm())
+    if refresher is not None:
+        refresher.start()
+    
+    if transport == "stdio":
+        webhook_server = _webhook_server(host, webhook_port) if webhook_port is not None else None
+        webhook_task = asyncio.create_task(webhook_server.serve()) if webhook_server else None
+        try:
+            await mcp.run_stdio_async()
+        finally:
+            if webhook_task is not None:
+                webhook_server.should_exit = True
+                await webhook_task
+            await _shutdown()
+    else:
+        if webhook_port is not None:
+            mcp.custom_route(WEBHOOK_PATH, methods=["POST"])(youtrack_webhook)
+        await _serve_http(host, port)
+
+
+def _webhook_server(host: str, port: int) -> Any:
+    """Servidor uvicorn con solo el endpoint de notificaciones, para usarlo junto al transporte stdio"""
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.routing import Route
+    
+    app = Starlette(routes=[Route(WEBHOOK_PATH, youtrack_webhook, methods=["POST"])])
+    logger.info(f"Notificaciones de cambios en http://{host}:{port}{WEBHOOK_PATH}")
+    # El log de uvicorn va a stderr: stdout queda reservado para el protocolo MCP
+    return uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+
+
+async def _shutdown() -> None:
+    """Detiene las tareas en segundo plano y cierra las conexiones con YouTrack y la caché de disco"""
+    if prewarm_task is not None and not prewarm_task.done():
+        prewarm_task.cancel()
+    if refresher is not None:
+        await refresher.stop()
+    await client.aclose()
+    logger.info("Servidor MCP detenido")
+
+
+async def _serve_http(host: str, port: int) -> None:
+    """
+    Sirve el transporte streamable-http con uvicorn
+    
+    Todas las sesiones comparten el proceso, el cliente de YouTrack y sus cachés. Al
+    recibir SIGINT/SIGTERM se dejan de aceptar conexiones, se espera a que terminen las
+    llamadas en curso (como máximo 30 segundos) y se cierra el cliente.
+    """
+    import uvicorn
+    
+    app = mcp.streamable_http_app()
+    session_lifespan = app.router.lifespan_context
+    
+    # El cierre va en el lifespan: uvicorn vuelve a lanzar la señal recibida al terminar serve()
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[None]:
+        async with session_lifespan(app):
+            yield
+        await _shutdown()
     
-    mcp.run(transport="stdio")
+    app.router.lifespan_context = lifespan
+    server = uvicorn.Server(uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        timeout_graceful_shutdown=30
+    ))
+    logger.info(f"Servidor MCP escuchando en http://{host}:{port}{mcp.settings.streamable_http_path}")
+    await server.serve()
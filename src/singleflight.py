@@ -0,0 +1,54 @@
+"""
+Agrupación de peticiones idénticas simultáneas (single-flight)
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Comparte una única ejecución entre las llamadas concurrentes con la misma clave
+
+    Mientras una llamada está en curso, las que llegan con la misma clave esperan su
+    resultado (o su excepción) en lugar de lanzar otra. Al terminar, la clave se libera y
+    la siguiente llamada vuelve a ejecutarse: no es una caché.
+
+    El resultado se entrega tal cual a todos los que esperan, por lo que no debe modificarse.
+    """
+
+    def __init__(self):
+        self.stats = {"calls": 0, "collapsed": 0}
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Ejecuta fn(*args), o se une a la ejecución en curso con la misma clave
+
+        Args:
+            key: Identificador de la operación (ej: la URL pedida)
+            fn: Función asíncrona a ejecutar
+            *args: Argumentos de fn
+
+        Returns:
+            Any: Resultado compartido de fn
+        """
+        self.stats["calls"] += 1
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(fn(*args))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        else:
+            self.stats["collapsed"] += 1
+
+        # shield: si se cancela quien espera, la petición sigue para el resto
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        """Libera la clave al terminar la ejecución"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Marcar la excepción como recuperada aunque todos los que esperaban se hayan cancelado
+        if not task.cancelled():
+            task.exception()
@@ -1,4 +1,11 @@
+import re
 from datetime import datetime, timezone
+from typing import Optional
+
+# Equivalencias de la jornada laboral por defecto de YouTrack: 1d = 8h, 1w = 5d
+MINUTES_PER_UNIT = {"m": 1, "h": 60, "d": 8 * 60, "w": 5 * 8 * 60}
+_DURATION_PART = re.compile(r"(\d+(?:[.,]\d+)?)\s*([wdhm])", re.IGNORECASE)
+
 
 def _calculate_time_elapsed(timestamp: str) -> str:
     """
@@ -37,3 +44,44 @@ def _calculate_time_elapsed(timestamp: str) -> str:
             
     except (ValueError, TypeError):
         return "Desconocido"
+
+
+def _parse_duration_minutes(presentation: Optional[str]) -> Optional[int]:
+    """
+    Convierte la presentación de un periodo de YouTrack en minutos
+    
+    Args:
+        presentation: Periodo tal como lo muestra YouTrack (ej: "1w 2d 3h 30m", "4h", "2d")
+        
+    Returns:
+        Optional[int]: Minutos (1d = 8h, 1w = 5d), o None si no hay valor o no se reconoce
+    """
+    if not presentation:
+        return None
+    
+    text = presentation.strip()
+    parts = _DURATION_PART.findall(text)
+    # Todo el texto debe estar formado por partes reconocidas (ej: "?" no es un periodo)
+    if not parts or _DURATION_PART.sub("", text).strip():
+        return None
+    
+    return round(sum(float(amount.replace(",", ".")) * MINUTES_PER_UNIT[unit.lower()] for amount, unit in parts))
+
+
+def _format_minutes(minutes: int) -> str:
+    """
+    Formatea una cantidad de minutos como un periodo de YouTrack
+    
+    Args:
+        minutes: Minutos (1d = 8h, 1w = 5d)
+        
+    Returns:
+        str: Periodo legible (ej: "1w 2d 3h 30m"), "0m" si es cero
+    """
+    parts = []
+    remaining = abs(minutes)
+    for unit in ("w", "d", "h", "m"):
+        amount, remaining = divmod(remaining, MINUTES_PER_UNIT[unit])
+        if amount:
+            parts.append(f"{amount}{unit}")
+    return ("-" if minutes < 0 else "") + (" ".join(parts) or "0m")
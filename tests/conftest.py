@@ -0,0 +1,34 @@
+"""
+Fixtures comunes: YouTrack simulado local y clientes contra él
+
+El servidor simulado es el de los benchmarks (benchmarks/fake_youtrack.py), así que la suite
+se ejecuta desde la raíz del repositorio.
+"""
+from typing import Any
+
+import pytest
+
+from benchmarks.fake_youtrack import FakeYouTrackConfig, FakeYouTrackServer
+from src.async_youtrack_client import AsyncYouTrackClient
+from src.config import YouTrackConfig
+
+
+@pytest.fixture
+def fake_youtrack():
+    """YouTrack simulado con un tablero de 30 issues (3 comentarios cada una)"""
+    server = FakeYouTrackServer(FakeYouTrackConfig(boards=1, issues_per_sprint=30)).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_client(fake_youtrack, monkeypatch):
+    """Crea clientes asíncronos contra el YouTrack simulado (hay que cerrarlos con aclose)"""
+    monkeypatch.setenv("YOUTRACK_BASE_URL", fake_youtrack.base_url)
+    monkeypatch.setenv("YOUTRACK_API_TOKEN", "test")
+
+    def factory(**options: Any) -> AsyncYouTrackClient:
+        options.setdefault("retry_backoff", 0.0)
+        return AsyncYouTrackClient(YouTrackConfig(**options))
+
+    return factory
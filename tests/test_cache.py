@@ -0,0 +1,134 @@
+"""
+Tests de las cachés en memoria: registro de tableros, issues detalladas y snapshots de sprint
+"""
+import time
+
+from src.cache import BoardRegistry, IssueCache, SprintSnapshotStore
+from src.models import Board, ExtendedIssue, Issue
+
+FINISHED = ["Fixed", "Verified"]
+
+
+def make_issue(number: int, state: str = "Open", updated: int = 1000) -> Issue:
+    return Issue(id=f"2-{number}", idReadable=f"DEMO-{number}", summary=f"Tarea {number}",
+                 state=state, updated=str(updated))
+
+
+def make_detail(number: int) -> ExtendedIssue:
+    return ExtendedIssue(id=f"2-{number}", idReadable=f"DEMO-{number}", summary=f"Tarea {number}")
+
+
+class TestBoardRegistry:
+    def test_lookup_is_case_insensitive(self):
+        registry = BoardRegistry(ttl=60)
+        registry.update([Board(id="120-1", name="Equipo A")])
+
+        assert [board.id for board in registry.lookup("  equipo a ")] == ["120-1"]
+        assert registry.lookup("Equipo B") is None
+
+    def test_expired_listing_is_not_served(self):
+        registry = BoardRegistry(ttl=60)
+        registry.update([Board(id="120-1", name="Equipo A")], age=61)
+
+        assert not registry.is_fresh
+        assert registry.lookup("Equipo A") is None
+        # matches() ignora el TTL: se usa con YouTrack caído
+        assert [board.id for board in registry.matches("Equipo A")] == ["120-1"]
+
+    def test_invalidate_forces_reload(self):
+        registry = BoardRegistry(ttl=60)
+        registry.update([Board(id="120-1", name="Equipo A")])
+        registry.invalidate()
+
+        assert registry.lookup("Equipo A") is None
+        assert registry.boards
+
+    def test_zero_ttl_disables_cache(self):
+        registry = BoardRegistry(ttl=0)
+        registry.update([Board(id="120-1", name="Equipo A")])
+
+        assert registry.lookup("Equipo A") is None
+
+
+class TestIssueCache:
+    def test_evicts_least_recently_used(self):
+        cache = IssueCache(max_entries=2)
+        cache.put("DEMO-1", make_detail(1))
+        cache.put("DEMO-2", make_detail(2))
+        cache.confirm("DEMO-1")
+        cache.put("DEMO-3", make_detail(3))
+
+        assert cache.get("DEMO-2") is None
+        assert cache.get("DEMO-1") is not None
+        assert cache.stats["evictions"] == 1
+
+    def test_evict_matches_any_id(self):
+        cache = IssueCache()
+        cache.put("DEMO-1", make_detail(1))
+
+        assert cache.evict("2-1") == ["2-1", "DEMO-1"]
+        assert cache.get("DEMO-1") is None
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = IssueCache(max_entries=0)
+        cache.put("DEMO-1", make_detail(1))
+
+        assert cache.get("DEMO-1") is None
+
+
+class TestSprintSnapshotStore:
+    KEY = ("120-1", "121-1", 1)
+
+    def test_replace_tracks_max_updated(self):
+        store = SprintSnapshotStore()
+        snapshot = store.replace(self.KEY, [make_issue(1, updated=1000), make_issue(2, updated=3000)])
+
+        assert set(snapshot.issues) == {"2-1", "2-2"}
+        assert snapshot.max_updated == 3000
+        assert not store.needs_full_sync(snapshot)
+
+    def test_merge_updates_adds_and_drops_finished(self):
+        store = SprintSnapshotStore()
+        store.replace(self.KEY, [make_issue(1), make_issue(2)])
+
+        snapshot = store.merge(self.KEY, [
+            make_issue(1, state="In Progress", updated=2000),
+            make_issue(2, state="Fixed", updated=2500),
+            make_issue(3, updated=1500),
+        ], FINISHED)
+
+        assert set(snapshot.issues) == {"2-1", "2-3"}
+        assert snapshot.issues["2-1"].state == "In Progress"
+        assert snapshot.max_updated == 2500
+        assert store.stats["delta_issues"] == 3
+
+    def test_merge_without_snapshot_returns_none(self):
+        assert SprintSnapshotStore().merge(self.KEY, [make_issue(1)], FINISHED) is None
+
+    def test_needs_full_sync_after_interval(self):
+        store = SprintSnapshotStore(full_sync_interval=600)
+        snapshot = store.replace(self.KEY, [make_issue(1)])
+
+        assert store.needs_full_sync(None)
+        assert not store.needs_full_sync(snapshot)
+        snapshot.full_synced_at = time.monotonic() - 601
+        assert store.needs_full_sync(snapshot)
+
+    def test_evict_by_readable_issue_id(self):
+        store = SprintSnapshotStore()
+        store.replace(self.KEY, [make_issue(1)])
+        other = ("120-2", "121-2", 1)
+        store.replace(other, [make_issue(5)])
+
+        assert store.evict(issue_id="DEMO-1") == [self.KEY]
+        assert store.get(self.KEY) is None
+        assert store.get(other) is not None
+
+    def test_evict_by_board_and_sprint(self):
+        store = SprintSnapshotStore()
+        store.replace(("120-1", "121-1", 0), [make_issue(1)])
+        store.replace(("120-1", "121-1", 1), [make_issue(1)])
+        store.replace(("120-2", "121-2", 1), [make_issue(2)])
+
+        assert len(store.evict(board_id="120-1")) == 2
+        assert store.evict(sprint_id="121-2") == [("120-2", "121-2", 1)]
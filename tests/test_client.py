@@ -0,0 +1,360 @@
+"""
+Tests del cliente asíncrono contra el YouTrack simulado de benchmarks/fake_youtrack.py
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src import utils
+from src.async_youtrack_client import YouTrackUnavailableError
+from src.formatters import MarkdownFormatter
+
+FINISHED = ("Fixed", "Verified")
+
+
+def unfinished(server):
+    """Issues en curso del primer tablero del YouTrack simulado"""
+    issues = server.data.sprint_issues[server.data.boards[0]["currentSprint"]["id"]]
+    return [issue for issue in issues if _state(issue) not in FINISHED]
+
+
+def _state(issue):
+    return next(field["value"]["name"] for field in issue["customFields"] if field["name"] == "State")
+
+
+class Tomorrow(utils.datetime):
+    """Reloj de src.utils adelantado un día, para calcular antigüedades"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return utils.datetime.fromtimestamp(time.time() + 86400, tz)
+
+
+def requests_made(server):
+    return server.snapshot()["requests"]
+
+
+async def first_board(client, server):
+    board, error = await client.find_board_by_name(server.data.boards[0]["name"])
+    assert error is None
+    return board
+
+
+def test_active_issues_are_filtered_in_youtrack(make_client, fake_youtrack):
+    async def scenario():
+        client = make_client()
+        board = await first_board(client, fake_youtrack)
+        issues = [issue async for issue in client.iter_active_issues(board, num_comments=1)]
+        await client.aclose()
+        return issues
+
+    issues = asyncio.run(scenario())
+
+    assert {issue.idReadable for issue in issues} == {issue["idReadable"] for issue in unfinished(fake_youtrack)}
+    assert all(len(issue.comments) == 1 for issue in issues)
+
+
+def test_finished_issues_are_only_counted_on_request(make_client, fake_youtrack):
+    async def collect(**options):
+        client = make_client(page_size=100, **options)
+        board = await first_board(client, fake_youtrack)
+        before = requests_made(fake_youtrack)
+        [issue async for issue in client.iter_active_issues(board, num_comments=0)]
+        stats = dict(client.filter_stats)
+        await client.aclose()
+        return requests_made(fake_youtrack) - before, stats
+
+    requests, stats = asyncio.run(collect())
+    assert requests == 1
+    assert stats["server_side_queries"] == 1
+    assert stats["issues_avoided"] == 0
+
+    requests, stats = asyncio.run(collect(count_filtered_issues=True))
+    total = len(fake_youtrack.data.sprint_issues[fake_youtrack.data.boards[0]["currentSprint"]["id"]])
+    assert requests == 2
+    assert stats["issues_avoided"] == total - len(unfinished(fake_youtrack))
+
+
+def test_comment_modes_return_the_same_comments(make_client, fake_youtrack):
+    async def collect(**options):
+        client = make_client(page_size=100, **options)
+        board = await first_board(client, fake_youtrack)
+        before = requests_made(fake_youtrack)
+        issues = [issue async for issue in client.iter_active_issues(board, num_comments=2)]
+        await client.aclose()
+        return {issue.id: issue.comments for issue in issues}, requests_made(fake_youtrack) - before
+
+    inline, inline_requests = asyncio.run(collect(comments_subquery_threshold=0))
+    batched, batched_requests = asyncio.run(collect())
+    subquery, subquery_requests = asyncio.run(collect(comments_subquery_threshold=1))
+
+    # En línea basta la página; por debajo del umbral (20 por defecto) se añade una petición
+    # con los comentarios de toda la página, y por encima una por issue
+    assert inline_requests == 1
+    assert batched_requests == 2
+    assert subquery_requests == 1 + len(inline)
+    assert inline == batched == subquery
+
+
+@pytest.mark.parametrize("stale_count", [1, 20])
+def test_comment_tail_does_not_trust_a_stale_count(make_client, fake_youtrack, stale_count):
+    issue = unfinished(fake_youtrack)[0]
+
+    async def scenario():
+        client = make_client()
+        comments = await client._fetch_latest_comments({"id": issue["id"], "commentsCount": stale_count}, 2)
+        await client.aclose()
+        return comments
+
+    comments = asyncio.run(scenario())
+
+    assert comments[-2:] == issue["comments"][-2:]
+
+
+def test_snapshot_delta_merges_changes_and_new_comments(make_client, fake_youtrack):
+    issues = unfinished(fake_youtrack)
+    finished, commented = issues[0], issues[1]
+
+    async def scenario():
+        client = make_client()
+        board = await first_board(client, fake_youtrack)
+        first = [issue async for issue in client.iter_current_issues(board, num_comments=1)]
+
+        # Un cambio de estado actualiza "updated"; un comentario nuevo puede no hacerlo
+        now = int(time.time() * 1000) + 60000
+        next(field for field in finished["customFields"] if field["name"] == "State")["value"] = {"name": "Fixed"}
+        finished["updated"] = now
+        commented["comments"].append({"author": {"name": "Ana"}, "text": "comentario nuevo", "created": now})
+
+        second = {issue.id: issue async for issue in client.iter_current_issues(board, num_comments=1)}
+        stats = dict(client.sprint_snapshots.stats)
+        await client.aclose()
+        return first, second, stats
+
+    first, second, stats = asyncio.run(scenario())
+
+    assert len(second) == len(first) - 1
+    assert finished["id"] not in second
+    assert second[commented["id"]].comments[0].text == "comentario nuevo"
+    assert stats["full_syncs"] == 1
+    assert stats["delta_syncs"] == 1
+
+
+def test_invalidate_forces_a_full_sync(make_client, fake_youtrack):
+    async def scenario():
+        client = make_client()
+        board = await first_board(client, fake_youtrack)
+        [issue async for issue in client.iter_current_issues(board, num_comments=0)]
+        counts = await client.invalidate(issue_id=unfinished(fake_youtrack)[0]["idReadable"])
+        [issue async for issue in client.iter_current_issues(board, num_comments=0)]
+        stats = dict(client.sprint_snapshots.stats)
+        await client.aclose()
+        return counts, stats
+
+    counts, stats = asyncio.run(scenario())
+
+    assert counts["sprints"] == 1
+    assert stats["full_syncs"] == 2
+
+
+def test_snapshot_survives_a_restart_with_disk_cache(make_client, fake_youtrack, tmp_path):
+    async def sync_once():
+        client = make_client(cache_dir=str(tmp_path))
+        board = await first_board(client, fake_youtrack)
+        issues = [issue async for issue in client.iter_current_issues(board, num_comments=1)]
+        stats = dict(client.sprint_snapshots.stats)
+        await client.aclose()
+        return issues, stats
+
+    first, _ = asyncio.run(sync_once())
+    second, stats = asyncio.run(sync_once())
+
+    assert stats["full_syncs"] == 0
+    assert stats["delta_syncs"] == 1
+    assert sorted(issue.id for issue in second) == sorted(issue.id for issue in first)
+
+
+def test_cached_issue_renders_current_comment_age(make_client, fake_youtrack, monkeypatch):
+    issue_data = fake_youtrack.data.issues["DEMO-1"]
+    issue_data["comments"][-1]["created"] = int(time.time() * 1000) - 2 * 3600000
+
+    async def scenario():
+        client = make_client()
+        issue, _ = await client.get_issue_by_id("DEMO-1")
+        first = MarkdownFormatter.format_extended_issue(issue)
+
+        # Un día después la issue no ha cambiado: se sirve la misma copia en caché
+        monkeypatch.setattr(utils, "datetime", Tomorrow)
+        cached, _ = await client.get_issue_by_id("DEMO-1")
+        second = MarkdownFormatter.format_extended_issue(cached)
+        hits = client.issue_cache.stats["hits"]
+        await client.aclose()
+        return issue, cached, first, second, hits
+
+    issue, cached, first, second, hits = asyncio.run(scenario())
+
+    assert cached is issue
+    assert hits == 1
+    assert "(hace 2h" in first
+    assert "(hace 1d 2h)" in second
+
+
+def test_restored_snapshot_renders_current_comment_age(make_client, fake_youtrack, tmp_path, monkeypatch):
+    for issue in unfinished(fake_youtrack):
+        issue["comments"][-1]["created"] = int(time.time() * 1000) - 2 * 3600000
+
+    async def report():
+        client = make_client(cache_dir=str(tmp_path))
+        board = await first_board(client, fake_youtrack)
+        text = MarkdownFormatter.format_tasks_report(
+            [issue async for issue in client.iter_current_issues(board, num_comments=1)])
+        stats = dict(client.sprint_snapshots.stats)
+        await client.aclose()
+        return text, stats
+
+    first, _ = asyncio.run(report())
+    # Tras un reinicio, un día después y sin cambios en YouTrack, se sirve el snapshot guardado
+    monkeypatch.setattr(utils, "datetime", Tomorrow)
+    second, stats = asyncio.run(report())
+
+    assert stats["full_syncs"] == 0
+    assert "(hace 2h" in first and "(hace 1d" not in first
+    assert "(hace 1d 2h)" in second
+
+
+def test_snapshot_in_an_old_format_is_discarded(make_client, fake_youtrack, tmp_path):
+    async def scenario():
+        client = make_client(cache_dir=str(tmp_path))
+        board = await first_board(client, fake_youtrack)
+        # Formato 1: comentarios guardados ya formateados, con la antigüedad congelada
+        old_issue = {"id": "2-1", "idReadable": "DEMO-1", "summary": "Tarea", "comments": ["Ana: hola (hace 3h)"]}
+        key = client._snapshot_cache_key((board.id, board.current_sprint_id, 1))
+        client.disk_cache.put("sprint", key, {"issues": [old_issue], "full_synced_at": time.time()}, updated=1)
+        issues = [issue async for issue in client.iter_current_issues(board, num_comments=1)]
+        stats = dict(client.sprint_snapshots.stats)
+        await client.aclose()
+        return issues, stats
+
+    issues, stats = asyncio.run(scenario())
+
+    assert stats["full_syncs"] == 1
+    assert len(issues) == len(unfinished(fake_youtrack))
+
+
+def test_retries_transient_errors_respecting_retry_after(make_client):
+    responses = [
+        httpx.Response(503, headers={"Retry-After": "0"}),
+        httpx.Response(429),
+        httpx.Response(200, json=[]),
+    ]
+
+    async def scenario():
+        client = make_client(max_retries=3)
+        client.http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+        data = await client._get_json(client._boards_url())
+        stats = client.get_resilience_stats()
+        await client.aclose()
+        return data, stats
+
+    data, stats = asyncio.run(scenario())
+
+    assert data == []
+    assert stats["retries"] == 2
+    assert stats["consecutive_failures"] == 0
+
+
+def test_gives_up_when_retry_after_is_too_long(make_client):
+    async def scenario():
+        client = make_client(max_retries=3, retry_max_delay=1.0)
+        client.http = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(429, headers={"Retry-After": "60"})))
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._get_json(client._boards_url())
+            return client.get_resilience_stats()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario())["retries"] == 0
+
+
+def test_circuit_breaker_fails_fast_and_serves_cached_issue(make_client, fake_youtrack):
+    async def scenario():
+        client = make_client(max_retries=0, circuit_failure_threshold=2, circuit_reset_timeout=60)
+        issue, error = await client.get_issue_by_id("DEMO-1")
+        assert error is None
+
+        fake_youtrack.config.error_rate = 1.0
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._get_json(client._boards_url())
+
+        before = requests_made(fake_youtrack)
+        with pytest.raises(YouTrackUnavailableError):
+            await client._get_json(client._boards_url())
+        cached, cached_error = await client.get_issue_by_id("DEMO-1")
+        sent = requests_made(fake_youtrack) - before
+        await client.aclose()
+        return issue, cached, cached_error, sent
+
+    issue, cached, cached_error, sent = asyncio.run(scenario())
+
+    assert sent == 0
+    assert cached_error is None
+    assert cached is issue
+
+
+def test_concurrent_identical_requests_are_collapsed(make_client, fake_youtrack):
+    async def scenario():
+        client = make_client()
+        before = requests_made(fake_youtrack)
+        results = await asyncio.gather(*(client.get_issue_by_id("DEMO-3") for _ in range(5)))
+        sent = requests_made(fake_youtrack) - before
+        collapsed = client.get_connection_stats()["collapsed_requests"]
+        await client.aclose()
+        return results, sent, collapsed
+
+    results, sent, collapsed = asyncio.run(scenario())
+
+    assert all(error is None and issue.idReadable == "DEMO-3" for issue, error in results)
+    assert sent == 1
+    assert collapsed == 4
+
+
+def test_issue_graph_breadth_first(make_client):
+    async def scenario(depth, max_nodes):
+        client = make_client()
+        graph, error = await client.get_issue_graph("DEMO-1", depth=depth, max_nodes=max_nodes)
+        await client.aclose()
+        assert error is None
+        return graph
+
+    # DEMO-1 depende de DEMO-2 y es padre de DEMO-2..DEMO-5; DEMO-5 depende de DEMO-6
+    graph = asyncio.run(scenario(depth=1, max_nodes=50))
+    assert [(node.idReadable, node.depth) for node in graph.nodes] == [
+        ("DEMO-1", 0), ("DEMO-2", 1), ("DEMO-3", 1), ("DEMO-4", 1), ("DEMO-5", 1)
+    ]
+    assert graph.root.description
+    assert not graph.truncated
+
+    graph = asyncio.run(scenario(depth=2, max_nodes=50))
+    assert ("DEMO-6", 2) in [(node.idReadable, node.depth) for node in graph.nodes]
+
+    graph = asyncio.run(scenario(depth=2, max_nodes=3))
+    assert len(graph.nodes) == 3
+    assert graph.truncated
+
+
+def test_issue_graph_reports_missing_root(make_client):
+    async def scenario():
+        client = make_client()
+        result = await client.get_issue_graph("NOPE-1")
+        await client.aclose()
+        return result
+
+    graph, error = asyncio.run(scenario())
+
+    assert graph is None
+    assert error
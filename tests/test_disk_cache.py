@@ -0,0 +1,108 @@
+"""
+Tests de la caché persistente en SQLite
+"""
+import pytest
+
+from src.disk_cache import DiskCache
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=1000)
+    yield cache
+    cache.close()
+
+
+def stored_access(cache: DiskCache, key: str) -> float:
+    return cache._conn.execute("SELECT accessed FROM entries WHERE key = ?", (key,)).fetchone()[0]
+
+
+def age_entries(cache: DiskCache) -> None:
+    """Retrasa el último acceso guardado de todas las entradas, en el orden en que se insertaron"""
+    cache._conn.execute("UPDATE entries SET accessed = rowid")
+    cache._conn.commit()
+
+
+def test_roundtrip_and_miss(disk_cache):
+    disk_cache.put("issue", "DEMO-1", {"summary": "Tarea"}, updated=42)
+
+    assert disk_cache.get("issue", "DEMO-1") == (42, {"summary": "Tarea"})
+    assert disk_cache.get("issue", "DEMO-2") is None
+    assert disk_cache.stats["hits"] == 1
+    assert disk_cache.stats["misses"] == 1
+
+
+def test_size_is_counted_in_bytes(disk_cache):
+    disk_cache.put("issue", "DEMO-1", "ñandú")
+
+    # '"ñandú"' son 7 caracteres pero 9 bytes en UTF-8
+    assert disk_cache.get_stats()["bytes"] == 9
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=250)
+    payload = "x" * 100
+    cache.put("issue", "a", payload)
+    cache.put("issue", "b", payload)
+    age_entries(cache)
+    cache.get("issue", "a")
+    cache.put("issue", "c", payload)
+
+    assert cache.get("issue", "a") is not None
+    assert cache.get("issue", "b") is None
+    assert cache.stats["evictions"] == 1
+    cache.close()
+
+
+def test_reads_do_not_write_until_flushed(disk_cache):
+    disk_cache.put("issue", "a", 1)
+    age_entries(disk_cache)
+
+    disk_cache.get("issue", "a")
+    assert stored_access(disk_cache, "a") == 1
+
+    disk_cache.put("issue", "b", 2)
+    assert stored_access(disk_cache, "a") > 1
+
+
+def test_reads_are_flushed_in_batches(disk_cache, monkeypatch):
+    monkeypatch.setattr(DiskCache, "ACCESS_FLUSH_SIZE", 2)
+    disk_cache.put("issue", "a", 1)
+    disk_cache.put("issue", "b", 2)
+    age_entries(disk_cache)
+
+    disk_cache.get("issue", "a")
+    assert stored_access(disk_cache, "a") == 1
+    disk_cache.get("issue", "b")
+
+    assert stored_access(disk_cache, "a") > 1
+    assert not disk_cache._pending_access
+
+
+def test_close_flushes_pending_reads(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=1000)
+    cache.put("issue", "a", 1)
+    age_entries(cache)
+    cache.get("issue", "a")
+    cache.close()
+
+    reopened = DiskCache(str(tmp_path), max_bytes=1000)
+    assert stored_access(reopened, "a") > 1
+    reopened.close()
+
+
+def test_delete_prefix(disk_cache):
+    disk_cache.put("sprint", "120-1:121-1:1", [])
+    disk_cache.put("sprint", "120-1:121-1:0", [])
+    disk_cache.put("sprint", "120-2:121-2:1", [])
+
+    assert disk_cache.delete_prefix("sprint", "120-1:") == 2
+    assert disk_cache.get("sprint", "120-2:121-2:1") is not None
+
+
+def test_corrupt_entry_is_discarded(disk_cache):
+    disk_cache.put("issue", "a", 1)
+    disk_cache._conn.execute("UPDATE entries SET payload = '{' WHERE key = 'a'")
+
+    assert disk_cache.get("issue", "a") is None
+    assert disk_cache.get_stats()["entries"] == 0
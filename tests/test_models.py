@@ -0,0 +1,155 @@
+"""
+Tests de los modelos: decodificación de issues, secciones del detalle y grafo de relaciones
+"""
+import pytest
+
+from src.models import ExtendedIssue, Issue, IssueGraph, IssueNode
+
+
+def comment(text: str, created: int) -> dict:
+    return {"author": {"name": "Ana"}, "text": text, "created": created}
+
+
+ISSUE_DATA = {
+    "id": "2-1",
+    "idReadable": "DEMO-1",
+    "summary": "Error en el login",
+    "updated": 1000,
+    "customFields": [
+        {"name": "State", "value": {"name": "In Progress"}},
+        {"name": "Assignee", "value": [{"name": "Ana García"}, {"name": "Luis Pérez"}]},
+        {"name": "Estimation", "value": {"presentation": "2d"}},
+        {"name": "Spent time", "value": None},
+        {"name": "Priority", "value": {"name": "Major"}},
+        {"name": "Subsystem", "value": [{"name": "api"}, {"name": "web"}]},
+    ],
+    "comments": [comment("primero", 1), comment("segundo", 2), comment("tercero", 3)],
+}
+
+
+class TestIssue:
+    def test_api_fields_by_comment_mode(self):
+        assert "comments" not in Issue.get_api_fields(0)
+        assert Issue.get_api_fields(2).endswith(f"comments({Issue.COMMENT_API_FIELDS})")
+        assert Issue.get_api_fields(2, comments_count_only=True).endswith(",commentsCount")
+
+    def test_decodes_custom_fields_including_multi_value(self):
+        issue = Issue.from_youtrack_data(ISSUE_DATA, num_comments=0)
+
+        assert issue.state == "In Progress"
+        assert issue.assignee == "Ana García, Luis Pérez"
+        assert issue.estimation == "2d"
+        assert issue.spent is None
+
+    def test_keeps_latest_comments_newest_first(self):
+        issue = Issue.from_youtrack_data(ISSUE_DATA, num_comments=2)
+
+        assert [(comment.author, comment.text, comment.created) for comment in issue.comments] == [
+            ("Ana", "tercero", 3), ("Ana", "segundo", 2)
+        ]
+        assert issue.comments_count == 3
+
+    def test_comments_count_prefers_api_value(self):
+        data = {**ISSUE_DATA, "comments": [comment("tercero", 3)], "commentsCount": 3}
+
+        assert Issue.from_youtrack_data(data, num_comments=1).comments_count == 3
+        assert Issue.from_youtrack_data({**ISSUE_DATA, "comments": None}, num_comments=0).comments is None
+
+    def test_extra_fields(self):
+        Issue.configure_extra_fields(["Priority"])
+        try:
+            issue = Issue.from_youtrack_data(ISSUE_DATA, num_comments=0)
+        finally:
+            Issue.configure_extra_fields([])
+
+        assert issue.extra_fields == {"Priority": "Major"}
+
+
+class TestExtendedIssueSections:
+    def test_resolve_sections(self):
+        assert ExtendedIssue.resolve_sections(None) == ExtendedIssue.ALL_SECTIONS
+        assert ExtendedIssue.resolve_sections([" Comments ", ""]) == {"comments"}
+        with pytest.raises(ValueError, match="historial"):
+            ExtendedIssue.resolve_sections(["historial"])
+
+    def test_api_fields_only_include_requested_sections(self):
+        fields = ExtendedIssue.get_api_fields(["description"])
+
+        assert "wikifiedDescription" in fields
+        assert "comments(" not in fields
+        assert "links(" not in fields
+
+    def test_decodes_only_loaded_sections(self):
+        data = {**ISSUE_DATA, "wikifiedDescription": "<p>Texto</p>", "tags": [{"name": "backend"}]}
+        issue = ExtendedIssue.from_youtrack_data(data, sections=["description"])
+
+        assert issue.wikifiedDescription == "<p>Texto</p>"
+        assert issue.comments is None
+        assert issue.tags is None
+        assert issue.subsystem == "api, web"
+        assert issue.priority == "Major"
+        assert issue.loaded_sections == {"description"}
+
+    def test_load_sections_completes_an_issue(self):
+        issue = ExtendedIssue.from_youtrack_data(ISSUE_DATA, sections=["description"])
+        issue.load_sections({"tags": [{"name": "backend"}], "comments": ISSUE_DATA["comments"]},
+                            frozenset({"tags", "comments"}))
+
+        assert issue.tags == ["backend"]
+        assert len(issue.comments) == 3
+        assert issue.loaded_sections == {"description", "tags", "comments"}
+
+
+def node_data(number: int, links=(), parent=(), subtasks=()) -> dict:
+    def refs(numbers):
+        return [{"id": f"2-{n}", "idReadable": f"DEMO-{n}"} for n in numbers]
+
+    return {
+        "id": f"2-{number}",
+        "idReadable": f"DEMO-{number}",
+        "summary": f"Tarea {number}",
+        "customFields": [{"name": "State", "value": {"name": "Open"}}],
+        "links": [
+            {"direction": direction, "linkType": {"name": "Depend", "sourceToTarget": "depends on",
+                                                  "targetToSource": "is required for"},
+             "issues": refs(numbers)}
+            for direction, numbers in links
+        ],
+        "parent": {"issues": refs(parent)},
+        "subtasks": {"issues": refs(subtasks)},
+    }
+
+
+class TestIssueGraph:
+    def test_node_edges_use_relation_names(self):
+        node = IssueNode.from_youtrack_data(
+            node_data(1, links=[("OUTWARD", [2]), ("INWARD", [3])], parent=[4], subtasks=[5, 1]))
+
+        assert node.state == "Open"
+        assert node.edges == [
+            ("depends on", "DEMO-2"),
+            ("is required for", "DEMO-3"),
+            ("subtask of", "DEMO-4"),
+            ("parent for", "DEMO-5"),
+        ]
+
+    def test_expand_skips_visited_issues(self):
+        root = IssueNode.from_youtrack_data(node_data(1, links=[("OUTWARD", [2, 3])]))
+        graph = IssueGraph(root=root, depth=2, max_nodes=10)
+
+        assert graph.expand([root]) == ["DEMO-2", "DEMO-3"]
+        level = graph.add_level([
+            ("DEMO-2", IssueNode.from_youtrack_data(node_data(2, links=[("OUTWARD", [1, 3, 4])]), depth=1), None),
+            ("DEMO-3", None, "Issue no encontrada"),
+        ])
+
+        assert graph.expand(level) == ["DEMO-4"]
+        assert graph.errors == {"DEMO-3": "Issue no encontrada"}
+        assert [node.idReadable for node in graph.nodes] == ["DEMO-1", "DEMO-2"]
+
+    def test_expand_respects_max_nodes(self):
+        root = IssueNode.from_youtrack_data(node_data(1, links=[("OUTWARD", [2, 3, 4])]))
+        graph = IssueGraph(root=root, depth=1, max_nodes=3)
+
+        assert graph.expand([root]) == ["DEMO-2", "DEMO-3"]
+        assert graph.truncated
@@ -0,0 +1,129 @@
+"""
+Tests de la capa de resiliencia: reintentos, limitación de ritmo y circuit breaker
+"""
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src import resilience
+from src.resilience import CircuitBreaker, RetryPolicy, TokenBucket
+
+
+class FakeClock:
+    """Sustituye a time.monotonic para avanzar el tiempo a mano"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience.time, "monotonic", fake)
+    return fake
+
+
+class TestRetryPolicy:
+    def test_backoff_grows_with_jitter_and_cap(self):
+        policy = RetryPolicy(max_retries=5, backoff=1.0, max_delay=3.0)
+
+        for attempt, cap in ((0, 1.0), (1, 2.0), (2, 3.0), (4, 3.0)):
+            for _ in range(20):
+                assert cap / 2 <= policy.delay(attempt) <= cap
+
+    def test_stops_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.delay(1) is not None
+        assert policy.delay(2) is None
+        assert RetryPolicy(max_retries=0).delay(0) is None
+
+    def test_honours_retry_after_up_to_max_delay(self):
+        policy = RetryPolicy(max_retries=3, max_delay=10.0)
+
+        assert policy.delay(0, retry_after=4.0) == 4.0
+        assert policy.delay(0, retry_after=30.0) is None
+
+    def test_parse_retry_after(self):
+        in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+
+        assert RetryPolicy.parse_retry_after("5") == 5.0
+        assert 55 <= RetryPolicy.parse_retry_after(in_a_minute) <= 60
+        assert RetryPolicy.parse_retry_after("mañana") is None
+        assert RetryPolicy.parse_retry_after(None) is None
+
+    def test_retryable_statuses(self):
+        assert RetryPolicy.should_retry_status(429)
+        assert RetryPolicy.should_retry_status(503)
+        assert not RetryPolicy.should_retry_status(404)
+
+
+class TestTokenBucket:
+    def test_disabled_never_waits(self):
+        bucket = TokenBucket(rate=0)
+
+        assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+    def test_burst_then_spaced_requests(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=3)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_tokens_refill_over_time(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=1)
+        bucket.reserve()
+        clock.now += 0.5
+
+        assert bucket.reserve() == 0.0
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.is_open
+        assert not breaker.allow()
+        assert breaker.get_stats()["rejected"] == 1
+
+    def test_half_open_allows_a_single_trial(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        clock.now += 30
+
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+
+    def test_failed_trial_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        clock.now += 30
+        breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.is_open
+        assert breaker.get_stats()["opened"] == 2
+
+    def test_disabled_breaker_always_allows(self):
+        breaker = CircuitBreaker(failure_threshold=0)
+        for _ in range(10):
+            breaker.record_failure()
+
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,94 @@
+"""
+Tests del índice de búsqueda local (BM25)
+"""
+from src.models import Comment, ExtendedIssue, Issue
+from src.search import SearchIndex, tokenize
+
+
+def make_issue(number: int, summary: str, comments=None, updated: int = 1000) -> Issue:
+    return Issue(id=f"2-{number}", idReadable=f"DEMO-{number}", summary=summary,
+                 updated=str(updated), comments=comments)
+
+
+def test_tokenize_normalizes_case_and_accents():
+    assert tokenize("Exportación del INFORME a PDF, v2") == ["exportacion", "del", "informe", "pdf", "v2"]
+
+
+def test_summary_matches_rank_above_comment_matches():
+    index = SearchIndex()
+    index.add(make_issue(1, "Tarea sin relación", comments=[Comment("Ana", "falla el login", 1000)]))
+    index.add(make_issue(2, "Error en el login"))
+    index.add(make_issue(3, "Pantalla de informes"))
+
+    results = index.search("login")
+
+    assert [result.idReadable for result in results] == ["DEMO-2", "DEMO-1"]
+    assert results[0].matched_fields == ("título",)
+    assert results[1].matched_fields == ("comentarios",)
+
+
+def test_more_matching_terms_rank_higher():
+    index = SearchIndex()
+    index.add(make_issue(1, "Exportar datos"))
+    index.add(make_issue(2, "Exportar datos del informe"))
+
+    assert index.search("exportar informe")[0].idReadable == "DEMO-2"
+
+
+def test_exact_readable_id_comes_first():
+    index = SearchIndex()
+    index.add(make_issue(1, "Mencionado en demo"))
+    index.add(make_issue(7, "Otra tarea"))
+
+    results = index.search("demo-7")
+
+    assert results[0].idReadable == "DEMO-7"
+    assert results[0].matched_fields == ("ID",)
+
+
+def test_within_restricts_results():
+    index = SearchIndex()
+    index.add(make_issue(1, "Error en el login"))
+    index.add(make_issue(2, "Login lento"))
+
+    assert [result.id for result in index.search("login", within={"2-2"})] == ["2-2"]
+
+
+def test_reindexing_replaces_old_terms_and_keeps_missing_fields():
+    index = SearchIndex()
+    index.add(make_issue(1, "Error en el login", comments=[Comment("Ana", "revisar permisos", 1000)]))
+    detail = ExtendedIssue(id="2-1", idReadable="DEMO-1", summary="Error en la exportación",
+                           updated="2000", wikifiedDescription="<p>Falla el <b>despliegue</b></p>",
+                           loaded_sections=frozenset({"description"}))
+    index.add(detail)
+
+    assert index.search("login") == []
+    assert index.search("despliegue")[0].idReadable == "DEMO-1"
+    # Los comentarios del listado se conservan: el detalle no los traía
+    assert index.search("permisos")[0].idReadable == "DEMO-1"
+
+
+def test_unchanged_issue_is_not_reindexed():
+    index = SearchIndex()
+    index.add(make_issue(1, "Error en el login"))
+    index.add(make_issue(1, "Error en el login"))
+
+    assert index.stats["indexed"] == 1
+    assert index.stats["unchanged"] == 1
+
+
+def test_oldest_issues_are_evicted():
+    index = SearchIndex(max_documents=2)
+    for number in (1, 2, 3):
+        index.add(make_issue(number, f"Tarea login {number}"))
+
+    assert len(index) == 2
+    assert {result.idReadable for result in index.search("login")} == {"DEMO-2", "DEMO-3"}
+    assert index.get_stats()["evictions"] == 1
+
+
+def test_disabled_index_finds_nothing():
+    index = SearchIndex(max_documents=0)
+    index.add(make_issue(1, "Error en el login"))
+
+    assert index.search("login") == []
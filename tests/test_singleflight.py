@@ -0,0 +1,93 @@
+"""
+Tests de la agrupación de llamadas idénticas simultáneas
+"""
+import asyncio
+
+import pytest
+
+from src.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    executions = []
+
+    async def fetch(value):
+        executions.append(value)
+        await asyncio.sleep(0.01)
+        return {"value": value}
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("url", fetch, 1) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+
+    assert executions == [1]
+    assert all(result is results[0] for result in results)
+    assert flight.stats == {"calls": 5, "collapsed": 4}
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+
+    async def fetch(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    async def scenario():
+        return await asyncio.gather(flight.do("a", fetch, 1), flight.do("b", fetch, 2))
+
+    assert asyncio.run(scenario()) == [1, 2]
+    assert flight.stats["collapsed"] == 0
+
+
+def test_key_is_released_after_completion():
+    flight = SingleFlight()
+    executions = []
+
+    async def fetch():
+        executions.append(1)
+        return len(executions)
+
+    async def scenario():
+        first = await flight.do("url", fetch)
+        second = await flight.do("url", fetch)
+        return first, second
+
+    assert asyncio.run(scenario()) == (1, 2)
+    assert not flight._in_flight
+
+
+def test_errors_reach_every_caller():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("caído")
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("url", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.stats["collapsed"] == 2
+
+
+def test_cancelled_waiter_does_not_cancel_the_others():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def scenario():
+        first = asyncio.ensure_future(flight.do("url", fetch))
+        second = asyncio.ensure_future(flight.do("url", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "ok"
@@ -0,0 +1,93 @@
+"""
+Tests del endpoint de notificaciones de cambios (POST /webhooks/youtrack)
+"""
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src import server
+from src.config import YouTrackConfig
+
+
+class RecordingClient:
+    """Registra las invalidaciones pedidas por el endpoint"""
+
+    def __init__(self):
+        self.events = []
+
+    async def invalidate(self, issue_id=None, board_id=None, sprint_id=None):
+        self.events.append({"issue_id": issue_id, "board_id": board_id, "sprint_id": sprint_id})
+        return {"issues": int(issue_id is not None), "sprints": 0, "boards": 0}
+
+
+@pytest.fixture
+def webhook(monkeypatch):
+    monkeypatch.setenv("YOUTRACK_BASE_URL", "http://youtrack.test")
+    monkeypatch.setenv("YOUTRACK_API_TOKEN", "test")
+    recorder = RecordingClient()
+    monkeypatch.setattr(server, "config", YouTrackConfig(webhook_secret="secreto"))
+    monkeypatch.setattr(server, "client", recorder)
+    app = Starlette(routes=[Route(server.WEBHOOK_PATH, server.youtrack_webhook, methods=["POST"])])
+    with TestClient(app) as http:
+        yield http, recorder
+
+
+@pytest.mark.parametrize("headers", [
+    {"X-Webhook-Token": "secreto"},
+    {"Authorization": "Bearer secreto"},
+])
+def test_accepts_configured_token(webhook, headers):
+    http, recorder = webhook
+
+    response = http.post(server.WEBHOOK_PATH, json={"issueId": " DEMO-1 "}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"invalidated": [{"issues": 1, "sprints": 0, "boards": 0}]}
+    assert recorder.events == [{"issue_id": "DEMO-1", "board_id": None, "sprint_id": None}]
+
+
+@pytest.mark.parametrize("headers", [
+    {},
+    {"X-Webhook-Token": "otro"},
+    {"Authorization": "Basic secreto"},
+    {"X-Webhook-Token": "", "Authorization": "Bearer secreto"},
+])
+def test_rejects_missing_or_wrong_token(webhook, headers):
+    http, recorder = webhook
+
+    response = http.post(server.WEBHOOK_PATH, json={"issueId": "DEMO-1"}, headers=headers)
+
+    assert response.status_code == 401
+    assert recorder.events == []
+
+
+def test_without_secret_any_request_is_accepted(webhook, monkeypatch):
+    http, recorder = webhook
+    monkeypatch.setattr(server.config, "webhook_secret", None)
+
+    assert http.post(server.WEBHOOK_PATH, json=[{"boardId": "120-1"}, {"sprintId": "121-1"}]).status_code == 200
+    assert [event["board_id"] or event["sprint_id"] for event in recorder.events] == ["120-1", "121-1"]
+
+
+def test_rejects_invalid_body(webhook):
+    http, recorder = webhook
+    headers = {"X-Webhook-Token": "secreto"}
+
+    assert http.post(server.WEBHOOK_PATH, content=b"no es json", headers=headers).status_code == 400
+    response = http.post(server.WEBHOOK_PATH, json=[{"issueId": "DEMO-1"}, {}], headers=headers)
+    assert response.status_code == 400
+    assert "issueId" in response.json()["error"]
+    assert recorder.events == []
+
+
+@pytest.mark.parametrize("payload, error", [
+    ("DEMO-1", "objeto JSON"),
+    ({"issueId": 7}, "'issueId' debe ser un texto"),
+    ({"issueId": "  "}, "issueId, boardId o sprintId"),
+])
+def test_parse_webhook_events_errors(payload, error):
+    events, message = server._parse_webhook_events(payload)
+
+    assert events == []
+    assert error in message